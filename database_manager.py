@@ -26,7 +26,7 @@ from typing import Generator, Literal
 
 _UNSET = object()
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import case, create_engine, func, insert, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy import inspect, event
 from sqlalchemy.exc import ProgrammingError
@@ -34,6 +34,7 @@ from sqlalchemy.exc import ProgrammingError
 from models import Base, Matter, MatterShare, TimeEntry, User, UserMatterRate
 
 
+
 class DatabaseManager:
     """High-level database façade used by the UI.
 
@@ -68,6 +69,19 @@ class DatabaseManager:
             expire_on_commit=False,
         )
         self._setup_postgres_pool_checkout()
+        self._setup_sqlite_pragmas()
+        # Bumped whenever this manager writes matters or shares; keys the full-path cache.
+        self._matters_version = 0
+        self._full_paths_cache: dict[bool, tuple[int, list[tuple[int, str, bool]]]] = {}
+        # Bumped on every commit made through this manager; keys the time summary cache.
+        self._commit_version = 0
+        self._time_summary_cache: dict[tuple, tuple[int, list[tuple]]] = {}
+        self._setup_matters_version_tracking()
+
+    def invalidate_caches(self) -> None:
+        """Drop cached reads so the next call also sees changes made through other managers (other users)."""
+        self._full_paths_cache.clear()
+        self._time_summary_cache.clear()
 
     @property
     def current_user_id(self) -> int | None:
@@ -100,6 +114,44 @@ class DatabaseManager:
             except Exception:
                 pass
 
+    def _setup_sqlite_pragmas(self) -> None:
+        """Use WAL with synchronous=NORMAL on file-backed SQLite (no fsync per commit; still crash-safe).
+
+        Note: committed data may sit in the ``-wal`` file until a checkpoint; copy the
+        database only after ``PRAGMA wal_checkpoint(TRUNCATE)`` (or use the JSON backup).
+        """
+        if self._engine.dialect.name != "sqlite" or self._engine.url.database in (None, "", ":memory:"):
+            return
+
+        @event.listens_for(self._engine, "connect")
+        def _sqlite_connect(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.execute("PRAGMA mmap_size=268435456")
+            finally:
+                cursor.close()
+
+    def _setup_matters_version_tracking(self) -> None:
+        """Bump ``_matters_version`` on flushes touching Matter/MatterShare and on bulk UPDATE/DELETE."""
+
+        @event.listens_for(self._session_factory, "before_flush")
+        def _before_flush(session, flush_context, instances):
+            changed = (*session.new, *session.dirty, *session.deleted)
+            if any(isinstance(obj, (Matter, MatterShare)) for obj in changed):
+                self._matters_version += 1
+
+        @event.listens_for(self._session_factory, "do_orm_execute")
+        def _do_orm_execute(orm_execute_state):
+            if orm_execute_state.is_update or orm_execute_state.is_delete:
+                self._matters_version += 1
+
+        @event.listens_for(self._session_factory, "after_commit")
+        def _after_commit(session):
+            self._commit_version += 1
+
     @contextmanager
     def _session(self) -> Generator[Session, None, None]:
         """Yield a new session (context manager)."""
@@ -181,7 +233,7 @@ class DatabaseManager:
         """Return True if the current user is an admin."""
         if self._current_user_id is None:
             return False
-        user = session.query(User).filter(User.id == self._current_user_id).first()
+        user = session.get(User, self._current_user_id)
         return user is not None and bool(user.is_admin)
 
     def current_user_is_admin(self) -> bool:
@@ -220,11 +272,27 @@ class DatabaseManager:
                 if "budget_threshold" not in matter_cols:
                     conn.execute(text("ALTER TABLE matters ADD COLUMN budget_threshold REAL"))
                     conn.commit()
+                matter_indexes = [ix["name"] for ix in insp.get_indexes("matters")]
+                if "ix_matters_owner_name" not in matter_indexes:
+                    conn.execute(text("CREATE INDEX ix_matters_owner_name ON matters (owner_id, name)"))
+                    conn.commit()
+                if "ix_matters_owner_parent" not in matter_indexes:
+                    conn.execute(text("CREATE INDEX ix_matters_owner_parent ON matters (owner_id, parent_id)"))
+                    conn.commit()
             if "time_entries" in insp.get_table_names():
                 te_cols = [c["name"] for c in insp.get_columns("time_entries")]
                 if "activity_group_id" not in te_cols:
                     conn.execute(text("ALTER TABLE time_entries ADD COLUMN activity_group_id INTEGER REFERENCES time_entries(id)"))
                     conn.commit()
+                te_indexes = [ix["name"] for ix in insp.get_indexes("time_entries")]
+                if "ix_time_entries_owner_start" not in te_indexes:
+                    conn.execute(text("CREATE INDEX ix_time_entries_owner_start ON time_entries (owner_id, start_time)"))
+                    conn.commit()
+                if "ix_time_entries_matter_invoiced" not in te_indexes:
+                    conn.execute(
+                        text("CREATE INDEX ix_time_entries_matter_invoiced ON time_entries (matter_id, invoiced)")
+                    )
+                    conn.commit()
             if "matter_shares" not in insp.get_table_names():
                 conn.execute(text(
                     "CREATE TABLE matter_shares ("
@@ -641,16 +709,23 @@ class DatabaseManager:
         self._require_user()
         slug = self._slugify(name)
         with self._session() as session:
-            matters = self._matter_query(session).filter(
-                (Matter.matter_code == slug) | (Matter.matter_code.like(f"{slug}-%"))
-            ).all()
-            used = {m.matter_code for m in matters}
+            # Codes are unique per owner: filter on owner_id so uq_matter_owner_code is used as a
+            # range seek (shared matters of other owners cannot clash and are left out).
+            rows = (
+                session.query(Matter.matter_code)
+                .filter(
+                    Matter.owner_id == self._current_user_id,
+                    (Matter.matter_code == slug) | (Matter.matter_code.like(f"{slug}-%")),
+                )
+                .all()
+            )
+            used = {code for (code,) in rows}
         if slug not in used:
             return slug
-        n = 2
-        while f"{slug}-{n}" in used:
-            n += 1
-        return f"{slug}-{n}"
+        # One pass over the fetched codes: next suffix after the highest numeric one (slug itself counts as 1).
+        suffix_re = re.compile(rf"{re.escape(slug)}-(\d+)")
+        suffixes = (int(m.group(1)) for code in used if (m := suffix_re.fullmatch(code)))
+        return f"{slug}-{max(suffixes, default=1) + 1}"
 
     def add_matter(
         self,
@@ -710,13 +785,15 @@ class DatabaseManager:
             session.commit()
 
     def _build_full_paths_batch(
-        self, session: Session, matters: list[Matter], ancestor_query=None
+        self, session: Session, matters: list, ancestor_query=None
     ) -> dict[int, str]:
-        """Build full paths for all matters in-memory (no per-ancestor DB calls).
+        """Build full paths for all matters (Matter instances or id/parent_id/name rows) in-memory.
         If ancestor_query is provided, load missing ancestors (e.g. when visible matters
         are a subset and parents are owned by others, as with shared matters)."""
         by_id = {m.id: m for m in matters}
         if ancestor_query is not None:
+            # Ancestors only contribute id/parent/name, so skip building ORM instances for them.
+            ancestor_query = ancestor_query.with_entities(Matter.id, Matter.parent_id, Matter.name)
             missing = {m.parent_id for m in matters if m.parent_id is not None and m.parent_id not in by_id}
             while missing:
                 ancestors = ancestor_query.filter(Matter.id.in_(missing)).all()
@@ -727,19 +804,17 @@ class DatabaseManager:
                     break
                 missing = {a.parent_id for a in ancestors if a.parent_id and a.parent_id not in by_id}
         cache: dict[int, str] = {}
-
-        def path(m: Matter) -> str:
-            if m.id in cache:
-                return cache[m.id]
-            if m.parent_id is None:
-                cache[m.id] = m.name
-                return cache[m.id]
-            p = by_id.get(m.parent_id)
-            cache[m.id] = f"{path(p)} > {m.name}" if p else m.name
-            return cache[m.id]
-
         for m in matters:
-            path(m)
+            # Walk up to the first ancestor with a known path (or the top), then fill paths back down.
+            chain = []
+            node = m
+            while node is not None and node.id not in cache:
+                chain.append(node)
+                node = by_id.get(node.parent_id) if node.parent_id is not None else None
+            prefix = cache[node.id] if node is not None else None
+            for n in reversed(chain):
+                prefix = f"{prefix} > {n.name}" if prefix is not None else n.name
+                cache[n.id] = prefix
         return cache
 
     def get_matters_with_full_paths(
@@ -750,25 +825,53 @@ class DatabaseManager:
     ) -> list[tuple[int, str]]:
         """Return list of (matter_id, full_path) for dropdown.
         When for_timer=True, only matters with a parent (non-root) are returned.
-        When include_all_users=True and current user is admin, returns all users' matters (for Timesheet admin view)."""
+        When include_all_users=True and current user is admin, returns all users' matters (for Timesheet admin view).
+
+        Results are cached until this manager next writes a matter or share, or until
+        invalidate_caches() (called by the UI on refresh, so other users' changes show up)."""
+        self._require_user()
+        cached = self._full_paths_cache.get(include_all_users)
+        if cached is None or cached[0] != self._matters_version:
+            version = self._matters_version
+            with self._session() as session:
+                if (
+                    include_all_users
+                    and self._is_admin(session)
+                    and self._engine.dialect.name == "sqlite"
+                ):
+                    q = session.query(Matter).order_by(Matter.matter_code)
+                else:
+                    q = self._matter_query(session).order_by(Matter.matter_code)
+                # Paths need only id/parent/name: load plain rows, not Matter instances.
+                all_matters = q.with_entities(Matter.id, Matter.parent_id, Matter.name).all()
+                ancestor_q = session.query(Matter)
+                paths = self._build_full_paths_batch(session, all_matters, ancestor_q)
+                rows = [(m.id, paths[m.id], m.parent_id is None) for m in all_matters]
+            cached = (version, rows)
+            self._full_paths_cache[include_all_users] = cached
+        return [(mid, path) for mid, path, is_root in cached[1] if not (for_timer and is_root)]
+
+    def get_matters_with_full_paths_detailed(
+        self,
+    ) -> list[tuple[int, str, str, int, float | None]]:
+        """Return (matter_id, full_path, matter_code, owner_id, hourly_rate_euro) for every visible matter.
+        One session for what the Manage Matters tab used to load via get_all_matters + get_matters_with_full_paths."""
         self._require_user()
         with self._session() as session:
-            if (
-                include_all_users
-                and self._is_admin(session)
-                and self._engine.dialect.name == "sqlite"
-            ):
-                q = session.query(Matter).order_by(Matter.matter_code)
-            else:
-                q = self._matter_query(session).order_by(Matter.matter_code)
-            all_matters = q.all()
-            ancestor_q = session.query(Matter)
-            paths = self._build_full_paths_batch(session, all_matters, ancestor_q)
-            if for_timer:
-                matters = [m for m in all_matters if m.parent_id is not None]
-            else:
-                matters = all_matters
-            return [(m.id, paths[m.id]) for m in matters]
+            all_matters = (
+                self._matter_query(session)
+                .order_by(Matter.matter_code)
+                .with_entities(
+                    Matter.id, Matter.parent_id, Matter.name,
+                    Matter.matter_code, Matter.owner_id, Matter.hourly_rate_euro,
+                )
+                .all()
+            )
+            paths = self._build_full_paths_batch(session, all_matters, session.query(Matter))
+            return [
+                (m.id, paths[m.id], m.matter_code, m.owner_id, m.hourly_rate_euro)
+                for m in all_matters
+            ]
 
     def get_all_matters(self) -> list[Matter]:
         """Return all matters (for Manage Matters tab)."""
@@ -776,6 +879,12 @@ class DatabaseManager:
         with self._session() as session:
             return list(self._matter_query(session).order_by(Matter.matter_code).all())
 
+    def get_matter(self, matter_id: int) -> Matter | None:
+        """Return a single matter by id, or None if not found or not visible."""
+        self._require_user()
+        with self._session() as session:
+            return self._matter_query(session).filter(Matter.id == matter_id).first()
+
     def start_timer(
         self, matter_id: int, description: str | None = None
     ) -> TimeEntry:
@@ -783,7 +892,13 @@ class DatabaseManager:
         Raises ValueError if matter is a root (client)."""
         self._require_user()
         with self._session() as session:
-            matter = self._matter_query(session).filter(Matter.id == matter_id).first()
+            # Only parent_id is needed to validate the target; no Matter instance.
+            matter = (
+                self._matter_query(session)
+                .with_entities(Matter.parent_id)
+                .filter(Matter.id == matter_id)
+                .first()
+            )
             if matter is None:
                 raise ValueError("Matter not found.")
             if matter.parent_id is None:
@@ -796,9 +911,8 @@ class DatabaseManager:
                 description=description or "",
             )
             session.add(entry)
+            # All TimeEntry defaults are client-side, so the flushed entry is already complete: no refresh.
             session.commit()
-            if self._engine.dialect.name != "postgresql":
-                session.refresh(entry)
             return entry
 
     def stop_timer(self) -> TimeEntry | None:
@@ -895,14 +1009,18 @@ class DatabaseManager:
             session.commit()
             return True
 
-    def get_time_entries_by_matter(self, matter_id: int) -> list[TimeEntry]:
-        """Return all time entries for the matter, newest first."""
+    def get_time_entries_by_matter(
+        self, matter_id: int, *, limit: int | None = None, offset: int = 0
+    ) -> list[TimeEntry]:
+        """Return time entries for the matter, newest first; ``limit``/``offset`` select one page."""
         self._require_user()
         with self._session() as session:
             return list(
                 self._time_entry_query(session)
                 .filter(TimeEntry.matter_id == matter_id)
-                .order_by(TimeEntry.start_time.desc())
+                .order_by(TimeEntry.start_time.desc(), TimeEntry.id.desc())
+                .offset(offset)
+                .limit(limit)
                 .all()
             )
 
@@ -910,8 +1028,9 @@ class DatabaseManager:
         """Return time entries whose start_time falls on the given day (including running). Chronological order."""
         self._require_user()
         with self._session() as session:
+            # Half-open range on start_time so the (owner_id, start_time) index is used.
             start_dt = datetime.combine(day, datetime.min.time())
-            end_dt = datetime.combine(day, datetime.max.time()) + timedelta(seconds=1)
+            end_dt = start_dt + timedelta(days=1)
             return list(
                 self._time_entry_query(session)
                 .filter(TimeEntry.start_time >= start_dt, TimeEntry.start_time < end_dt)
@@ -969,6 +1088,14 @@ class DatabaseManager:
         ``include_all_users=True`` and the current user is admin on SQLite, the
         search runs across all users' matters.
         """
+        children = self.get_matter_children_map(include_all_users=include_all_users)
+        return self.descendant_ids_from_children(children, matter_id)
+
+    def get_matter_children_map(self, *, include_all_users: bool = False) -> dict[int, list[int]]:
+        """Return {parent_id: [child ids]} for visible matters in one query.
+
+        Same visibility as get_descendant_matter_ids; roots are not keys unless they have children.
+        """
         self._require_user()
         with self._session() as session:
             if (
@@ -976,14 +1103,28 @@ class DatabaseManager:
                 and self._is_admin(session)
                 and self._engine.dialect.name == "sqlite"
             ):
-                base_q = session.query(Matter)
+                base_q = session.query(Matter.id, Matter.parent_id)
             else:
-                base_q = self._matter_query(session)
-            child_matters = base_q.filter(Matter.parent_id == matter_id).all()
-        child_ids = {m.id for m in child_matters}
-        ids = set(child_ids)
-        for cid in child_ids:
-            ids |= self.get_descendant_matter_ids(cid, include_all_users=include_all_users)
+                base_q = self._matter_query(session).with_entities(Matter.id, Matter.parent_id)
+            rows = base_q.filter(Matter.parent_id.isnot(None)).all()
+        children: dict[int, list[int]] = {}
+        for mid, parent_id in rows:
+            kids = children.get(parent_id)
+            if kids is None:
+                kids = children[parent_id] = []
+            kids.append(mid)
+        return children
+
+    @staticmethod
+    def descendant_ids_from_children(children: dict[int, list[int]], matter_id: int) -> set[int]:
+        """Walk a get_matter_children_map result and return all descendants of matter_id."""
+        ids: set[int] = set()
+        stack = list(children.get(matter_id, ()))
+        while stack:
+            mid = stack.pop()
+            if mid not in ids:
+                ids.add(mid)
+                stack.extend(children.get(mid, ()))
         return ids
 
     def get_time_entries_for_export(
@@ -1189,60 +1330,61 @@ class DatabaseManager:
             session.query(Matter).delete(synchronize_session=False)
             session.query(User).delete(synchronize_session=False)
             session.flush()
-            # Insert preserving IDs
-            for row in data["users"]:
-                session.add(
-                    User(
-                        id=row["id"],
-                        username=row["username"],
-                        password_hash=row.get("password_hash"),
-                        is_admin=bool(row.get("is_admin", False)),
-                        default_hourly_rate_euro=row.get("default_hourly_rate_euro"),
-                    )
-                )
-            session.flush()
-            for row in data["matters"]:
-                session.add(
-                    Matter(
-                        id=row["id"],
-                        owner_id=row["owner_id"],
-                        matter_code=row["matter_code"],
-                        name=row["name"],
-                        parent_id=row.get("parent_id"),
-                        hourly_rate_euro=row.get("hourly_rate_euro"),
-                        budget_eur=row.get("budget_eur"),
-                        budget_threshold=row.get("budget_threshold"),
-                    )
-                )
-            session.flush()
-            for row in data.get("matter_shares", []):
-                session.add(MatterShare(matter_id=row["matter_id"], user_id=row["user_id"]))
-            session.flush()
-            for row in data.get("user_matter_rates", []):
-                session.add(
-                    UserMatterRate(
-                        user_id=row["user_id"],
-                        matter_id=row["matter_id"],
-                        hourly_rate_euro=float(row["hourly_rate_euro"]),
-                    )
-                )
-            session.flush()
-            for row in data["time_entries"]:
-                start_time = datetime.fromisoformat(row["start_time"]) if row.get("start_time") else None
-                end_time = datetime.fromisoformat(row["end_time"]) if row.get("end_time") else None
-                session.add(
-                    TimeEntry(
-                        id=row["id"],
-                        owner_id=row["owner_id"],
-                        matter_id=row["matter_id"],
-                        description=row.get("description") or "",
-                        start_time=start_time,
-                        end_time=end_time,
-                        duration_seconds=float(row.get("duration_seconds", 0) or 0),
-                        invoiced=bool(row.get("invoiced", False)),
-                        activity_group_id=row.get("activity_group_id"),
-                    )
-                )
+            # Insert preserving IDs: one executemany per table, no ORM instances per row.
+            tables = (
+                (User, [
+                    {
+                        "id": row["id"],
+                        "username": row["username"],
+                        "password_hash": row.get("password_hash"),
+                        "is_admin": bool(row.get("is_admin", False)),
+                        "default_hourly_rate_euro": row.get("default_hourly_rate_euro"),
+                    }
+                    for row in data["users"]
+                ]),
+                (Matter, [
+                    {
+                        "id": row["id"],
+                        "owner_id": row["owner_id"],
+                        "matter_code": row["matter_code"],
+                        "name": row["name"],
+                        "parent_id": row.get("parent_id"),
+                        "hourly_rate_euro": row.get("hourly_rate_euro"),
+                        "budget_eur": row.get("budget_eur"),
+                        "budget_threshold": row.get("budget_threshold"),
+                    }
+                    for row in data["matters"]
+                ]),
+                (MatterShare, [
+                    {"matter_id": row["matter_id"], "user_id": row["user_id"]}
+                    for row in data.get("matter_shares", [])
+                ]),
+                (UserMatterRate, [
+                    {
+                        "user_id": row["user_id"],
+                        "matter_id": row["matter_id"],
+                        "hourly_rate_euro": float(row["hourly_rate_euro"]),
+                    }
+                    for row in data.get("user_matter_rates", [])
+                ]),
+                (TimeEntry, [
+                    {
+                        "id": row["id"],
+                        "owner_id": row["owner_id"],
+                        "matter_id": row["matter_id"],
+                        "description": row.get("description") or "",
+                        "start_time": datetime.fromisoformat(row["start_time"]) if row.get("start_time") else None,
+                        "end_time": datetime.fromisoformat(row["end_time"]) if row.get("end_time") else None,
+                        "duration_seconds": float(row.get("duration_seconds", 0) or 0),
+                        "invoiced": bool(row.get("invoiced", False)),
+                        "activity_group_id": row.get("activity_group_id"),
+                    }
+                    for row in data["time_entries"]
+                ]),
+            )
+            for model, rows in tables:
+                if rows:
+                    session.execute(insert(model), rows)
             session.commit()
         # Reset Postgres sequences so next auto-insert gets a valid id
         if self._engine.dialect.name == "postgresql":
@@ -1432,20 +1574,19 @@ class DatabaseManager:
         effective_budget = minimum of this matter's budget and all ancestor budgets.
         budget_in_path = full path of the matter where the effective budget is set (e.g. "Client A" or "Client A > Project X").
         """
-        candidates: list[tuple[float, str]] = []
+        candidates: list[tuple[float, Matter]] = []
         current = matter
         while current is not None:
             b = getattr(current, "budget_eur", None)
             if b is not None and b > 0:
-                path = current.get_full_path(session)
-                candidates.append((float(b), path))
+                candidates.append((float(b), current))
             if current.parent_id is None:
                 break
             current = mq.filter(Matter.id == current.parent_id).first()
         if not candidates:
             return (None, None)
-        best = min(candidates, key=lambda x: x[0])
-        return (best[0], best[1])
+        best_budget, best_matter = min(candidates, key=lambda x: x[0])
+        return (best_budget, best_matter.get_full_path(session))
 
     def _effective_budget_for_matter_with_map(
         self, matter: Matter, matter_by_id: dict[int, Matter], paths: dict[int, str]
@@ -1619,7 +1760,7 @@ class DatabaseManager:
     ) -> tuple[float, Literal["user_matter", "matter", "upper_matter", "user"]]:
         """Resolve rate: user_matter_rates (per-user per-matter) first, then matter/parent chain, then user default."""
         if matter is None:
-            user = session.query(User).filter(User.id == owner_id).first()
+            user = session.get(User, owner_id)
             default = (
                 getattr(user, "default_hourly_rate_euro", None) if user else None
             )
@@ -1649,7 +1790,7 @@ class DatabaseManager:
         rate = getattr(current, "hourly_rate_euro", None)
         if rate is not None:
             return (float(rate), "upper_matter")
-        user = session.query(User).filter(User.id == owner_id).first()
+        user = session.get(User, owner_id)
         default = (
             getattr(user, "default_hourly_rate_euro", None) if user else None
         )
@@ -1678,7 +1819,7 @@ class DatabaseManager:
         self._require_user()
         with self._session() as session:
             q = self._matter_query(session).order_by(Matter.matter_code)
-            all_matters = q.all()
+            all_matters = q.with_entities(Matter.id, Matter.parent_id, Matter.name).all()
             paths = self._build_full_paths_batch(session, all_matters, session.query(Matter))
             if for_timer:
                 matters = [m for m in all_matters if m.parent_id is not None]
@@ -1756,81 +1897,125 @@ class DatabaseManager:
         """Merge another user's matter (source) into current user's matter (target). Used when resolving same-name conflict before share. Target must be owned by current user."""
         self._require_user()
         with self._session() as session:
-            target = self._matter_query(session).filter(
-                Matter.id == target_matter_id
-            ).first()
-            if target is None or target.owner_id != self._current_user_id:
-                raise ValueError("Target matter not found or not owned by you.")
-            if self._engine.dialect.name == "postgresql":
-                try:
-                    row = session.execute(
-                        text(
-                            "SELECT app.merge_other_matter_into(:caller_id, :src_id, :tgt_id)"
-                        ),
-                        {
-                            "caller_id": self._current_user_id,
-                            "src_id": source_matter_id,
-                            "tgt_id": target_matter_id,
-                        },
-                    ).fetchone()
-                except ProgrammingError as exc:
-                    if "merge_other_matter_into" not in str(exc):
-                        raise
-                    session.rollback()
-                    raise RuntimeError(
-                        "PostgreSQL function app.merge_other_matter_into is missing. "
-                        "Re-run scripts/postgres_bootstrap_login.sql as a superuser."
-                    ) from exc
-                if row and row[0] is not None:
-                    raise ValueError(row[0])
-                session.commit()
-                return
-            source = (
-                session.query(Matter).filter(Matter.id == source_matter_id).first()
+            self._merge_other_user_matter_into_mine(session, source_matter_id, target_matter_id)
+            session.commit()
+
+    def _merge_other_user_matter_into_mine(
+        self, session: Session, source_matter_id: int, target_matter_id: int
+    ) -> None:
+        """Body of merge_other_user_matter_into_mine, run inside the caller's session (no commit)."""
+        target = self._matter_query(session).filter(
+            Matter.id == target_matter_id
+        ).first()
+        if target is None or target.owner_id != self._current_user_id:
+            raise ValueError("Target matter not found or not owned by you.")
+        if self._engine.dialect.name == "postgresql":
+            try:
+                row = session.execute(
+                    text(
+                        "SELECT app.merge_other_matter_into(:caller_id, :src_id, :tgt_id)"
+                    ),
+                    {
+                        "caller_id": self._current_user_id,
+                        "src_id": source_matter_id,
+                        "tgt_id": target_matter_id,
+                    },
+                ).fetchone()
+            except ProgrammingError as exc:
+                if "merge_other_matter_into" not in str(exc):
+                    raise
+                session.rollback()
+                raise RuntimeError(
+                    "PostgreSQL function app.merge_other_matter_into is missing. "
+                    "Re-run scripts/postgres_bootstrap_login.sql as a superuser."
+                ) from exc
+            if row and row[0] is not None:
+                raise ValueError(row[0])
+            # Raw SQL bypasses the flush/ORM-execute hooks: invalidate the path cache explicitly.
+            self._matters_version += 1
+            return
+        source = session.get(Matter, source_matter_id)
+        if source is None:
+            raise ValueError("Source matter not found.")
+        if source_matter_id == target_matter_id:
+            raise ValueError("Cannot merge a matter into itself.")
+        if self._is_descendant_of(session, target_matter_id, source_matter_id):
+            raise ValueError(
+                "Cannot merge into a descendant of the source matter."
             )
-            if source is None:
-                raise ValueError("Source matter not found.")
-            if source_matter_id == target_matter_id:
-                raise ValueError("Cannot merge a matter into itself.")
-            if self._is_descendant_of(session, target_matter_id, source_matter_id):
-                raise ValueError(
-                    "Cannot merge into a descendant of the source matter."
-                )
-            session.query(TimeEntry).filter(
-                TimeEntry.matter_id == source_matter_id
-            ).update({"matter_id": target_matter_id})
-            session.query(Matter).filter(
-                Matter.parent_id == source_matter_id
-            ).update({"parent_id": target_matter_id})
-            session.query(MatterShare).filter(
-                MatterShare.matter_id == source_matter_id
-            ).delete()
-            session.query(UserMatterRate).filter(
-                UserMatterRate.matter_id == source_matter_id
-            ).delete()
-            session.delete(source)
+        session.query(TimeEntry).filter(
+            TimeEntry.matter_id == source_matter_id
+        ).update({"matter_id": target_matter_id})
+        session.query(Matter).filter(
+            Matter.parent_id == source_matter_id
+        ).update({"parent_id": target_matter_id})
+        session.query(MatterShare).filter(
+            MatterShare.matter_id == source_matter_id
+        ).delete()
+        session.query(UserMatterRate).filter(
+            UserMatterRate.matter_id == source_matter_id
+        ).delete()
+        session.delete(source)
+
+    def merge_and_share_matter(
+        self, source_matter_id: int, target_matter_id: int, user_id: int
+    ) -> None:
+        """Merge another user's matter into mine and share mine with that user in one transaction.
+
+        Resolves a same-path share conflict; on any error nothing is written.
+        """
+        self._require_user()
+        with self._session() as session:
+            self._merge_other_user_matter_into_mine(session, source_matter_id, target_matter_id)
+            self._add_matter_share(session, target_matter_id, user_id)
             session.commit()
 
     def add_matter_share(self, matter_id: int, user_id: int) -> None:
         """Share a matter with a user. Caller must be the matter owner. Idempotent if already shared."""
         self._require_user()
         with self._session() as session:
-            matter = self._matter_query(session).filter(Matter.id == matter_id).first()
-            if matter is None:
-                raise ValueError("Matter not found.")
-            if matter.owner_id != self._current_user_id:
-                raise ValueError("Only the matter owner can share it.")
-            if user_id == self._current_user_id:
-                raise ValueError("Cannot share with yourself.")
-            existing = (
-                session.query(MatterShare)
-                .filter(MatterShare.matter_id == matter_id, MatterShare.user_id == user_id)
-                .first()
-            )
-            if existing:
-                return
+            self._add_matter_share(session, matter_id, user_id)
+            session.commit()
+
+    def _shareable_matter(self, session: Session, matter_id: int, user_id: int) -> Matter:
+        """Return the matter if the current user may share it with user_id; raise ValueError otherwise."""
+        matter = self._matter_query(session).filter(Matter.id == matter_id).first()
+        if matter is None:
+            raise ValueError("Matter not found.")
+        if matter.owner_id != self._current_user_id:
+            raise ValueError("Only the matter owner can share it.")
+        if user_id == self._current_user_id:
+            raise ValueError("Cannot share with yourself.")
+        return matter
+
+    def _add_matter_share(self, session: Session, matter_id: int, user_id: int) -> None:
+        """Body of add_matter_share, run inside the caller's session (no commit)."""
+        self._shareable_matter(session, matter_id, user_id)
+        existing = (
+            session.query(MatterShare)
+            .filter(MatterShare.matter_id == matter_id, MatterShare.user_id == user_id)
+            .first()
+        )
+        if existing is None:
             session.add(MatterShare(matter_id=matter_id, user_id=user_id))
+
+    def try_share_matter(self, matter_id: int, user_id: int) -> tuple[int, str] | None:
+        """Share a matter unless the user owns a matter with the same full path, in one session.
+
+        Returns None once shared (idempotent like add_matter_share). On a same-path
+        conflict nothing is written and (their_matter_id, their_username) is returned.
+        """
+        self._require_user()
+        with self._session() as session:
+            matter = self._shareable_matter(session, matter_id, user_id)
+            full_path = self._build_full_paths_batch(session, [matter], session.query(Matter))[matter.id]
+            conflict = self._find_owned_matter_with_same_path(session, user_id, full_path)
+            if conflict is not None:
+                username = session.query(User.username).filter(User.id == user_id).scalar()
+                return (conflict[0], username or str(user_id))
+            self._add_matter_share(session, matter_id, user_id)
             session.commit()
+            return None
 
     def remove_matter_share(self, matter_id: int, user_id: int) -> None:
         """Remove a user from matter share. Caller must be the matter owner."""
@@ -1875,7 +2060,7 @@ class DatabaseManager:
             if matter is None:
                 raise ValueError("Matter not found.")
             result: list[tuple[int, str, float | None]] = []
-            owner = session.query(User).filter(User.id == matter.owner_id).first()
+            owner = session.get(User, matter.owner_id)
             if owner:
                 umr = (
                     session.query(UserMatterRate)
@@ -1931,6 +2116,18 @@ class DatabaseManager:
             users = session.query(User).filter(User.id != self._current_user_id).order_by(User.username).all()
             return [(u.id, u.username) for u in users]
 
+    def get_user_matter_rate(self, user_id: int, matter_id: int) -> float | None:
+        """Return the per-user rate for a matter, or None if unset. Caller must have access to the matter."""
+        self._require_user()
+        with self._session() as session:
+            if self._matter_query(session).filter(Matter.id == matter_id).first() is None:
+                raise ValueError("Matter not found.")
+            return (
+                session.query(UserMatterRate.hourly_rate_euro)
+                .filter(UserMatterRate.user_id == user_id, UserMatterRate.matter_id == matter_id)
+                .scalar()
+            )
+
     def set_user_matter_rate(
         self,
         user_id: int,
@@ -1976,89 +2173,83 @@ class DatabaseManager:
         """If the given user (by id) owns a matter whose full path equals full_path, return (matter_id, path); else None. Used for same-name conflict when sharing."""
         self._require_user()
         with self._session() as session:
-            if self._engine.dialect.name == "postgresql":
-                try:
-                    rows = session.execute(
-                        text("SELECT matter_id, path FROM app.get_owned_matter_paths(:uid)"),
-                        {"uid": user_id},
-                    ).fetchall()
-                except ProgrammingError as exc:
-                    # Older Postgres deployments may not have app.get_owned_matter_paths yet.
-                    # If some other error occurs, re-raise it.
-                    if "get_owned_matter_paths" not in str(exc):
-                        raise
-                    # Clear failed transaction before falling back to ORM-based lookup.
-                    session.rollback()
-                    rows = []
-                for r in rows:
-                    if r[1] == full_path:
-                        return (r[0], r[1])
-                # If function is missing or no match found, fall back to ORM path computation below.
-            matters = (
-                session.query(Matter).filter(Matter.owner_id == user_id).all()
-            )
-            paths = self._build_full_paths_batch(session, matters, session.query(Matter))
-            for m in matters:
-                path = paths[m.id]
-                if path == full_path:
-                    return (m.id, path)
+            return self._find_owned_matter_with_same_path(session, user_id, full_path)
+
+    def _find_owned_matter_with_same_path(
+        self, session: Session, user_id: int, full_path: str
+    ) -> tuple[int, str] | None:
+        """Body of find_owned_matter_with_same_path, run inside the caller's session."""
+        if self._engine.dialect.name == "postgresql":
+            try:
+                rows = session.execute(
+                    text("SELECT matter_id, path FROM app.get_owned_matter_paths(:uid)"),
+                    {"uid": user_id},
+                ).fetchall()
+            except ProgrammingError as exc:
+                # Older Postgres deployments may not have app.get_owned_matter_paths yet.
+                # If some other error occurs, re-raise it.
+                if "get_owned_matter_paths" not in str(exc):
+                    raise
+                # Clear failed transaction before falling back to ORM-based lookup.
+                session.rollback()
+                rows = []
+            for r in rows:
+                if r[1] == full_path:
+                    return (r[0], r[1])
+            # If function is missing or no match found, fall back to ORM path computation below.
+        # Only matters whose name is a trailing segment run of full_path can match.
+        parts = full_path.split(" > ")
+        leaf_names = {" > ".join(parts[i:]) for i in range(len(parts))}
+        matters = (
+            session.query(Matter)
+            .filter(Matter.owner_id == user_id, Matter.name.in_(leaf_names))
+            .all()
+        )
+        if not matters:
             return None
+        paths = self._build_full_paths_batch(session, matters, session.query(Matter))
+        for m in matters:
+            path = paths[m.id]
+            if path == full_path:
+                return (m.id, path)
+        return None
 
     def get_time_by_client_and_matter(
         self,
         date_from: date | None = None,
         date_to: date | None = None,
     ) -> list[tuple[str, str, float]]:
-        """Return aggregated time by client and matter (full path). Sorted by client then matter."""
-        self._require_user()
-        with self._session() as session:
-            q = self._time_entry_query(session).filter(
-                TimeEntry.end_time.isnot(None)
-            )
-            if date_from is not None:
-                start_dt = datetime.combine(date_from, datetime.min.time())
-                q = q.filter(TimeEntry.start_time >= start_dt)
-            if date_to is not None:
-                end_dt = datetime.combine(date_to, datetime.max.time())
-                q = q.filter(TimeEntry.start_time <= end_dt)
-            entries = q.all()
-            matter_ids = list({e.matter_id for e in entries})
-            if not matter_ids:
-                return []
-            mq = self._matter_query(session)
-            matters = mq.filter(Matter.id.in_(matter_ids)).all()
-            matter_by_id = {m.id: m for m in matters}
-            missing = {m.parent_id for m in matters if m.parent_id and m.parent_id not in matter_by_id}
-            while missing:
-                ancestors = session.query(Matter).filter(Matter.id.in_(missing)).all()
-                for a in ancestors:
-                    matter_by_id[a.id] = a
-                    missing.discard(a.id)
-                if not ancestors:
-                    break
-                missing = {a.parent_id for a in ancestors if a.parent_id and a.parent_id not in matter_by_id}
-            all_matters = list(matter_by_id.values())
-            paths = self._build_full_paths_batch(session, all_matters, session.query(Matter))
-            agg: dict[tuple[str, str], float] = {}
-            for entry in entries:
-                matter = matter_by_id.get(entry.matter_id)
-                if matter is None:
-                    continue
-                client_name = self._get_root_matter_name_with_map(matter, matter_by_id)
-                full_path = paths.get(entry.matter_id, matter.name)
-                key = (client_name, full_path)
-                agg[key] = agg.get(key, 0.0) + (entry.duration_seconds or 0.0)
-            result = [(client, path, total) for (client, path), total in agg.items()]
-            result.sort(key=lambda r: (r[0], r[1]))
-            return result
+        """Return aggregated time by client and matter (full path). Sorted by client then matter.
+
+        Projection of get_time_by_client_and_matter_detailed (shares its cache and aggregation)."""
+        return [
+            (client, path, total_sec)
+            for client, path, total_sec, *_ in self.get_time_by_client_and_matter_detailed(date_from, date_to)
+        ]
 
     def get_time_by_client_and_matter_detailed(
         self,
         date_from: date | None = None,
         date_to: date | None = None,
     ) -> list[tuple[str, str, float, float, float, float, Literal["user_matter", "matter", "upper_matter", "user"]]]:
-        """Returns (client, matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_invoiced_amount_eur, rate_source)."""
+        """Returns (client, matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_invoiced_amount_eur, rate_source).
+
+        Results are cached until this manager next commits a write, or until
+        invalidate_caches() (called by the UI on refresh, so other users' time shows up)."""
         self._require_user()
+        key = (date_from, date_to)
+        cached = self._time_summary_cache.get(key)
+        if cached is None or cached[0] != self._commit_version:
+            version = self._commit_version
+            rows = self._time_by_client_and_matter_detailed(date_from, date_to)
+            cached = (version, rows)
+            self._time_summary_cache[key] = cached
+        return list(cached[1])
+
+    def _time_by_client_and_matter_detailed(
+        self, date_from: date | None, date_to: date | None
+    ) -> list[tuple[str, str, float, float, float, float, str]]:
+        """Uncached body of get_time_by_client_and_matter_detailed."""
         with self._session() as session:
             q = self._time_entry_query(session).filter(
                 TimeEntry.end_time.isnot(None)
@@ -2069,8 +2260,18 @@ class DatabaseManager:
             if date_to is not None:
                 end_dt = datetime.combine(date_to, datetime.max.time())
                 q = q.filter(TimeEntry.start_time <= end_dt)
-            entries = q.all()
-            matter_ids = list({e.matter_id for e in entries})
+            # One GROUP BY for both totals: per-matter sums, no TimeEntry instances.
+            duration = func.coalesce(TimeEntry.duration_seconds, 0.0)
+            sums = (
+                q.with_entities(
+                    TimeEntry.matter_id,
+                    func.sum(duration),
+                    func.sum(case((TimeEntry.invoiced == False, duration), else_=0.0)),
+                )
+                .group_by(TimeEntry.matter_id)
+                .all()
+            )
+            matter_ids = [mid for mid, _, _ in sums]
             if not matter_ids:
                 return []
             mq = self._matter_query(session)
@@ -2090,18 +2291,17 @@ class DatabaseManager:
             agg_total: dict[tuple[str, str], float] = {}
             agg_not_invoiced: dict[tuple[str, str], float] = {}
             matter_id_by_key: dict[tuple[str, str], int] = {}
-            for entry in entries:
-                matter = matter_by_id.get(entry.matter_id)
+            for mid, total_sec, not_inv_sec in sums:
+                matter = matter_by_id.get(mid)
                 if matter is None:
                     continue
                 client_name = self._get_root_matter_name_with_map(matter, matter_by_id)
-                full_path = paths.get(entry.matter_id, matter.name)
+                full_path = paths.get(mid, matter.name)
                 key = (client_name, full_path)
                 matter_id_by_key[key] = matter.id
-                sec = entry.duration_seconds or 0.0
-                agg_total[key] = agg_total.get(key, 0.0) + sec
-                if not entry.invoiced:
-                    agg_not_invoiced[key] = agg_not_invoiced.get(key, 0.0) + sec
+                agg_total[key] = agg_total.get(key, 0.0) + float(total_sec or 0.0)
+                if not_inv_sec:
+                    agg_not_invoiced[key] = agg_not_invoiced.get(key, 0.0) + float(not_inv_sec)
             rate_cache: dict[int, tuple[float, str]] = {}
             result = []
             for (client, path) in agg_total:
@@ -2152,6 +2352,25 @@ class DatabaseManager:
                 return (user.id, user.password_hash)
             return None
 
+    def upgrade_login_password_hash(self, user_id: int, password_hash: str) -> None:
+        """
+        Replace a user's password hash right after a successful login (e.g. bcrypt cost upgrade).
+        Works without current_user_id, like get_login_credentials. Postgres: app.update_user() as self.
+        """
+        with self._session() as session:
+            if self._engine.dialect.name == "postgresql":
+                session.execute(
+                    text("SELECT app.update_user(:u, :u, NULL, :h)"),
+                    {"u": user_id, "h": password_hash},
+                )
+                session.commit()
+                return
+            user = session.get(User, user_id)
+            if user is None:
+                raise ValueError("User not found.")
+            user.password_hash = password_hash
+            session.commit()
+
     def get_user(self, user_id: int) -> User | None:
         """Return User by id (current user can read self; admin can read any)."""
         self._require_user()
@@ -2171,7 +2390,7 @@ class DatabaseManager:
                     default_hourly_rate_euro=row[4],
                 )
         with self._session() as session:
-            return session.query(User).filter(User.id == user_id).first()
+            return session.get(User, user_id)
 
     def get_current_user_is_admin(self) -> bool:
         """Return whether the current user is admin. On Postgres uses SECURITY DEFINER so it works regardless of RLS."""
@@ -2285,7 +2504,7 @@ class DatabaseManager:
                 session.commit()
             return
         with self._session() as session:
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
             if user is None:
                 raise ValueError("User not found.")
             if self._engine.dialect.name == "sqlite":
@@ -2320,6 +2539,8 @@ class DatabaseManager:
                     {"caller_id": self._current_user_id, "user_id": user_id},
                 )
                 session.commit()
+            # The user's matters and shares go with them via FK cascade, unseen by the ORM hooks.
+            self._matters_version += 1
             return
         with self._session() as session:
             if self._engine.dialect.name == "sqlite":
@@ -2330,11 +2551,12 @@ class DatabaseManager:
                 )
                 if not admin:
                     raise ValueError("Only admin can delete users.")
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
             if user is None:
                 raise ValueError("User not found.")
             session.delete(user)
             session.commit()
+        self._matters_version += 1
 
 
 # Default instance for use by the app (no user; for login only)
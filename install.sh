@@ -165,7 +165,7 @@ echo "Installing Sentinel Solo to $DEST_DIR ..."
 # Copy app files (no venv, no __pycache__, no .git, no sentinel.db)
 # Prefer rsync; fallback: copy essential files only.
 rsync -a --exclude='venv' --exclude='.venv' --exclude='__pycache__' \
-      --exclude='.git' --exclude='sentinel.db' --exclude='*.pyc' --exclude='.cursor' \
+      --exclude='.git' --exclude='sentinel.db*' --exclude='*.pyc' --exclude='.cursor' \
       "$SRC_DIR/" "$DEST_DIR/" 2>/dev/null || {
     for f in main.py database_manager.py models.py requirements.txt run.sh README.md install.sh uninstall.sh; do
         [[ -f "$SRC_DIR/$f" ]] && cp "$SRC_DIR/$f" "$DEST_DIR/"
@@ -6,9 +6,15 @@ import asyncio
 import json
 import logging
 import os
-from collections import defaultdict
+import sys
+import threading
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from itertools import groupby, islice
+from operator import itemgetter
 from pathlib import Path
+from time import monotonic
 from typing import Callable
 
 import flet as ft
@@ -17,7 +23,7 @@ import bcrypt
 from sqlalchemy.exc import IntegrityError, OperationalError
 
 from database_manager import DatabaseManager, db
-from utils import picker_value_to_local_date
+from utils import parse_amount, picker_value_to_local_date
 
 # Module-specific logger for Sentinel Solo
 logger = logging.getLogger(__name__)
@@ -33,6 +39,28 @@ if os.environ.get("SENTINEL_DEBUG", "").lower() in ("1", "true", "yes"):
 
 __version__ = "v0.4.2"
 
+# bcrypt work factor for user passwords (library default is 12; 10 is ample for a local install).
+_DEFAULT_BCRYPT_COST = 10
+
+
+def _bcrypt_cost_from_env() -> int:
+    """Read SENTINEL_BCRYPT_COST, falling back to the default if invalid and clamping to bcrypt's 4..31."""
+    raw = os.environ.get("SENTINEL_BCRYPT_COST", "").strip()
+    if not raw:
+        return _DEFAULT_BCRYPT_COST
+    try:
+        cost = int(raw)
+    except ValueError:
+        logger.warning("Ignoring non-integer SENTINEL_BCRYPT_COST=%r; using %d", raw, _DEFAULT_BCRYPT_COST)
+        return _DEFAULT_BCRYPT_COST
+    clamped = min(max(cost, 4), 31)
+    if clamped != cost:
+        logger.warning("SENTINEL_BCRYPT_COST=%d out of range 4..31; using %d", cost, clamped)
+    return clamped
+
+
+BCRYPT_COST = _bcrypt_cost_from_env()
+
 # Storage keys for persisted login (optional restore)
 STORAGE_USER_ID = "user_id"
 STORAGE_USERNAME = "username"
@@ -40,6 +68,36 @@ STORAGE_USERNAME = "username"
 DATETIME_FMT = "%Y-%m-%d %H:%M"
 TIME_FMT = "%H:%M"
 
+# Search results rendered in the Timer matter picker; beyond this the user is asked to refine the search.
+TIMER_MATTER_LIST_LIMIT = 50
+
+# Seconds a Move/Merge target list prefetched on menu open stays usable.
+MOVE_MERGE_PREFETCH_TTL = 5.0
+
+# Time entries loaded per "Show more" step in the matter time-entries dialog.
+TIME_ENTRIES_PAGE_SIZE = 50
+
+# Indents for matters listed under a client header; Padding is a value object, so one instance serves every row.
+PAD_LEFT_24 = ft.Padding.only(left=24)
+PAD_LEFT_20 = ft.Padding.only(left=20)
+
+# "Sort clients by" choices shared by the matters, reporting and timesheet tabs.
+CLIENT_SORT_CHOICES = (
+    ("most_uninvoiced", "Most not invoiced time"),
+    ("most_accrued", "Most accrued (total) time"),
+    ("most_used_budget", "Most used up budget"),
+)
+
+
+def _client_sort_options() -> list[ft.DropdownOption]:
+    """Fresh options for a "Sort clients by" dropdown (a control can only have one parent)."""
+    return [ft.DropdownOption(key=k, text=t) for k, t in CLIENT_SORT_CHOICES]
+
+
+# Derived line under the manual-entry fields (Start, End, Duration).
+MANUAL_DERIVED_TEMPLATE = "Derived: Start %s, End %s, Duration %s"
+MANUAL_DERIVED_HINT = "Fill exactly two of Start, End, Duration; the third will be shown here."
+
 
 # Rate source colors for chargeable amounts: user_matter=teal, matter=green, upper_matter=orange, user=red
 RATE_LEGEND_TOOLTIP = (
@@ -50,14 +108,15 @@ RATE_LEGEND_TOOLTIP = (
 )
 
 
+RATE_SOURCE_COLORS = {
+    "user_matter": "teal",
+    "matter": "green",
+    "upper_matter": "orange",
+}
+
+
 def _rate_source_color(source: str) -> str:
-    if source == "user_matter":
-        return "teal"
-    if source == "matter":
-        return "green"
-    if source == "upper_matter":
-        return "orange"
-    return "red"  # user
+    return RATE_SOURCE_COLORS.get(source, "red")  # user
 
 
 def format_eur(amount: float) -> str:
@@ -67,19 +126,35 @@ def format_eur(amount: float) -> str:
 
 def format_elapsed(seconds: float) -> str:
     """Format seconds as HH:MM:SS."""
-    h = int(seconds) // 3600
-    m = (int(seconds) % 3600) // 60
-    s = int(seconds) % 60
+    return _format_hms(int(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _format_hms(total: int) -> str:
+    """Cached HH:MM:SS formatting keyed by whole seconds (timer ticks, report totals)."""
+    h, rem = divmod(total, 3600)
+    m, s = divmod(rem, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
 def format_elapsed_hm(seconds: float) -> str:
     """Format seconds as H:MM or HH:MM (no seconds). For Today's activities duration."""
-    h = int(seconds) // 3600
-    m = (int(seconds) % 3600) // 60
-    return f"{h}:{m:02d}"
+    h, rem = divmod(int(seconds), 3600)
+    return f"{h}:{rem // 60:02d}"
+
 
+@lru_cache(maxsize=1)
+def _default_export_dir() -> Path:
+    """~/Downloads if it exists, else <app dir>/exports (created). Resolved once per process."""
+    downloads = Path.home() / "Downloads"
+    if downloads.is_dir():
+        return downloads
+    exports_dir = Path(__file__).resolve().parent / "exports"
+    exports_dir.mkdir(exist_ok=True)
+    return exports_dir
 
+
+@lru_cache(maxsize=1024)
 def format_datetime(dt: datetime | None) -> str:
     """Format for display and editing."""
     if dt is None:
@@ -105,11 +180,22 @@ def parse_time(s: str) -> time | None:
         return None
 
 
+@lru_cache(maxsize=1024)
 def parse_datetime(s: str) -> datetime | None:
     """Parse ``YYYY-MM-DD HH:MM`` into a ``datetime``; return None on empty/invalid input."""
     s = (s or "").strip()
     if not s:
         return None
+    # Fast path for the canonical zero-padded form; fromisoformat is C-implemented, and the
+    # shape check keeps it from accepting extra ISO variants (seconds, offsets, ...).
+    if len(s) == 16 and s[4] == s[7] == "-" and s[10] == " " and s[13] == ":":
+        digits = s[:4] + s[5:7] + s[8:10] + s[11:13] + s[14:]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            return None
     try:
         return datetime.strptime(s, DATETIME_FMT)
     except ValueError:
@@ -158,6 +244,55 @@ def _compute_third_time_static(start_s: str, end_s: str, duration_s: str) -> tup
     return (None, None, None)
 
 
+def _toggle_member(items: set, item) -> None:
+    """Add ``item`` to ``items`` if absent, else remove it (expand/collapse state)."""
+    if item in items:
+        items.discard(item)
+    else:
+        items.add(item)
+
+
+def _hash_password(password: str) -> str:
+    """Return a bcrypt hash of ``password``. Slow by design: run it via asyncio.to_thread."""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_COST)).decode("utf-8")
+
+
+def _check_password(password: str, stored_hash: str | bytes) -> bool:
+    """Return True if ``password`` matches ``stored_hash``. Slow like _hash_password."""
+    if isinstance(stored_hash, str):
+        stored_hash = stored_hash.encode("utf-8")
+    return bcrypt.checkpw(password.encode("utf-8"), stored_hash)
+
+
+def _bcrypt_cost(stored_hash: str) -> int:
+    """Return the work factor embedded in a bcrypt hash ("$2b$CC$..."), or 0 if unparseable."""
+    try:
+        return int(stored_hash.split("$")[2])
+    except (IndexError, ValueError):
+        return 0
+
+
+@dataclass(slots=True)
+class _TimerState:
+    """Timer state shared by the Timer tab, keyboard shortcuts and the timer loop."""
+
+    running: bool = False
+    start_time: datetime | None = None  # wall clock, as stored on the time entry
+    mono_start: float = 0.0  # monotonic() reading matching start_time; drives the display
+    elapsed: float = 0.0  # last value ticked by the timer loop
+    matter_id: int | None = None  # matter selected in the Timer tab list
+    matter_path: str | None = None
+
+    def set_start(self, start_time: datetime) -> None:
+        """Record a (possibly edited) start time and anchor the monotonic display clock to it."""
+        self.start_time = start_time
+        self.mono_start = monotonic() - (datetime.now() - start_time).total_seconds()
+
+    def elapsed_now(self) -> float:
+        """Seconds since start on the monotonic clock (immune to wall-clock jumps)."""
+        return monotonic() - self.mono_start
+
+
 class SentinelApp:
     """Main Flet application for a logged-in user.
 
@@ -170,22 +305,42 @@ class SentinelApp:
       them as invoiced.
 
     A per-user :class:`DatabaseManager` instance is injected and used by all
-    tabs; user preferences (such as reporting sort order and refresh callbacks)
-    are stored on ``page.data``.
+    tabs; user preferences (such as reporting sort order) are stored on
+    ``page.data``; cross-tab refresh callbacks and the timer tab refs used by
+    keyboard shortcuts are plain attributes on the app.
     """
 
     def __init__(self, page: ft.Page, db_instance: DatabaseManager) -> None:
         self.page = page
         self.db = db_instance
         self.timer_label_ref: ft.Ref[ft.Text] = ft.Ref()
-        self.matter_dropdown_ref: ft.Ref[ft.Column] = ft.Ref()
-        self.running_ref: list[bool] = [False]
-        self.start_time_ref: list[datetime | None] = [None]
+        self.matter_dropdown_ref: ft.Ref[ft.ListView] = ft.Ref()
+        self.timer_state = _TimerState()
+        # Duration field of the running row in Today's activities, ticked by the timer loop.
+        self.running_duration_ref: ft.Ref[ft.TextField] = ft.Ref()
+        # Future of the ticking timer loop (None when idle), so Start never spawns a second one.
+        self.timer_task_ref: list = [None]
+        # (event loop, stop event) of the ticking timer loop, so Stop can wake it from any thread.
+        self._timer_stop_signal: list[tuple[asyncio.AbstractEventLoop, asyncio.Event] | None] = [None]
+        # Guards timer_task_ref between Start (handler thread) and the exiting loop.
+        self._timer_loop_lock = threading.Lock()
         self.matters_list_ref: ft.Ref[ft.Column] = ft.Ref()
         self.body_ref: ft.Ref[ft.Container] = ft.Ref()
+        self.timer_container_ref: ft.Ref[ft.Container] = ft.Ref()
         self.expanded_clients: set[str] = set()
-        # Track manual entry dialog ref for keyboard shortcut access
-        self.manual_entry_dialog_ref: ft.Ref[ft.AlertDialog] | None = None
+        # Cross-tab callbacks registered by the tab builders (None until that tab is built).
+        self._refresh_timer_matters: Callable[[], None] | None = None
+        self._refresh_timer_activities: Callable[..., None] | None = None
+        self._refresh_reporting: Callable[[], None] | None = None
+        self._refresh_timesheet_matters: Callable[[], None] | None = None
+        self._show_timer: Callable[[], None] | None = None
+        self._logout: Callable[[], None] | None = None
+        self._set_timer_mode: Callable[[bool], None] | None = None
+        # Timer tab controls used by keyboard shortcuts and Continue task.
+        self.description_ref: ft.Ref[ft.TextField] = ft.Ref()
+        self.start_time_section_ref: ft.Ref[ft.Container] = ft.Ref()
+        self.start_time_field_ref: ft.Ref[ft.TextField] = ft.Ref()
+        self.manual_entry_dialog_ref: ft.Ref[ft.AlertDialog] = ft.Ref()
 
     def _close_active_dialog(self) -> None:
         """Close the currently open dialog/modal."""
@@ -197,29 +352,22 @@ class SentinelApp:
     def _handle_start_stop_timer(self) -> None:
         """Handle Ctrl+T: Start or stop the timer."""
         page = self.page
-        if page.data is None:
-            return
-
-        # Get references from page.data
-        running_ref = page.data.get("running_ref", [False])
-        start_time_ref = page.data.get("start_time_ref", [None])
-        description_ref = page.data.get("description_ref")
-        timer_label_ref = page.data.get("timer_label_ref")
-        start_time_section_ref = page.data.get("start_time_section_ref")
-        start_time_field_ref = page.data.get("start_time_field_ref")
-        timer_matter_selected = page.data.get("timer_matter_selected", [None, None])
+        description_ref = self.description_ref
+        timer_label_ref = self.timer_label_ref
+        start_time_section_ref = self.start_time_section_ref
+        start_time_field_ref = self.start_time_field_ref
 
         # Check if timer is running
-        if running_ref[0]:
+        if self.timer_state.running:
             # Stop the timer
-            self._stop_timer(page, running_ref, start_time_ref, description_ref, timer_label_ref, start_time_section_ref)
+            self._stop_timer(page, description_ref, timer_label_ref, start_time_section_ref)
         else:
             # Start the timer
-            self._start_timer(page, matter_id=timer_matter_selected[0], start_time_ref=start_time_ref, running_ref=running_ref,
+            self._start_timer(page, matter_id=self.timer_state.matter_id,
                             description_ref=description_ref, timer_label_ref=timer_label_ref, start_time_section_ref=start_time_section_ref,
                             start_time_field_ref=start_time_field_ref)
 
-    def _start_timer(self, page: ft.Page, matter_id: int | None, start_time_ref: list, running_ref: list,
+    def _start_timer(self, page: ft.Page, matter_id: int | None,
                      description_ref: ft.Ref[ft.TextField] | None, timer_label_ref: ft.Text | None,
                      start_time_section_ref: ft.Ref[ft.Container] | None, start_time_field_ref: ft.Ref[ft.TextField] | None) -> None:
         """Start the timer (extracted from on_start for keyboard shortcut use)."""
@@ -236,24 +384,26 @@ class SentinelApp:
             page.update()
             return
 
-        start_time_ref[0] = entry.start_time
-        running_ref[0] = True
+        ts = self.timer_state
+        ts.set_start(entry.start_time)
+        ts.running = True
+        ts.elapsed = 0.0
         if timer_label_ref and timer_label_ref.current:
             timer_label_ref.current.value = "00:00:00"
         if start_time_section_ref and start_time_section_ref.current:
             start_time_section_ref.current.visible = True
         if start_time_field_ref and start_time_field_ref.current:
-            start_time_field_ref.current.value = format_datetime(start_time_ref[0])
+            start_time_field_ref.current.value = format_datetime(ts.start_time)
 
         # Show budget warning if needed
         self._show_budget_snack_if_needed(page, matter_id)
-        page.run_task(self._timer_loop(page, running_ref, start_time_ref, timer_label_ref))
+        self._ensure_timer_loop(self._timer_loop(page, timer_label_ref))
         page.update()
 
-    def _stop_timer(self, page: ft.Page, running_ref: list, start_time_ref: list, description_ref: ft.Ref[ft.TextField] | None,
+    def _stop_timer(self, page: ft.Page, description_ref: ft.Ref[ft.TextField] | None,
                     timer_label_ref: ft.Text | None, start_time_section_ref: ft.Ref[ft.Container] | None) -> None:
         """Stop the timer (extracted from on_stop for keyboard shortcut use)."""
-        if not running_ref[0]:
+        if not self.timer_state.running:
             return
 
         # Save current description to the running entry before stopping
@@ -261,7 +411,8 @@ class SentinelApp:
             desc = (description_ref.current.value or "").strip()
             self.db.update_running_entry_description(desc)
 
-        running_ref[0] = False
+        self.timer_state.running = False
+        self._signal_timer_stop()
         if start_time_section_ref and start_time_section_ref.current:
             start_time_section_ref.current.visible = False
 
@@ -269,7 +420,7 @@ class SentinelApp:
         if entry and timer_label_ref and timer_label_ref.current:
             timer_label_ref.current.value = format_elapsed(entry.duration_seconds)
 
-        refresh = page.data.get("refresh_timer_activities") if page.data else None
+        refresh = self._refresh_timer_activities
         if callable(refresh):
             refresh()
 
@@ -280,10 +431,7 @@ class SentinelApp:
 
     def _get_selected_matter_id(self) -> int | None:
         """Return selected matter id from the matter list (same for timer and manual)."""
-        # Access via page.data where timer_matter_selected is stored
-        if self.page.data is not None:
-            return self.page.data.get("timer_matter_selected", [None, None])[0]
-        return None
+        return self.timer_state.matter_id
 
     def _show_budget_snack_if_needed(self, page: ft.Page, matter_id: int | None) -> bool:
         """Show snack bar when matter budget is near or over threshold. Returns True if shown."""
@@ -311,19 +459,101 @@ class SentinelApp:
             return True
         return False
 
-    def _timer_loop(self, page: ft.Page, running_ref: list, start_time_ref: list, timer_label_ref: ft.Text | None) -> Callable[[], None]:
-        """Timer update loop (extracted from timer_loop for keyboard shortcut use)."""
+    def _timer_loop(self, page: ft.Page, timer_label_ref: ft.Text | None) -> Callable[[], None]:
+        """Timer label loop shared by the Timer tab and keyboard shortcuts.
+
+        Wakes on whole-second boundaries of the elapsed time, updates the label only
+        when its text changes, and exits as soon as Stop signals it. Start it via
+        :meth:`_ensure_timer_loop` so at most one loop runs.
+        """
+        ts = self.timer_state
+
         async def _do():
-            while running_ref[0] and start_time_ref[0]:
-                await asyncio.sleep(1)
-                if not running_ref[0]:
-                    break
-                elapsed = (datetime.now() - start_time_ref[0]).total_seconds()
-                if timer_label_ref and timer_label_ref.current:
-                    timer_label_ref.current.value = format_elapsed(elapsed)
-                    timer_label_ref.current.update()
+            stop_event = asyncio.Event()
+            self._timer_stop_signal[0] = (asyncio.get_running_loop(), stop_event)
+            last_text = None
+            try:
+                while ts.running and ts.start_time:
+                    elapsed = ts.elapsed_now()
+                    try:
+                        await asyncio.wait_for(stop_event.wait(), timeout=1.0 - (elapsed % 1))
+                        # Woken by Stop (or a quick restart): re-check running state now.
+                        stop_event.clear()
+                        continue
+                    except asyncio.TimeoutError:
+                        pass
+                    if not ts.running or ts.start_time is None:
+                        break
+                    elapsed = ts.elapsed_now()
+                    text = format_elapsed(elapsed)
+                    if text != last_text and timer_label_ref and timer_label_ref.current:
+                        timer_label_ref.current.value = text
+                        last_text = text
+                        # Another tab is showing: keep the value, show_timer sends it on return.
+                        if self._timer_tab_visible():
+                            timer_label_ref.current.update()
+                    self._tick_running_duration(elapsed)
+            finally:
+                with self._timer_loop_lock:
+                    self._timer_stop_signal[0] = None
+                    self.timer_task_ref[0] = None
+                    # Start may have run after the while check but before this point, when
+                    # _ensure_timer_loop still saw this loop alive: restart so the label keeps ticking.
+                    restart = ts.running and ts.start_time is not None
+                if restart:
+                    self._ensure_timer_loop(_do)
         return _do
 
+    def _ensure_timer_loop(self, loop_fn: Callable[[], None]) -> None:
+        """Schedule the timer loop unless one is still alive (a waking loop picks up the new start)."""
+        with self._timer_loop_lock:
+            task = self.timer_task_ref[0]
+            if task is None or task.done():
+                self.timer_task_ref[0] = self.page.run_task(loop_fn)
+
+    def _signal_timer_stop(self) -> None:
+        """Wake the ticking timer loop (if any) so it re-checks running state without waiting for its next tick."""
+        signal = self._timer_stop_signal[0]
+        if signal is not None:
+            loop, stop_event = signal
+            loop.call_soon_threadsafe(stop_event.set)
+
+    def _debounced(self, handler: Callable[[ft.ControlEvent], None], delay: float = 0.15):
+        """Wrap an on_change handler so a burst of keystrokes runs it once, ``delay`` seconds after the last."""
+        gen = [0]
+
+        async def _run(my_gen: int, e: ft.ControlEvent) -> None:
+            await asyncio.sleep(delay)
+            if my_gen != gen[0]:
+                return  # Superseded by a later event.
+            try:
+                handler(e)
+            except Exception:
+                logger.exception("Debounced handler %s failed", getattr(handler, "__name__", handler))
+
+        def on_change(e: ft.ControlEvent) -> None:
+            gen[0] += 1
+            self.page.run_task(_run, gen[0], e)
+
+        return on_change
+
+    def _tick_running_duration(self, elapsed: float) -> None:
+        """Update only the running row's Duration field (no rows rebuild); skips unchanged minutes."""
+        self.timer_state.elapsed = elapsed
+        duration_tf = self.running_duration_ref.current
+        if duration_tf is None:
+            return
+        value = format_elapsed_hm(elapsed)
+        if duration_tf.value != value:
+            duration_tf.value = value
+            if self._timer_tab_visible():
+                duration_tf.update()
+
+    def _timer_tab_visible(self) -> bool:
+        """True when the Timer tab is the content currently shown in the body."""
+        body = self.body_ref.current
+        return body is not None and body.content is self.timer_container_ref.current
+
     def _open_manual_entry_dialog(self) -> None:
         """Open the manual entry dialog (extracted from _open_manual_entry_dialog for keyboard shortcut use)."""
         page = self.page
@@ -333,8 +563,7 @@ class SentinelApp:
             page.update()
             return
 
-        # Access dialog via page.data where it's stored during timer tab build
-        manual_entry_dialog = (page.data or {}).get("_manual_entry_dialog")
+        manual_entry_dialog = self.manual_entry_dialog_ref.current
         if manual_entry_dialog:
             manual_entry_dialog.open = True
             page.update()
@@ -346,14 +575,14 @@ class SentinelApp:
     def _save_current_data(self) -> None:
         """Handle Ctrl+S: Save current data (trigger refresh to persist state)."""
         # Trigger a refresh of timer activities which saves state
-        refresh = self.page.data.get("refresh_timer_activities")
+        refresh = self._refresh_timer_activities
         if callable(refresh):
             refresh()
 
         # Also trigger reporting refresh if stale
         if self.page.data is not None:
             self.page.data["reporting_stale"] = True
-        refresh_reporting = self.page.data.get("refresh_reporting")
+        refresh_reporting = self._refresh_reporting
         if callable(refresh_reporting):
             refresh_reporting()
 
@@ -381,10 +610,10 @@ class SentinelApp:
         def refresh_timer_dropdown():
             if page.data is not None:
                 page.data["reporting_stale"] = True
-            refresh = (page.data or {}).get("refresh_timer_matters")
+            refresh = self._refresh_timer_matters
             if refresh:
                 refresh()
-            refresh_activities = (page.data or {}).get("refresh_timer_activities")
+            refresh_activities = self._refresh_timer_activities
             if refresh_activities:
                 refresh_activities()
 
@@ -393,10 +622,8 @@ class SentinelApp:
         reporting_cached: list = [None]
 
         def on_toggle_client(client_name: str):
-            self.expanded_clients.symmetric_difference_update([client_name])
-            reporting_container.content = self._build_reporting_tab(on_toggle_client)
-            reporting_cached[0] = reporting_container.content
-            page.update()
+            # The reporting tab flips the client's block itself; only the shared expanded set changes here.
+            _toggle_member(self.expanded_clients, client_name)
 
         if page.data is None:
             page.data = {}
@@ -404,12 +631,13 @@ class SentinelApp:
         page.data["reporting_stale"] = True
 
         def refresh_reporting():
+            self.db.invalidate_caches()
             reporting_container.content = self._build_reporting_tab(on_toggle_client)
             reporting_cached[0] = reporting_container.content
             page.data["reporting_stale"] = False
             page.update()
 
-        page.data["refresh_reporting"] = refresh_reporting
+        self._refresh_reporting = refresh_reporting
 
         reporting_tab = self._build_reporting_tab(on_toggle_client)
         reporting_cached[0] = reporting_tab
@@ -419,17 +647,17 @@ class SentinelApp:
             if current_user_is_admin
             else None
         )
-        timer_container = ft.Container(content=timer_tab, expand=True)
+        timer_container = ft.Container(ref=self.timer_container_ref, content=timer_tab, expand=True)
         matters_container = ft.Container(content=matters_tab, expand=True)
         reporting_container = ft.Container(content=reporting_tab, expand=True)
         timesheet_container = ft.Container(content=timesheet_tab, expand=True)
 
         async def _async_timer_refresh():
             def _do():
-                r = (page.data or {}).get("refresh_timer_matters")
+                r = self._refresh_timer_matters
                 if r:
                     r()
-                ra = (page.data or {}).get("refresh_timer_activities")
+                ra = self._refresh_timer_activities
                 if ra:
                     ra()
             await asyncio.to_thread(_do)
@@ -440,9 +668,7 @@ class SentinelApp:
             page.update()
             page.run_task(_async_timer_refresh)
 
-        if page.data is None:
-            page.data = {}
-        page.data["show_timer_callback"] = show_timer
+        self._show_timer = show_timer
 
         def show_matters(_):
             self.body_ref.current.content = matters_container
@@ -467,7 +693,7 @@ class SentinelApp:
 
         async def _async_timesheet_refresh():
             def _do():
-                r = (page.data or {}).get("refresh_timesheet_matters")
+                r = self._refresh_timesheet_matters
                 if r:
                     r()
             await asyncio.to_thread(_do)
@@ -485,6 +711,8 @@ class SentinelApp:
 
         def on_rail_change(e):
             idx = e.control.selected_index
+            # Entering a tab re-reads: pick up changes other users made since the last visit.
+            self.db.invalidate_caches()
             if idx == 0:
                 show_timer(e)
             elif idx == 1:
@@ -526,9 +754,7 @@ class SentinelApp:
                     label="Users",
                 ),
             )
-        if page.data is None:
-            page.data = {}
-        page.data["logout_callback"] = logout_callback
+        self._logout = logout_callback
         rail = ft.NavigationRail(
             selected_index=0,
             extended=True,
@@ -631,7 +857,7 @@ class SentinelApp:
         )
 
         # Initial refresh of timer (matter list + near-budget banner)
-        refresh = (page.data or {}).get("refresh_timer_matters")
+        refresh = self._refresh_timer_matters
         if refresh:
             refresh()
 
@@ -640,8 +866,7 @@ class SentinelApp:
         page = self.page
         timer_label = self.timer_label_ref
         matter_dropdown = self.matter_dropdown_ref
-        running_ref = self.running_ref
-        start_time_ref = self.start_time_ref
+        ts = self.timer_state
         timer_label = self.timer_label_ref
 
         def _on_continue_task(entry_id: int):
@@ -652,44 +877,45 @@ class SentinelApp:
                 page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
                 page.update()
                 return
-            refresh = (page.data or {}).get("refresh_timer_activities")
+            refresh = self._refresh_timer_activities
             if callable(refresh):
                 refresh()
-            start_time_ref[0] = new_entry.start_time
-            running_ref[0] = True
+            ts.set_start(new_entry.start_time)
+            ts.running = True
+            ts.elapsed = 0.0
             # Force timer mode so Start/Stop and timer box are visible when continuing.
-            set_mode = (page.data or {}).get("_timer_set_mode_callback")
+            set_mode = self._set_timer_mode
             if callable(set_mode):
                 set_mode(False)
             if timer_label.current:
                 timer_label.current.value = "00:00:00"
-            start_time_section_ref = (page.data or {}).get("_timer_start_time_section_ref")
-            start_time_field_ref = (page.data or {}).get("_timer_start_time_field_ref")
-            desc_ref = (page.data or {}).get("_timer_description_ref")
-            if start_time_section_ref and start_time_section_ref.current:
-                start_time_section_ref.current.visible = True
-            if start_time_field_ref and start_time_field_ref.current:
-                start_time_field_ref.current.value = format_datetime(start_time_ref[0])
-            if desc_ref and desc_ref.current:
-                desc_ref.current.value = (new_entry.description or "").strip()
-            page.run_task(timer_loop)
+            if self.start_time_section_ref.current:
+                self.start_time_section_ref.current.visible = True
+            if self.start_time_field_ref.current:
+                self.start_time_field_ref.current.value = format_datetime(ts.start_time)
+            if self.description_ref.current:
+                self.description_ref.current.value = (new_entry.description or "").strip()
+            self._ensure_timer_loop(timer_loop)
             page.snack_bar = ft.SnackBar(ft.Text("Continued task; timer running."), open=True)
             page.update()
 
         # Selectable matters only (non-roots); used for selection and search
         options = self.db.get_matters_with_full_paths(for_timer=True)
-        timer_matter_selected: list = [options[0][0], options[0][1]] if options else [None, None]
+        ts.matter_id, ts.matter_path = (options[0][0], options[0][1]) if options else (None, None)
         # All matters (including roots) so every client appears as a section header even with 0 matters
         options_all = self.db.get_matters_with_full_paths(for_timer=False)
 
         def _options_by_client_timer(opts: list[tuple[int, str]]) -> dict:
             """Group by client (first path segment). Only non-root matters go into lists."""
-            by_client = defaultdict(list)
+            by_client: dict[str, list[tuple[int, str]]] = {}
             for mid, path in opts:
-                client = path.split(" > ")[0] if " > " in path else path
-                by_client[client].append((mid, path))
-            for client in by_client:
-                by_client[client].sort(key=lambda x: x[1])
+                client = path.partition(" > ")[0]
+                items = by_client.get(client)
+                if items is None:
+                    items = by_client[client] = []
+                items.append((mid, path))
+            for items in by_client.values():
+                items.sort(key=lambda x: x[1])
             return by_client
 
         def _by_client_include_all_clients() -> dict:
@@ -706,25 +932,38 @@ class SentinelApp:
         timer_matter_list_ref = matter_dropdown
         timer_matter_selection_ref = ft.Ref[ft.Text]()
 
+        def _timer_matter_tile(mid: int, path: str, indent: int = 0):
+            return ft.ListTile(
+                title=ft.Text(path, size=14),
+                dense=True,
+                content_padding=ft.Padding.only(left=2 + indent, top=2, right=2, bottom=2),
+                on_click=lambda e, mid=mid, path=path: _on_timer_matter_select(mid, path),
+            )
+
         def _build_timer_matter_list(query: str):
+            """Flat rows for the matter ListView; search results are capped at TIMER_MATTER_LIST_LIMIT with a refine hint."""
             q = (query or "").strip().lower()
             if q:
-                flat = [(mid, path) for mid, path in options if path and q in path.lower()][:50]
-                return [
-                    ft.ListTile(
-                        title=ft.Text(path, size=14),
-                        dense=True,
-                        content_padding=2,
-                        on_click=lambda e, mid=mid, path=path: _on_timer_matter_select(mid, path),
+                matches = (t for t in options if t[1] and q in t[1].lower())
+                rows = [_timer_matter_tile(mid, path) for mid, path in islice(matches, TIMER_MATTER_LIST_LIMIT + 1)]
+                if len(rows) > TIMER_MATTER_LIST_LIMIT:
+                    del rows[TIMER_MATTER_LIST_LIMIT:]
+                    rows.append(
+                        ft.Text(
+                            "More matters not shown. Refine search.",
+                            size=12,
+                            italic=True,
+                            color=ft.Colors.ON_SURFACE_VARIANT,
+                        )
                     )
-                    for mid, path in flat
-                ]
+                return rows
+            # Browse view is uncapped: the ListView builds rows on demand, so every client stays reachable.
             by_client = _by_client_include_all_clients()
-            controls = []
+            rows = []
             for client_name in sorted(by_client.keys()):
                 items = by_client[client_name]
                 is_exp = client_name in timer_matter_expanded
-                controls.append(
+                rows.append(
                     ft.ListTile(
                         title=ft.Text(client_name, weight=ft.FontWeight.W_500, size=14),
                         subtitle=ft.Text(f"{len(items)} matter(s)", size=12),
@@ -734,28 +973,12 @@ class SentinelApp:
                         on_click=lambda e, c=client_name: _on_timer_matter_toggle(c),
                     ),
                 )
-                controls.append(
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                ft.ListTile(
-                                    title=ft.Text(path, size=14),
-                                    dense=True,
-                                    content_padding=2,
-                                    on_click=lambda e, mid=mid, path=path: _on_timer_matter_select(mid, path),
-                                )
-                                for mid, path in items
-                            ],
-                            spacing=0,
-                        ),
-                        visible=is_exp,
-                        padding=ft.Padding.only(left=16, top=0, right=0, bottom=0),
-                    ),
-                )
-            return controls
+                if is_exp:
+                    rows.extend(_timer_matter_tile(mid, path, indent=16) for mid, path in items)
+            return rows
 
         def _on_timer_matter_toggle(client_name: str):
-            timer_matter_expanded.symmetric_difference_update([client_name])
+            _toggle_member(timer_matter_expanded, client_name)
             if timer_matter_list_ref.current:
                 timer_matter_list_ref.current.controls = _build_timer_matter_list(
                     timer_matter_search_ref.current.value if timer_matter_search_ref.current else ""
@@ -763,7 +986,7 @@ class SentinelApp:
                 timer_matter_list_ref.current.update()
 
         def _on_timer_matter_select(mid: int, path: str):
-            timer_matter_selected[0], timer_matter_selected[1] = mid, path
+            ts.matter_id, ts.matter_path = mid, path
             if timer_matter_selection_ref.current:
                 timer_matter_selection_ref.current.value = f"Selected: {path}"
                 timer_matter_selection_ref.current.update()
@@ -775,8 +998,11 @@ class SentinelApp:
 
         near_budget_banner_ref = ft.Ref[ft.Container]()
 
-        def _update_near_budget_banner():
-            """Show banner when any timer matter is over or near budget; hide if dismissed for session."""
+        def _update_near_budget_banner(update: bool = True):
+            """Show banner when any timer matter is over or near budget; hide if dismissed for session.
+
+            Pass ``update=False`` when the caller sends a single ``page.update()`` afterwards.
+            """
             if near_budget_banner_ref.current is None:
                 return
             timer_matters = self.db.get_matters_with_full_paths(for_timer=True)
@@ -794,7 +1020,8 @@ class SentinelApp:
             dismissed = (page.data or {}).get("timer_near_budget_dismissed", False)
             if dismissed or not combined:
                 near_budget_banner_ref.current.visible = False
-                near_budget_banner_ref.current.update()
+                if update:
+                    near_budget_banner_ref.current.update()
                 return
             budget_in = combined[0][2].get("budget_in")
             budget_in_suffix = f" (Budget in {budget_in})" if budget_in else ""
@@ -834,10 +1061,12 @@ class SentinelApp:
                 tight=True,
             )
             near_budget_banner_ref.current.visible = True
-            near_budget_banner_ref.current.update()
+            if update:
+                near_budget_banner_ref.current.update()
 
         def refresh_timer_matter_list():
             nonlocal options, options_all
+            self.db.invalidate_caches()
             options = self.db.get_matters_with_full_paths(for_timer=True)
             options_all = self.db.get_matters_with_full_paths(for_timer=False)
             # Apply "Log time" from Manage Matters: select this matter and switch to Timer
@@ -845,18 +1074,18 @@ class SentinelApp:
             if select_mid is not None:
                 for mid, path in options:
                     if mid == select_mid:
-                        timer_matter_selected[0], timer_matter_selected[1] = mid, path
+                        ts.matter_id, ts.matter_path = mid, path
                         break
             # Keep all clients expanded so all matters from all clients are visible
             by_client = _by_client_include_all_clients()
             timer_matter_expanded.clear()
             timer_matter_expanded.update(by_client.keys())
-            if options and timer_matter_selected[0] not in [mid for mid, _ in options]:
-                timer_matter_selected[0], timer_matter_selected[1] = options[0][0], options[0][1]
+            if options and ts.matter_id not in [mid for mid, _ in options]:
+                ts.matter_id, ts.matter_path = options[0][0], options[0][1]
                 if timer_matter_selection_ref.current:
                     timer_matter_selection_ref.current.value = f"Selected: {options[0][1]}"
             if timer_matter_selection_ref.current:
-                timer_matter_selection_ref.current.value = f"Selected: {timer_matter_selected[1]}" if timer_matter_selected[1] else "Select a matter below."
+                timer_matter_selection_ref.current.value = f"Selected: {ts.matter_path}" if ts.matter_path else "Select a matter below."
             if timer_matter_list_ref.current:
                 q = timer_matter_search_ref.current.value if timer_matter_search_ref.current else ""
                 timer_matter_list_ref.current.controls = _build_timer_matter_list(q)
@@ -865,9 +1094,7 @@ class SentinelApp:
                 timer_matter_selection_ref.current.update()
             _update_near_budget_banner()
 
-        if page.data is None:
-            page.data = {}
-        page.data["refresh_timer_matters"] = refresh_timer_matter_list
+        self._refresh_timer_matters = refresh_timer_matter_list
 
         today = date.today()
         selected_day: list[date] = [today]
@@ -885,7 +1112,8 @@ class SentinelApp:
             return f"Activities for {selected_day[0].isoformat()}"
 
         def _build_activities_rows() -> list[ft.Control]:
-            entries = self.db.get_time_entries_for_day(selected_day[0])
+            day = selected_day[0]
+            entries = self.db.get_time_entries_for_day(day)
             path_options = self.db.get_matters_with_full_paths(for_timer=True)
             path_by_id = {mid: path for mid, path in path_options}
             rates_by_key = self.db.get_resolved_hourly_rates_batch(entries)
@@ -895,15 +1123,22 @@ class SentinelApp:
                     activities_list_ref.current.controls = _build_activities_rows()
                     activities_list_ref.current.update()
 
-            rows: list[ft.Control] = []
+            rows: list[ft.DataRow] = []
+            self.running_duration_ref.current = None
             for entry in entries:
                 entry_id = entry.id
                 matter_options = [ft.DropdownOption(key=str(mid), text=path) for mid, path in path_options]
                 start_val = format_time(entry.start_time)
                 end_val = format_time(entry.end_time) if entry.end_time is not None else "—"
                 dur_sec = entry.duration_seconds or 0.0
-                if entry.end_time is None and entry.start_time:
-                    dur_sec = max(0, (datetime.now() - entry.start_time).total_seconds())
+                is_running = entry.end_time is None
+                if is_running:
+                    # The timer loop keeps this field current; only compute from the clock
+                    # when no loop is ticking (e.g. entry left running from a previous session).
+                    if ts.running:
+                        dur_sec = ts.elapsed
+                    elif entry.start_time:
+                        dur_sec = max(0, (datetime.now() - entry.start_time).total_seconds())
                 duration_val = format_elapsed_hm(dur_sec)
                 desc_val = (entry.description or "").strip()
 
@@ -922,6 +1157,8 @@ class SentinelApp:
                 start_tf = ft.TextField(value=start_val, width=90, on_blur=lambda e, eid=entry_id: _on_activity_start_blur(eid, e.control.value))
                 end_tf = ft.TextField(value=end_val, width=90, on_blur=lambda e, eid=entry_id: _on_activity_end_blur(eid, e.control.value))
                 duration_tf = ft.TextField(value=duration_val, width=100, on_blur=lambda e, eid=entry_id: _on_activity_duration_blur(eid, e.control.value))
+                if is_running:
+                    self.running_duration_ref.current = duration_tf
                 rate, rate_source = rates_by_key.get((entry.matter_id, entry.owner_id), (0.0, "user"))
                 amount_eur = self.db.amount_eur_from_seconds(dur_sec, rate)
                 amount_color = _rate_source_color(rate_source)
@@ -1050,59 +1287,60 @@ class SentinelApp:
                     on_click=lambda e, eid=entry_id: open_activity_change_date_dialog(eid),
                 )
                 rows.append(
-                    ft.Row(
-                        [
-                            matter_dd,
-                            desc_tf,
-                            start_tf,
-                            end_tf,
-                            duration_tf,
-                            amount_text,
-                            continue_btn,
-                            ft.Row(
-                                [change_date_btn, delete_btn],
-                                spacing=4,
-                                alignment=ft.MainAxisAlignment.END,
-                            ),
+                    ft.DataRow(
+                        cells=[
+                            ft.DataCell(matter_dd),
+                            ft.DataCell(desc_tf),
+                            ft.DataCell(start_tf),
+                            ft.DataCell(end_tf),
+                            ft.DataCell(duration_tf),
+                            ft.DataCell(amount_text),
+                            ft.DataCell(continue_btn),
+                            ft.DataCell(ft.Row([change_date_btn, delete_btn], spacing=4)),
                         ],
-                        spacing=12,
-                        alignment=ft.MainAxisAlignment.START,
                     )
                 )
 
             if not rows:
                 return [ft.Text("No activities recorded for this day. Start the timer or add a manual entry below.", size=14)]
-            header = ft.Row(
-                [
-                    ft.Text("Matter", size=12, weight=ft.FontWeight.W_500, width=320),
-                    ft.Text("Description", size=12, weight=ft.FontWeight.W_500, width=200),
-                    ft.Text("Start", size=12, weight=ft.FontWeight.W_500, width=90),
-                    ft.Text("End", size=12, weight=ft.FontWeight.W_500, width=90),
-                    ft.Text("Duration", size=12, weight=ft.FontWeight.W_500, width=100),
-                    ft.Text(
-                        "Amount (€)",
-                        size=12,
-                        weight=ft.FontWeight.W_500,
-                        width=90,
-                        tooltip=ft.Tooltip(message=RATE_LEGEND_TOOLTIP),
-                    ),
-                    ft.Container(width=90),
-                    ft.Text("Actions", size=12, weight=ft.FontWeight.W_500, width=64),
-                ],
-                spacing=12,
-            )
-            return [header] + rows
+            header_style = ft.TextStyle(size=12, weight=ft.FontWeight.W_500)
+            columns = [
+                ft.DataColumn(ft.Text("Matter")),
+                ft.DataColumn(ft.Text("Description")),
+                ft.DataColumn(ft.Text("Start")),
+                ft.DataColumn(ft.Text("End")),
+                ft.DataColumn(ft.Text("Duration")),
+                ft.DataColumn(ft.Text("Amount (€)"), tooltip=RATE_LEGEND_TOOLTIP),
+                ft.DataColumn(ft.Text("")),
+                ft.DataColumn(ft.Text("Actions")),
+            ]
+            # One DataTable instead of a Row per entry: smaller control tree to diff on refresh.
+            return [
+                ft.DataTable(
+                    columns=columns,
+                    rows=rows,
+                    column_spacing=12,
+                    horizontal_margin=0,
+                    heading_row_height=32,
+                    heading_text_style=header_style,
+                    data_row_min_height=56,
+                    data_row_max_height=64,
+                )
+            ]
 
-        def refresh_activities():
+        def refresh_activities(update: bool = True):
+            """Rebuild the day's rows, header count and budget banner; ``update=False`` leaves sending to the caller."""
             if page.data is not None:
                 page.data["reporting_stale"] = True
             if activities_list_ref.current:
                 activities_list_ref.current.controls = _build_activities_rows()
-                activities_list_ref.current.update()
+                if update:
+                    activities_list_ref.current.update()
             if activities_header_text_ref.current:
                 activities_header_text_ref.current.value = _activities_collapsible_header_text()
-                activities_header_text_ref.current.update()
-            _update_near_budget_banner()
+                if update:
+                    activities_header_text_ref.current.update()
+            _update_near_budget_banner(update)
 
         def _set_selected_day(new_day: date) -> None:
             """Update selected_day state, header label, field, and refresh list."""
@@ -1130,7 +1368,7 @@ class SentinelApp:
                 change_date_field_ref.current.value = new_day.isoformat()
                 change_date_field_ref.current.update()
 
-        page.data["refresh_timer_activities"] = refresh_activities
+        self._refresh_timer_activities = refresh_activities
 
         def open_activity_delete_dialog(entry_id: int) -> None:
             """Ask confirmation, then delete the entry and refresh Today's activities."""
@@ -1395,22 +1633,17 @@ class SentinelApp:
             padding=ft.Padding.only(bottom=8),
         )
 
-        description_ref = ft.Ref[ft.TextField]()
+        description_ref = self.description_ref
         manual_desc_ref = ft.Ref[ft.TextField]()
         manual_start_ref = ft.Ref[ft.TextField]()
         manual_end_ref = ft.Ref[ft.TextField]()
         manual_duration_ref = ft.Ref[ft.TextField]()
         manual_derived_ref = ft.Ref[ft.Text]()
-        manual_entry_dialog_ref = ft.Ref[ft.AlertDialog]()
+        manual_entry_dialog_ref = self.manual_entry_dialog_ref
         manual_dialog_matter_ref = ft.Ref[ft.Text]()
         timer_section_ref = ft.Ref[ft.Container]()
-        start_time_field_ref = ft.Ref[ft.TextField]()
-        start_time_section_ref = ft.Ref[ft.Container]()
-        if page.data is None:
-            page.data = {}
-        page.data["_timer_start_time_section_ref"] = start_time_section_ref
-        page.data["_timer_start_time_field_ref"] = start_time_field_ref
-        page.data["_timer_description_ref"] = description_ref
+        start_time_field_ref = self.start_time_field_ref
+        start_time_section_ref = self.start_time_section_ref
         label = ft.Text(
             ref=timer_label,
             value="00:00:00",
@@ -1420,19 +1653,11 @@ class SentinelApp:
         start_btn = ft.ElevatedButton("Start", icon=ft.Icons.PLAY_ARROW)
         stop_btn = ft.OutlinedButton("Stop", icon=ft.Icons.STOP)
 
-        async def timer_loop():
-            while running_ref[0] and start_time_ref[0]:
-                await asyncio.sleep(1)
-                if not running_ref[0]:
-                    break
-                elapsed = (datetime.now() - start_time_ref[0]).total_seconds()
-                if timer_label.current:
-                    timer_label.current.value = format_elapsed(elapsed)
-                    timer_label.current.update()
+        timer_loop = self._timer_loop(page, timer_label)
 
         def _get_selected_matter_id() -> int | None:
             """Return selected matter id from the matter list (same for timer and manual)."""
-            return timer_matter_selected[0]
+            return ts.matter_id
 
         def _show_budget_snack_if_needed(matter_id: int | None) -> bool:
             """Show snack bar when matter budget is near or over threshold. Returns True if shown."""
@@ -1461,149 +1686,149 @@ class SentinelApp:
             return False
 
         def on_start(_):
-            matter_id = _get_selected_matter_id()
-            if matter_id is None:
-                page.snack_bar = ft.SnackBar(ft.Text("Select a matter from the list."), open=True)
-                page.update()
-                return
-            if running_ref[0]:
-                return
-            description = (description_ref.current.value or "").strip() if description_ref.current else ""
+            # Single page.update() per handler, including early-return paths.
             try:
-                entry = self.db.start_timer(matter_id, description=description or None)
-            except ValueError as e:
-                page.snack_bar = ft.SnackBar(ft.Text(str(e)), open=True)
+                matter_id = _get_selected_matter_id()
+                if matter_id is None:
+                    page.snack_bar = ft.SnackBar(ft.Text("Select a matter from the list."), open=True)
+                    return
+                if ts.running:
+                    return
+                desc_fld = description_ref.current
+                description = (desc_fld.value or "").strip() if desc_fld else ""
+                try:
+                    entry = self.db.start_timer(matter_id, description=description or None)
+                except ValueError as e:
+                    page.snack_bar = ft.SnackBar(ft.Text(str(e)), open=True)
+                    return
+                ts.set_start(entry.start_time)
+                ts.running = True
+                ts.elapsed = 0.0
+                timer_label.current.value = "00:00:00"
+                section, start_fld = start_time_section_ref.current, start_time_field_ref.current
+                if section:
+                    section.visible = True
+                if start_fld:
+                    start_fld.value = format_datetime(ts.start_time)
+                self._ensure_timer_loop(timer_loop)
+                _show_budget_snack_if_needed(matter_id)
+            finally:
                 page.update()
-                return
-            start_time_ref[0] = entry.start_time
-            running_ref[0] = True
-            timer_label.current.value = "00:00:00"
-            if start_time_section_ref.current:
-                start_time_section_ref.current.visible = True
-            if start_time_field_ref.current:
-                start_time_field_ref.current.value = format_datetime(start_time_ref[0])
-            page.run_task(timer_loop)
-            _show_budget_snack_if_needed(matter_id)
-            page.update()
 
         def on_apply_start_time(_):
-            if not running_ref[0] or not start_time_field_ref.current:
-                return
-            s = (start_time_field_ref.current.value or "").strip()
-            new_start = parse_datetime(s)
-            if new_start is None:
-                page.snack_bar = ft.SnackBar(ft.Text("Use format YYYY-MM-DD HH:MM (e.g. 2025-02-20 09:30)"), open=True)
-                page.update()
+            start_fld = start_time_field_ref.current
+            if not ts.running or not start_fld:
                 return
-            entry = self.db.update_running_entry_start_time(new_start)
-            if entry is None:
-                page.snack_bar = ft.SnackBar(ft.Text("No running timer to update."), open=True)
+            try:
+                s = (start_fld.value or "").strip()
+                new_start = parse_datetime(s)
+                if new_start is None:
+                    page.snack_bar = ft.SnackBar(ft.Text("Use format YYYY-MM-DD HH:MM (e.g. 2025-02-20 09:30)"), open=True)
+                    return
+                entry = self.db.update_running_entry_start_time(new_start)
+                if entry is None:
+                    page.snack_bar = ft.SnackBar(ft.Text("No running timer to update."), open=True)
+                    return
+                ts.set_start(new_start)
+                label = timer_label.current
+                if label:
+                    label.value = format_elapsed(ts.elapsed_now())
+                page.snack_bar = ft.SnackBar(ft.Text("Start time updated."), open=True)
+            finally:
                 page.update()
-                return
-            start_time_ref[0] = new_start
-            if timer_label.current:
-                timer_label.current.value = format_elapsed((datetime.now() - new_start).total_seconds())
-            page.snack_bar = ft.SnackBar(ft.Text("Start time updated."), open=True)
-            page.update()
 
         def on_description_blur(_):
             """When description field loses focus and timer is running, save to the time entry."""
-            if running_ref[0] and description_ref.current:
+            if ts.running and description_ref.current:
                 desc = (description_ref.current.value or "").strip()
                 self.db.update_running_entry_description(desc)
 
         def on_stop(_):
-            if not running_ref[0]:
+            if not ts.running:
                 return
             # Save current description to the running entry before stopping
-            if description_ref.current:
-                desc = (description_ref.current.value or "").strip()
-                self.db.update_running_entry_description(desc)
-            running_ref[0] = False
-            if start_time_section_ref.current:
-                start_time_section_ref.current.visible = False
+            desc_fld = description_ref.current
+            if desc_fld:
+                self.db.update_running_entry_description((desc_fld.value or "").strip())
+            ts.running = False
+            self._signal_timer_stop()
+            section = start_time_section_ref.current
+            if section:
+                section.visible = False
             entry = self.db.stop_timer()
-            if entry and timer_label.current:
-                timer_label.current.value = format_elapsed(entry.duration_seconds)
-            refresh = page.data.get("refresh_timer_activities")
-            if callable(refresh):
-                refresh()
+            label = timer_label.current
+            if entry and label:
+                label.value = format_elapsed(entry.duration_seconds)
+            refresh_activities(update=False)
             if entry:
                 _show_budget_snack_if_needed(entry.matter_id)
             page.update()
 
-        def _update_manual_derived(_=None):
+        def _update_manual_derived(_=None, update: bool = True):
             """When two of Start/End/Duration are filled, compute and show the third."""
-            if not manual_derived_ref.current:
+            derived = manual_derived_ref.current
+            if not derived:
                 return
-            start_s = manual_start_ref.current.value if manual_start_ref.current else ""
-            end_s = manual_end_ref.current.value if manual_end_ref.current else ""
-            dur_s = manual_duration_ref.current.value if manual_duration_ref.current else ""
+            start_fld, end_fld, dur_fld = manual_start_ref.current, manual_end_ref.current, manual_duration_ref.current
+            start_s = start_fld.value if start_fld else ""
+            end_s = end_fld.value if end_fld else ""
+            dur_s = dur_fld.value if dur_fld else ""
             start_t, end_t, dur = _compute_third_time_static(start_s, end_s, dur_s)
             if start_t is None or end_t is None or dur is None:
-                manual_derived_ref.current.value = "Fill exactly two of Start, End, Duration; the third will be shown here."
+                text = MANUAL_DERIVED_HINT
             else:
-                manual_derived_ref.current.value = f"Derived: Start {format_datetime(start_t)}, End {format_datetime(end_t)}, Duration {format_elapsed(dur)}"
-            manual_derived_ref.current.update()
+                text = MANUAL_DERIVED_TEMPLATE % (format_datetime(start_t), format_datetime(end_t), format_elapsed(dur))
+            if derived.value == text:
+                return  # Unchanged derived line: nothing to send.
+            derived.value = text
+            if update:
+                derived.update()
+
+        # Debounce Start/End/Duration typing: recompute once input pauses for ~150 ms.
+        _on_manual_field_change = self._debounced(_update_manual_derived)
 
         def on_manual_add(_):
-            matter_id = _get_selected_matter_id()
-            if matter_id is None:
-                page.snack_bar = ft.SnackBar(ft.Text("Select a matter from the list."), open=True)
-                page.update()
-                return
-            desc = (manual_desc_ref.current.value or "").strip() if manual_desc_ref.current else ""
-            start_s = manual_start_ref.current.value if manual_start_ref.current else ""
-            end_s = manual_end_ref.current.value if manual_end_ref.current else ""
-            dur_s = manual_duration_ref.current.value if manual_duration_ref.current else ""
-            start_t, end_t, dur = _compute_third_time_static(start_s, end_s, dur_s)
-            if start_t is None or end_t is None or dur is None:
-                page.snack_bar = ft.SnackBar(ft.Text("Fill exactly two of Start, End, Duration."), open=True)
-                page.update()
-                return
+            # Single page.update() per handler, including early-return paths.
             try:
-                self.db.add_manual_time_entry(matter_id, desc, start_time=start_t, end_time=end_t, duration_seconds=dur)
-            except ValueError as err:
-                page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
+                matter_id = _get_selected_matter_id()
+                if matter_id is None:
+                    page.snack_bar = ft.SnackBar(ft.Text("Select a matter from the list."), open=True)
+                    return
+                desc_fld, start_fld = manual_desc_ref.current, manual_start_ref.current
+                end_fld, dur_fld = manual_end_ref.current, manual_duration_ref.current
+                desc = (desc_fld.value or "").strip() if desc_fld else ""
+                start_s = start_fld.value if start_fld else ""
+                end_s = end_fld.value if end_fld else ""
+                dur_s = dur_fld.value if dur_fld else ""
+                start_t, end_t, dur = _compute_third_time_static(start_s, end_s, dur_s)
+                if start_t is None or end_t is None or dur is None:
+                    page.snack_bar = ft.SnackBar(ft.Text("Fill exactly two of Start, End, Duration."), open=True)
+                    return
+                try:
+                    self.db.add_manual_time_entry(matter_id, desc, start_time=start_t, end_time=end_t, duration_seconds=dur)
+                except ValueError as err:
+                    page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
+                    return
+                for fld in (desc_fld, start_fld, end_fld, dur_fld):
+                    if fld:
+                        fld.value = ""
+                _update_manual_derived(update=False)
+                refresh_activities(update=False)
+                dialog = manual_entry_dialog_ref.current
+                if dialog:
+                    dialog.open = False
+                if not _show_budget_snack_if_needed(matter_id):
+                    matter_path = ts.matter_path or ""
+                    page.snack_bar = ft.SnackBar(
+                        ft.Text(f"Manual entry added to {matter_path}." if matter_path else "Manual entry added."),
+                        open=True,
+                    )
+            finally:
                 page.update()
-                return
-            if manual_desc_ref.current:
-                manual_desc_ref.current.value = ""
-            if manual_start_ref.current:
-                manual_start_ref.current.value = ""
-            if manual_end_ref.current:
-                manual_end_ref.current.value = ""
-            if manual_duration_ref.current:
-                manual_duration_ref.current.value = ""
-            _update_manual_derived()
-            refresh = page.data.get("refresh_timer_activities")
-            if callable(refresh):
-                refresh()
-            if manual_entry_dialog_ref.current:
-                manual_entry_dialog_ref.current.open = False
-                manual_entry_dialog_ref.current.update()
-            if not _show_budget_snack_if_needed(matter_id):
-                matter_path = timer_matter_selected[1] or ""
-                page.snack_bar = ft.SnackBar(
-                    ft.Text(f"Manual entry added to {matter_path}." if matter_path else "Manual entry added."),
-                    open=True,
-                )
-            page.update()
 
         start_btn.on_click = on_start
         stop_btn.on_click = on_stop
 
-        # Store timer-related references for keyboard shortcut access
-        if page.data is None:
-            page.data = {}
-        page.data["timer_matter_selected"] = timer_matter_selected
-        page.data["running_ref"] = running_ref
-        page.data["start_time_ref"] = start_time_ref
-        page.data["description_ref"] = description_ref
-        page.data["timer_label_ref"] = timer_label
-        page.data["start_time_section_ref"] = start_time_section_ref
-        page.data["start_time_field_ref"] = start_time_field_ref
-
         def _safe_update(ctrl):
             """Update control only if it has been added to the page."""
             if ctrl is None:
@@ -1615,12 +1840,14 @@ class SentinelApp:
 
         def _set_mode(manual: bool):
             """Keep timer section visible when not in manual mode (Continue task calls with False). Manual entry is now a dialog."""
-            if timer_section_ref.current:
-                timer_section_ref.current.visible = not manual
-                _safe_update(timer_section_ref.current)
+            section = timer_section_ref.current
+            if section is None or section.visible == (not manual):
+                return  # Already in the requested mode: no diff to send.
+            section.visible = not manual
+            _safe_update(section)
 
         # Expose mode setter so other callbacks (e.g. Continue task) can force timer mode.
-        (page.data or {})["_timer_set_mode_callback"] = _set_mode
+        self._set_timer_mode = _set_mode
 
         def _open_manual_entry_dialog(_):
             if _get_selected_matter_id() is None:
@@ -1628,7 +1855,7 @@ class SentinelApp:
                 page.update()
                 return
             if manual_dialog_matter_ref.current:
-                manual_dialog_matter_ref.current.value = timer_matter_selected[1] or ""
+                manual_dialog_matter_ref.current.value = ts.matter_path or ""
                 manual_dialog_matter_ref.current.update()
             if manual_desc_ref.current:
                 manual_desc_ref.current.value = ""
@@ -1660,7 +1887,7 @@ class SentinelApp:
                             ft.Text(
                                 ref=timer_matter_selection_ref,
                                 size=14,
-                                value=f"Selected: {timer_matter_selected[1]}" if timer_matter_selected[1] else "Select a matter below.",
+                                value=f"Selected: {ts.matter_path}" if ts.matter_path else "Select a matter below.",
                             ),
                         ],
                         spacing=8,
@@ -1687,7 +1914,7 @@ class SentinelApp:
                     ),
                     ft.Container(height=4),
                     ft.Container(
-                        content=ft.Column(ref=timer_matter_list_ref, controls=timer_matter_list_initial, scroll=ft.ScrollMode.AUTO),
+                        content=ft.ListView(ref=timer_matter_list_ref, controls=timer_matter_list_initial, spacing=0),
                         height=120,
                         border=ft.border.all(1, ft.Colors.OUTLINE),
                         border_radius=4,
@@ -1750,10 +1977,10 @@ class SentinelApp:
                     ft.Container(height=8),
                     ft.Text("Fill exactly two of Start, End, Duration; the third is derived.", size=12),
                     ft.TextField(ref=manual_desc_ref, label="Description (optional)", width=400),
-                    ft.TextField(ref=manual_start_ref, label="Start (YYYY-MM-DD HH:MM)", width=400, on_change=_update_manual_derived),
-                    ft.TextField(ref=manual_end_ref, label="End (YYYY-MM-DD HH:MM)", width=400, on_change=_update_manual_derived),
-                    ft.TextField(ref=manual_duration_ref, label="Duration (hours, e.g. 1.5 or 1:30)", width=400, on_change=_update_manual_derived),
-                    ft.Text(ref=manual_derived_ref, size=12, value="Fill exactly two of Start, End, Duration; the third will be shown here."),
+                    ft.TextField(ref=manual_start_ref, label="Start (YYYY-MM-DD HH:MM)", width=400, on_change=_on_manual_field_change),
+                    ft.TextField(ref=manual_end_ref, label="End (YYYY-MM-DD HH:MM)", width=400, on_change=_on_manual_field_change),
+                    ft.TextField(ref=manual_duration_ref, label="Duration (hours, e.g. 1.5 or 1:30)", width=400, on_change=_on_manual_field_change),
+                    ft.Text(ref=manual_derived_ref, size=12, value=MANUAL_DERIVED_HINT),
                     ft.Row(
                         [
                             ft.ElevatedButton("Add", icon=ft.Icons.ADD, on_click=on_manual_add),
@@ -1766,12 +1993,6 @@ class SentinelApp:
                 scroll=ft.ScrollMode.AUTO,
             ),
         )
-        # Store dialog reference for keyboard shortcut access
-        self.manual_entry_dialog_ref = manual_entry_dialog_ref
-        if page.data is None:
-            page.data = {}
-        page.data["_manual_entry_dialog"] = manual_entry_dialog
-
         page.overlay.append(manual_entry_dialog)
 
         manual_btn = ft.ElevatedButton(
@@ -1849,17 +2070,32 @@ class SentinelApp:
         parent_list_ref = ft.Ref[ft.Column]()
         parent_selection_text_ref = ft.Ref[ft.Text]()
         parent_expanded: set[str] = set()
+
+        # The tab's dialogs join page.overlay on first open, so unopened ones are never sent to the client.
+        mounted_dialogs: set[int] = set()
+
+        def _open_dialog(dialog: ft.AlertDialog) -> None:
+            if id(dialog) not in mounted_dialogs:
+                mounted_dialogs.add(id(dialog))
+                page.overlay.append(dialog)
+            dialog.open = True
     
         move_source: list = [None, None]
         merge_source: list = [None, None]
         move_options_data: list = []  # list of (id_or_None, path) set when dialog opens
         merge_options_data: list = []
+        # Client grouping of the options above, built once per dialog open (search only filters).
+        move_by_client_cache: list = [None]
+        merge_by_client_cache: list = [None]
+        # (id, path, lowercased path) for search, lowercased once per dialog open.
+        move_options_lower: list = []
+        merge_options_lower: list = []
         move_selected_ref: list = [None]  # (id_or_None, path)
         merge_selected_ref: list = [None]  # (id, path)
         move_search_ref = ft.Ref[ft.TextField]()
         merge_search_ref = ft.Ref[ft.TextField]()
-        move_list_ref = ft.Ref[ft.Column]()
-        merge_list_ref = ft.Ref[ft.Column]()
+        move_list_ref = ft.Ref[ft.ListView]()
+        merge_list_ref = ft.Ref[ft.ListView]()
         move_selection_text_ref = ft.Ref[ft.Text]()
         merge_selection_text_ref = ft.Ref[ft.Text]()
         move_expanded: set = set()
@@ -1868,7 +2104,7 @@ class SentinelApp:
         merge_dialog_ref = ft.Ref[ft.AlertDialog]()
         share_matter_id_holder: list = [None]
         share_path_holder: list = [None]
-        share_list_ref = ft.Ref[ft.Column]()
+        share_list_ref = ft.Ref[ft.ListView]()
         share_add_dropdown_ref = ft.Ref[ft.Dropdown]()
         share_dialog_ref = ft.Ref[ft.AlertDialog]()
         conflict_dialog_ref = ft.Ref[ft.AlertDialog]()
@@ -1876,6 +2112,7 @@ class SentinelApp:
     
         time_entries_matter_id: list = [None]
         time_entries_path: list = [None]
+        time_entries_shown: list[int] = [0]
         time_entries_list_ref = ft.Ref[ft.ListView]()
         time_entries_dialog_ref = ft.Ref[ft.AlertDialog]()
         edit_entry_id_ref: list = [None]
@@ -1892,50 +2129,126 @@ class SentinelApp:
     
         expanded_clients_matters: set[str] = set()
     
+        # (client_lc, path_lc, client, mid, path, code) rows for on_search; None until built, reset by refresh_list.
+        search_index: list = [None]
+
         def _by_client():
-            matters = self.db.get_all_matters()
-            path_list = self.db.get_matters_with_full_paths()
-            path_by_id = {mid: path for mid, path in path_list}
             cur = self.db.current_user_id
-            by_client: dict[str, list[tuple[int, str, str, bool, float | None]]] = defaultdict(list)
-            for m in matters:
-                path = path_by_id.get(m.id, m.name)
-                client = path.split(" > ")[0] if " > " in path else path
-                is_owner = cur is not None and m.owner_id == cur
-                rate = getattr(m, "hourly_rate_euro", None)
-                by_client[client].append((m.id, path, m.matter_code, is_owner, rate))
-            for client in by_client:
-                by_client[client].sort(key=lambda x: x[1])
+            # One sort by (client, path), then group consecutive rows per client.
+            tagged = [
+                (path.partition(" > ")[0], (mid, path, code, cur is not None and owner_id == cur, rate))
+                for mid, path, code, owner_id, rate in self.db.get_matters_with_full_paths_detailed()
+            ]
+            tagged.sort(key=lambda t: (t[0], t[1][1]))
+            by_client: dict[str, list[tuple[int, str, str, bool, float | None]]] = {
+                client: [item for _, item in group] for client, group in groupby(tagged, key=itemgetter(0))
+            }
             return by_client
 
-        def _client_sort_key(c: str, by_client: dict, sort_value: str) -> float:
+        def _client_sort_keys(by_client: dict, sort_value: str, budget_status_by_id: dict) -> dict[str, float]:
+            """Sort key per client, computed once per list build."""
             if sort_value == "most_used_budget":
-                all_mids = [mid for items in by_client.values() for mid, *_ in items]
-                budget_status_by_id = self.db.get_matter_budget_status_batch(all_mids)
-                items = by_client[c]
-                return max(
-                    (budget_status_by_id.get(mid, {}) or {}).get("ratio") or 0
-                    for mid, *_ in items
-                )
-            rows_data = self.db.get_time_by_client_and_matter_detailed()
-            client_sort_key_map: dict[str, float] = defaultdict(float)
-            for row in rows_data:
-                client_name, _, total_sec, not_inv_sec, *_ = row
-                if sort_value == "most_uninvoiced":
-                    client_sort_key_map[client_name] += not_inv_sec
-                else:
-                    client_sort_key_map[client_name] += total_sec
-            return client_sort_key_map.get(c, 0.0)
+                return {
+                    c: max(
+                        ((budget_status_by_id.get(mid, {}) or {}).get("ratio") or 0 for mid, *_ in items),
+                        default=0,
+                    )
+                    for c, items in by_client.items()
+                }
+            keys: dict[str, float] = {}
+            idx = 3 if sort_value == "most_uninvoiced" else 2
+            for row in self.db.get_time_by_client_and_matter_detailed():
+                keys[row[0]] = keys.get(row[0], 0.0) + row[idx]
+            return keys
     
+        # Matter tiles keyed by id with the data they were built from; unchanged rows are reused on refresh.
+        matter_tile_pool: dict[int, tuple[tuple, ft.ListTile]] = {}
+
+        def _make_matter_tile(mid: int, path: str, code: str, is_owner: bool, rate: float | None, budget_status: dict) -> ft.ListTile:
+            """Build one Manage Matters row (budget icon, code/rate/budget subtitle, actions menu)."""
+            display_path = path if is_owner else f"{path} (shared)"
+            leading_icon = None
+            if budget_status.get("budget_eur") is not None and budget_status["budget_eur"] > 0:
+                total = budget_status["total_eur"]
+                budget = budget_status["budget_eur"]
+                pct = int((budget_status.get("ratio") or 0) * 100)
+                budget_in = budget_status.get("budget_in")
+                budget_in_suffix = f" Budget in {budget_in}." if budget_in else ""
+                if budget_status.get("over_budget"):
+                    tooltip = f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – over budget.{budget_in_suffix}"
+                    leading_icon = ft.Icon(
+                        ft.Icons.WARNING,
+                        color=ft.Colors.RED,
+                        size=18,
+                        tooltip=tooltip,
+                    )
+                elif budget_status.get("near_budget"):
+                    tooltip = f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – near budget.{budget_in_suffix}"
+                    leading_icon = ft.Icon(
+                        ft.Icons.WARNING_AMBER,
+                        color=ft.Colors.ORANGE,
+                        size=18,
+                        tooltip=tooltip,
+                    )
+            rate_str = format_eur(rate) if rate is not None else "—"
+            budget_str = ""
+            if budget_status.get("budget_eur") is not None and budget_status["budget_eur"] > 0:
+                pct = int((budget_status.get("ratio") or 0) * 100)
+                if budget_status.get("over_budget"):
+                    budget_str = ft.Text(f"{pct}%", size=12, color=ft.Colors.RED)
+                elif budget_status.get("near_budget"):
+                    budget_str = ft.Text(f"{pct}%", size=12, color=ft.Colors.ORANGE)
+                else:
+                    budget_str = ft.Text(f"{pct}%", size=12, color=ft.Colors.GREY_400)
+            subtitle_parts = [ft.Text(f"{code} · {rate_str}", size=12)]
+            if budget_str:
+                subtitle_parts.append(ft.Text(" · ", size=12))
+                subtitle_parts.append(budget_str)
+            # One shared handler per menu; the item's data carries (action, matter id, path).
+            items_list = [
+                ft.PopupMenuItem(content="Edit rate…", data=("edit", mid, path), on_click=_on_matter_menu_click),
+                ft.PopupMenuItem(content="Move…", data=("move", mid, path), on_click=_on_matter_menu_click),
+                ft.PopupMenuItem(content="Merge…", data=("merge", mid, path), on_click=_on_matter_menu_click),
+                ft.PopupMenuItem(content="Time entries", data=("time_entries", mid, path), on_click=_on_matter_menu_click),
+            ]
+            # Log time only for non-root matters (time cannot be logged on clients)
+            if " > " in path:
+                items_list.insert(
+                    0,
+                    ft.PopupMenuItem(
+                        content="Log time",
+                        icon=ft.Icons.TIMER,
+                        data=("log_time", mid, path),
+                        on_click=_on_matter_menu_click,
+                    ),
+                )
+            if is_owner:
+                items_list.insert(
+                    0,
+                    ft.PopupMenuItem(content="Share…", data=("share", mid, path), on_click=_on_matter_menu_click),
+                )
+            return ft.ListTile(
+                leading=leading_icon,
+                title=ft.Text(display_path, size=14),
+                subtitle=ft.Row(subtitle_parts, wrap=True),
+                trailing=ft.PopupMenuButton(
+                    icon=ft.Icons.MORE_VERT,
+                    items=items_list,
+                    data=mid,
+                    on_open=_on_matter_menu_open,
+                ),
+            )
+
         def _build_list_controls(by_client: dict):
             sort_value = (page.data or {}).get("matters_sort") or "most_uninvoiced"
+            all_mids = [mid for items in by_client.values() for mid, *_ in items]
+            budget_status_by_id = self.db.get_matter_budget_status_batch(all_mids)
+            client_sort_key = _client_sort_keys(by_client, sort_value, budget_status_by_id)
             client_order = sorted(
                 by_client.keys(),
-                key=lambda c: _client_sort_key(c, by_client, sort_value),
+                key=lambda c: client_sort_key.get(c, 0.0),
                 reverse=True,
             )
-            all_mids = [mid for items in by_client.values() for mid, *_ in items]
-            budget_status_by_id = self.db.get_matter_budget_status_batch(all_mids)
             controls = []
             for client_name in client_order:
                 items = by_client[client_name]
@@ -1952,133 +2265,68 @@ class SentinelApp:
                 )
                 menu_items_builder = []
                 for mid, path, code, is_owner, rate in items:
-                    display_path = path if is_owner else f"{path} (shared)"
                     budget_status = budget_status_by_id.get(mid, {})
-                    leading_icon = None
-                    if budget_status.get("budget_eur") is not None and budget_status["budget_eur"] > 0:
-                        total = budget_status["total_eur"]
-                        budget = budget_status["budget_eur"]
-                        pct = int((budget_status.get("ratio") or 0) * 100)
-                        budget_in = budget_status.get("budget_in")
-                        budget_in_suffix = f" Budget in {budget_in}." if budget_in else ""
-                        if budget_status.get("over_budget"):
-                            tooltip = f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – over budget.{budget_in_suffix}"
-                            leading_icon = ft.Icon(
-                                ft.Icons.WARNING,
-                                color=ft.Colors.RED,
-                                size=18,
-                                tooltip=tooltip,
-                            )
-                        elif budget_status.get("near_budget"):
-                            tooltip = f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – near budget.{budget_in_suffix}"
-                            leading_icon = ft.Icon(
-                                ft.Icons.WARNING_AMBER,
-                                color=ft.Colors.ORANGE,
-                                size=18,
-                                tooltip=tooltip,
-                            )
-                    rate_str = format_eur(rate) if rate is not None else "—"
-                    budget_str = ""
-                    if budget_status.get("budget_eur") is not None and budget_status["budget_eur"] > 0:
-                        pct = int((budget_status.get("ratio") or 0) * 100)
-                        if budget_status.get("over_budget"):
-                            budget_str = ft.Text(f"{pct}%", size=12, color=ft.Colors.RED)
-                        elif budget_status.get("near_budget"):
-                            budget_str = ft.Text(f"{pct}%", size=12, color=ft.Colors.ORANGE)
-                        else:
-                            budget_str = ft.Text(f"{pct}%", size=12, color=ft.Colors.GREY_400)
-                    subtitle_parts = [ft.Text(f"{code} · {rate_str}", size=12)]
-                    if budget_str:
-                        subtitle_parts.append(ft.Text(" · ", size=12))
-                        subtitle_parts.append(budget_str)
-                    items_list = [
-                        ft.PopupMenuItem(
-                            content="Edit rate…",
-                            on_click=lambda e, m=mid, p=path: open_edit_matter_dialog(m, p),
-                        ),
-                        ft.PopupMenuItem(
-                            content="Move…",
-                            on_click=lambda e, m=mid, p=path: open_move_dialog(m, p),
-                        ),
-                        ft.PopupMenuItem(
-                            content="Merge…",
-                            on_click=lambda e, m=mid, p=path: open_merge_dialog(m, p),
-                        ),
-                        ft.PopupMenuItem(
-                            content="Time entries",
-                            on_click=lambda e, m=mid, p=path: open_time_entries_dialog(m, p),
-                        ),
-                    ]
-                    # Log time only for non-root matters (time cannot be logged on clients)
-                    if " > " in path:
-                        items_list.insert(
-                            0,
-                            ft.PopupMenuItem(
-                                content="Log time",
-                                icon=ft.Icons.TIMER,
-                                on_click=lambda e, m=mid: _on_log_time(m),
-                            ),
-                        )
-                    if is_owner:
-                        items_list.insert(
-                            0,
-                            ft.PopupMenuItem(
-                                content="Share…",
-                                on_click=lambda e, m=mid, p=path: open_share_dialog(m, p),
-                            ),
-                        )
-                    menu_items_builder.append(
-                        ft.ListTile(
-                            leading=leading_icon,
-                            title=ft.Text(display_path, size=14),
-                            subtitle=ft.Row(subtitle_parts, wrap=True),
-                            trailing=ft.PopupMenuButton(
-                                icon=ft.Icons.MORE_VERT,
-                                items=items_list,
-                            ),
-                        )
-                    )
+                    signature = (path, code, is_owner, rate, tuple(budget_status.items()))
+                    pooled = matter_tile_pool.get(mid)
+                    if pooled is None or pooled[0] != signature:
+                        pooled = matter_tile_pool[mid] = (signature, _make_matter_tile(mid, path, code, is_owner, rate, budget_status))
+                    menu_items_builder.append(pooled[1])
                 controls.append(
                     ft.Container(
                         content=ft.Column(menu_items_builder),
                         visible=is_expanded,
-                        padding=ft.Padding.only(left=24),
+                        padding=PAD_LEFT_24,
                     ),
                 )
+            for stale_mid in matter_tile_pool.keys() - set(all_mids):
+                del matter_tile_pool[stale_mid]
             return controls
     
         def _on_toggle_client(client_name: str):
-            expanded_clients_matters.symmetric_difference_update([client_name])
+            _toggle_member(expanded_clients_matters, client_name)
             refresh_list()
 
+        def _on_matter_menu_click(e):
+            """Dispatch a matter popup-menu item to its dialog using the item's data."""
+            action, mid, path = e.control.data
+            if action == "log_time":
+                _on_log_time(mid)
+                return
+            handlers = {
+                "share": open_share_dialog,
+                "edit": open_edit_matter_dialog,
+                "move": open_move_dialog,
+                "merge": open_merge_dialog,
+                "time_entries": open_time_entries_dialog,
+            }
+            handlers[action](mid, path)
+
         def _on_log_time(matter_id: int):
             """Switch to Timer tab and select this matter for logging time."""
             if page.data is None:
                 page.data = {}
             page.data["timer_select_matter_id"] = matter_id
-            cb = page.data.get("show_timer_callback")
+            cb = self._show_timer
             if callable(cb):
                 cb(None)
             page.update()
     
         def _options_by_client(options: list, include_root: bool) -> dict:
             """Group (id, path) options by client (first path segment). Root option in key '— Root (new client) —'."""
-            by_client = defaultdict(list)
+            by_client: dict[str, list] = {}
             if include_root and options and options[0][0] is None:
-                by_client["— Root (new client) —"].append(options[0])
+                by_client["— Root (new client) —"] = [options[0]]
                 options = options[1:]
-            for pid, ptext in options:
-                client = ptext.split(" > ")[0] if " > " in ptext else ptext
-                by_client[client].append((pid, ptext))
-            for client in by_client:
-                by_client[client].sort(key=lambda x: x[1])
+            tagged = sorted(((ptext.partition(" > ")[0], pid, ptext) for pid, ptext in options), key=itemgetter(0, 2))
+            for client, group in groupby(tagged, key=itemgetter(0)):
+                by_client.setdefault(client, []).extend((pid, ptext) for _, pid, ptext in group)
             return by_client
     
         def _build_move_list_controls(query: str):
-            by_client = _options_by_client(move_options_data, include_root=True)
             q = (query or "").strip().lower()
             if q:
-                flat = [(pid, ptext) for pid, ptext in move_options_data if ptext and q in ptext.lower()][:15]
+                # Stop scanning once 15 matches are found.
+                flat = list(islice(((pid, ptext) for pid, ptext, low in move_options_lower if q in low), 15))
                 return [
                     ft.ListTile(
                         title=ft.Text(ptext, size=14),
@@ -2088,6 +2336,9 @@ class SentinelApp:
                     )
                     for pid, ptext in flat
                 ]
+            by_client = move_by_client_cache[0]
+            if by_client is None:
+                by_client = move_by_client_cache[0] = _options_by_client(move_options_data, include_root=True)
             controls = []
             for client_name in sorted(by_client.keys()):
                 items = by_client[client_name]
@@ -2120,13 +2371,13 @@ class SentinelApp:
                             ],
                         ),
                         visible=is_exp,
-                        padding=ft.Padding.only(left=20),
+                        padding=PAD_LEFT_20,
                     ),
                 )
             return controls
     
         def _on_toggle_move_expanded(client_name: str):
-            move_expanded.symmetric_difference_update([client_name])
+            _toggle_member(move_expanded, client_name)
             if move_list_ref.current:
                 move_list_ref.current.controls = _build_move_list_controls(move_search_ref.current.value if move_search_ref.current else "")
                 move_list_ref.current.update()
@@ -2135,16 +2386,15 @@ class SentinelApp:
             move_selected_ref[0] = (pid, ptext)
             if move_selection_text_ref.current:
                 move_selection_text_ref.current.value = f"Selected: {ptext}"
-                move_selection_text_ref.current.update()
             if move_list_ref.current:
                 move_list_ref.current.controls = _build_move_list_controls(move_search_ref.current.value if move_search_ref.current else "")
-                move_list_ref.current.update()
+            page.update()
     
         def _build_merge_list_controls(query: str):
-            by_client = _options_by_client(merge_options_data, include_root=False)
             q = (query or "").strip().lower()
             if q:
-                flat = [(pid, ptext) for pid, ptext in merge_options_data if ptext and q in ptext.lower()][:15]
+                # Stop scanning once 15 matches are found.
+                flat = list(islice(((pid, ptext) for pid, ptext, low in merge_options_lower if q in low), 15))
                 return [
                     ft.ListTile(
                         title=ft.Text(ptext, size=14),
@@ -2154,6 +2404,9 @@ class SentinelApp:
                     )
                     for pid, ptext in flat
                 ]
+            by_client = merge_by_client_cache[0]
+            if by_client is None:
+                by_client = merge_by_client_cache[0] = _options_by_client(merge_options_data, include_root=False)
             controls = []
             for client_name in sorted(by_client.keys()):
                 items = by_client[client_name]
@@ -2180,13 +2433,13 @@ class SentinelApp:
                             ],
                         ),
                         visible=is_exp,
-                        padding=ft.Padding.only(left=20),
+                        padding=PAD_LEFT_20,
                     ),
                 )
             return controls
     
         def _on_toggle_merge_expanded(client_name: str):
-            merge_expanded.symmetric_difference_update([client_name])
+            _toggle_member(merge_expanded, client_name)
             if merge_list_ref.current:
                 merge_list_ref.current.controls = _build_merge_list_controls(merge_search_ref.current.value if merge_search_ref.current else "")
                 merge_list_ref.current.update()
@@ -2195,10 +2448,9 @@ class SentinelApp:
             merge_selected_ref[0] = (pid, ptext)
             if merge_selection_text_ref.current:
                 merge_selection_text_ref.current.value = f"Selected: {ptext}"
-                merge_selection_text_ref.current.update()
             if merge_list_ref.current:
                 merge_list_ref.current.controls = _build_merge_list_controls(merge_search_ref.current.value if merge_search_ref.current else "")
-                merge_list_ref.current.update()
+            page.update()
 
         def on_move_search(e):
             if move_list_ref.current and move_search_ref.current:
@@ -2210,15 +2462,37 @@ class SentinelApp:
                 merge_list_ref.current.controls = _build_merge_list_controls(e.control.value or "")
                 merge_list_ref.current.update()
     
+        # Single slot (mid, fetched_at, targets incl. root option), prefetched when a matter's menu opens;
+        # opening another menu overwrites it, so dismissed menus leave nothing behind.
+        move_merge_targets_cache: list[tuple[int, float, list[tuple[int | None, str]]] | None] = [None]
+
+        async def _prefetch_move_merge_targets(mid: int):
+            targets = await asyncio.to_thread(
+                self.db.get_matters_with_full_paths_excluding, mid, include_root_option=True
+            )
+            move_merge_targets_cache[0] = (mid, monotonic(), targets)
+
+        def _on_matter_menu_open(e):
+            """Start loading Move/Merge targets while the user is still picking a menu item."""
+            page.run_task(_prefetch_move_merge_targets, e.control.data)
+
+        def _move_merge_targets(mid: int) -> list[tuple[int | None, str]]:
+            hit, move_merge_targets_cache[0] = move_merge_targets_cache[0], None
+            if hit is not None and hit[0] == mid and monotonic() - hit[1] < MOVE_MERGE_PREFETCH_TTL:
+                return hit[2]
+            return self.db.get_matters_with_full_paths_excluding(mid, include_root_option=True)
+
         def open_move_dialog(mid: int, path: str):
             move_source[0], move_source[1] = mid, path
-            move_options_data[:] = self.db.get_matters_with_full_paths_excluding(mid, include_root_option=True)
+            move_options_data[:] = _move_merge_targets(mid)
+            move_by_client_cache[0] = _options_by_client(move_options_data, include_root=True)
+            move_options_lower[:] = [(pid, ptext, ptext.lower()) for pid, ptext in move_options_data if ptext]
             first = (move_options_data[0][0], move_options_data[0][1]) if move_options_data else (None, "")
             move_selected_ref[0] = first
             move_expanded.clear()
             if move_dialog_ref.current:
                 move_dialog_ref.current.title = ft.Text(f"Move '{path}' to")
-                move_dialog_ref.current.open = True
+                _open_dialog(move_dialog)
             if move_search_ref.current:
                 move_search_ref.current.value = ""
             if move_selection_text_ref.current:
@@ -2240,8 +2514,8 @@ class SentinelApp:
                 return
             if move_dialog_ref.current:
                 move_dialog_ref.current.open = False
-            refresh_list()
-            refresh_parent_list()
+            refresh_list(update=False)
+            refresh_parent_list(update=False)
             if on_matters_changed:
                 on_matters_changed()
             page.snack_bar = ft.SnackBar(ft.Text("Matter moved."), open=True)
@@ -2254,13 +2528,15 @@ class SentinelApp:
     
         def open_merge_dialog(mid: int, path: str):
             merge_source[0], merge_source[1] = mid, path
-            merge_options_data[:] = self.db.get_matters_with_full_paths_excluding(mid, include_root_option=False)
+            merge_options_data[:] = [t for t in _move_merge_targets(mid) if t[0] is not None]  # No root option
+            merge_by_client_cache[0] = _options_by_client(merge_options_data, include_root=False)
+            merge_options_lower[:] = [(pid, ptext, ptext.lower()) for pid, ptext in merge_options_data if ptext]
             first = (merge_options_data[0][0], merge_options_data[0][1]) if merge_options_data else (None, "")
             merge_selected_ref[0] = first
             merge_expanded.clear()
             if merge_dialog_ref.current:
                 merge_dialog_ref.current.title = ft.Text(f"Merge '{path}' into")
-                merge_dialog_ref.current.open = True
+                _open_dialog(merge_dialog)
             if merge_search_ref.current:
                 merge_search_ref.current.value = ""
             if merge_selection_text_ref.current:
@@ -2282,8 +2558,8 @@ class SentinelApp:
                 return
             if merge_dialog_ref.current:
                 merge_dialog_ref.current.open = False
-            refresh_list()
-            refresh_parent_list()
+            refresh_list(update=False)
+            refresh_parent_list(update=False)
             if on_matters_changed:
                 on_matters_changed()
             page.snack_bar = ft.SnackBar(ft.Text("Matters merged."), open=True)
@@ -2294,44 +2570,68 @@ class SentinelApp:
                 merge_dialog_ref.current.open = False
             page.update()
     
-        def _build_share_list_controls():
-            mid = share_matter_id_holder[0]
+        def _loading_placeholder() -> ft.Control:
+            """Spinner row shown in a dialog list while its rows load off the UI thread."""
+            return ft.Container(content=ft.ProgressRing(width=24, height=24), alignment=ft.Alignment.CENTER, padding=16)
+
+        def _shared_users(mid: int | None) -> list:
             if mid is None:
                 return []
             try:
-                users = self.db.list_matter_shares(mid)
+                return self.db.list_matter_shares(mid)
             except ValueError:
                 return []
+
+        def _build_share_list_controls(users: list | None = None):
+            if users is None:
+                users = _shared_users(share_matter_id_holder[0])
             return [
                 ft.ListTile(
                     title=ft.Text(u.username, size=14),
                     trailing=ft.IconButton(
                         icon=ft.Icons.PERSON_REMOVE,
-                        on_click=lambda e, uid=u.id: on_share_remove(uid),
+                        data=u.id,
+                        on_click=lambda e: on_share_remove(e.control.data),
                     ),
                 )
                 for u in users
             ]
     
-        def refresh_share_list():
+        def refresh_share_list(update: bool = True):
             if share_list_ref.current:
                 share_list_ref.current.controls = _build_share_list_controls()
-                share_list_ref.current.update()
+                if update:
+                    share_list_ref.current.update()
     
-        def open_share_dialog(mid: int, path: str):
-            share_matter_id_holder[0] = mid
-            share_path_holder[0] = path
-            if share_dialog_ref.current:
-                share_dialog_ref.current.title = ft.Text(f"Share: {path}")
-                share_dialog_ref.current.open = True
-            refresh_share_list()
+        async def _load_share_lists(mid: int):
+            # Current shares and share candidates are independent: fetch both at once.
+            users, opts = await asyncio.gather(
+                asyncio.to_thread(_shared_users, mid),
+                asyncio.to_thread(self.db.list_users_for_share),
+            )
+            if share_matter_id_holder[0] != mid:
+                return  # Dialog reopened for another matter meanwhile.
+            if share_list_ref.current:
+                share_list_ref.current.controls = _build_share_list_controls(users)
             if share_add_dropdown_ref.current:
-                opts = self.db.list_users_for_share()
                 share_add_dropdown_ref.current.options = [
                     ft.DropdownOption(key=str(uid), text=uname) for uid, uname in opts
                 ]
+            page.update()
+
+        def open_share_dialog(mid: int, path: str):
+            share_matter_id_holder[0] = mid
+            share_path_holder[0] = path
+            if share_dialog_ref.current:
+                share_dialog_ref.current.title = ft.Text(f"Share: {path}")
+                _open_dialog(share_dialog)
+            if share_list_ref.current:
+                share_list_ref.current.controls = [_loading_placeholder()]
+            if share_add_dropdown_ref.current:
+                share_add_dropdown_ref.current.options = []
                 share_add_dropdown_ref.current.value = None
             page.update()
+            page.run_task(_load_share_lists, mid)
     
         def on_share_add(_):
             mid = share_matter_id_holder[0]
@@ -2342,22 +2642,19 @@ class SentinelApp:
                 user_id = int(share_add_dropdown_ref.current.value)
             except (TypeError, ValueError):
                 return
-            conflict = self.db.find_owned_matter_with_same_path(user_id, path)
-            if conflict is not None:
-                other_mid, _ = conflict
-                user = self.db.get_user(user_id)
-                username = user.username if user else str(user_id)
-                conflict_data_holder[0] = (mid, user_id, other_mid, path, username)
-                if conflict_dialog_ref.current:
-                    conflict_dialog_ref.current.title = ft.Text(
-                        f"User {username} has a matter with the same name. Merge their matter into this one?"
-                    )
-                    conflict_dialog_ref.current.open = True
-                page.update()
-                return
             try:
-                self.db.add_matter_share(mid, user_id)
-                refresh_share_list()
+                conflict = self.db.try_share_matter(mid, user_id)
+                if conflict is not None:
+                    other_mid, username = conflict
+                    conflict_data_holder[0] = (mid, user_id, other_mid, path, username)
+                    if conflict_dialog_ref.current:
+                        conflict_dialog_ref.current.title = ft.Text(
+                            f"User {username} has a matter with the same name. Merge their matter into this one?"
+                        )
+                        _open_dialog(conflict_dialog)
+                    page.update()
+                    return
+                refresh_share_list(update=False)
                 share_add_dropdown_ref.current.value = None
                 page.snack_bar = ft.SnackBar(ft.Text("Matter shared."), open=True)
             except ValueError as err:
@@ -2370,7 +2667,7 @@ class SentinelApp:
                 return
             try:
                 self.db.remove_matter_share(mid, user_id)
-                refresh_share_list()
+                refresh_share_list(update=False)
                 page.snack_bar = ft.SnackBar(ft.Text("Share removed."), open=True)
             except ValueError as err:
                 page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
@@ -2386,10 +2683,9 @@ class SentinelApp:
             mid, user_id, other_mid, path, username = data
             conflict_data_holder[0] = None
             try:
-                self.db.merge_other_user_matter_into_mine(other_mid, mid)
-                self.db.add_matter_share(mid, user_id)
-                refresh_share_list()
-                refresh_list()
+                self.db.merge_and_share_matter(other_mid, mid, user_id)
+                refresh_share_list(update=False)
+                refresh_list(update=False)
                 if on_matters_changed:
                     on_matters_changed()
                 page.snack_bar = ft.SnackBar(
@@ -2415,136 +2711,151 @@ class SentinelApp:
                 share_dialog_ref.current.open = False
             page.update()
     
-        def _build_time_entries_list_controls():
-            mid = time_entries_matter_id[0]
-            if mid is None:
-                return []
-            entries = self.db.get_time_entries_by_matter(mid)
-            controls = []
-            for entry in entries:
-                desc = (entry.description or "")[:40] + ("…" if (entry.description or "") and len(entry.description or "") > 40 else "")
-                end_str = format_datetime(entry.end_time) if entry.end_time else "Running"
-                dur_sec = entry.duration_seconds or 0.0
-                dur_str = format_elapsed(dur_sec) if dur_sec else ("—" if entry.end_time else "—")
-                rate, rate_source = self.db.get_resolved_hourly_rate(entry.matter_id, entry.owner_id)
-                amount_eur = self.db.amount_eur_from_seconds(dur_sec, rate)
-                amount_color = _rate_source_color(rate_source)
+        # Row buttons carry their TimeEntry in ``data`` so every row shares these handlers.
+        def _on_continue_from_dialog(e):
+            ent = e.control.data
+            try:
+                self.db.continue_time_entry(ent.id)
+                refresh_time_entries_list(update=False)
+                page.snack_bar = ft.SnackBar(ft.Text("Continued task; new entry is running. Switch to Timer to see it."), open=True)
+            except ValueError as err:
+                page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
+            page.update()
 
-                def _on_continue_from_dialog(ent):
-                    try:
-                        self.db.continue_time_entry(ent.id)
-                        refresh_time_entries_list()
-                        page.snack_bar = ft.SnackBar(ft.Text("Continued task; new entry is running. Switch to Timer to see it."), open=True)
-                    except ValueError as err:
-                        page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
-                    page.update()
+        def _on_delete_entry(e):
+            """Open delete confirmation dialog for the time entry."""
+            ent = e.control.data
+            def on_confirm(_):
+                try:
+                    self.db.delete_time_entry(ent.id)
+                    page.snack_bar = ft.SnackBar(ft.Text("Entry deleted."), open=True)
+                except ValueError as err:
+                    page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
+                dialog.open = False
+                refresh_time_entries_list(update=False)
+                page.update()
 
-                def _on_delete_entry(ent):
-                    """Open delete confirmation dialog for the time entry."""
-                    def on_confirm(_):
-                        try:
-                            self.db.delete_time_entry(ent.id)
-                            page.snack_bar = ft.SnackBar(ft.Text("Entry deleted."), open=True)
-                        except ValueError as err:
-                            page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
-                        dialog.open = False
-                        refresh_time_entries_list()
-                        page.update()
+            def on_cancel(_):
+                dialog.open = False
+                page.update()
 
-                    def on_cancel(_):
-                        dialog.open = False
-                        page.update()
+            dialog = ft.AlertDialog(
+                title=ft.Text("Delete time entry"),
+                content=ft.Text(
+                    "Are you sure you want to delete this time entry? This cannot be undone.",
+                    size=12,
+                ),
+                actions=[
+                    ft.TextButton("Delete", on_click=on_confirm),
+                    ft.TextButton("Cancel", on_click=on_cancel),
+                ],
+                actions_alignment=ft.MainAxisAlignment.END,
+            )
+            page.overlay.append(dialog)
+            dialog.open = True
+            page.update()
 
-                    dialog = ft.AlertDialog(
-                        title=ft.Text("Delete time entry"),
-                        content=ft.Text(
-                            "Are you sure you want to delete this time entry? This cannot be undone.",
-                            size=12,
-                        ),
-                        actions=[
-                            ft.TextButton("Delete", on_click=on_confirm),
-                            ft.TextButton("Cancel", on_click=on_cancel),
-                        ],
-                        actions_alignment=ft.MainAxisAlignment.END,
-                    )
-                    page.overlay.append(dialog)
-                    dialog.open = True
-                    page.update()
+        def _on_change_date_entry(e):
+            """Open change date dialog for the time entry."""
+            ent = e.control.data
+            if ent.end_time is None:
+                page.snack_bar = ft.SnackBar(
+                    ft.Text("Stop the timer for this entry before changing its date."),
+                    open=True,
+                )
+                page.update()
+                return
 
-                def _on_change_date_entry(ent):
-                    """Open change date dialog for the time entry."""
-                    if ent.end_time is None:
-                        page.snack_bar = ft.SnackBar(
-                            ft.Text("Stop the timer for this entry before changing its date."),
-                            open=True,
-                        )
-                        page.update()
-                        return
+            date_field = ft.TextField(
+                label="New date (YYYY-MM-DD)",
+                width=200,
+                value=ent.start_time.date().isoformat(),
+            )
 
-                    date_field = ft.TextField(
-                        label="New date (YYYY-MM-DD)",
-                        width=200,
-                        value=ent.start_time.date().isoformat(),
+            def on_save(_):
+                raw = (date_field.value or "").strip()
+                try:
+                    new_date = datetime.strptime(raw, "%Y-%m-%d").date()
+                except ValueError:
+                    page.snack_bar = ft.SnackBar(
+                        ft.Text("Invalid date. Use YYYY-MM-DD."), open=True
                     )
+                    page.update()
+                    return
 
-                    def on_save(_):
-                        raw = (date_field.value or "").strip()
-                        try:
-                            new_date = datetime.strptime(raw, "%Y-%m-%d").date()
-                        except ValueError:
-                            page.snack_bar = ft.SnackBar(
-                                ft.Text("Invalid date. Use YYYY-MM-DD."), open=True
-                            )
-                            page.update()
-                            return
-
-                        start_t = ent.start_time.time()
-                        end_t = ent.end_time.time() if ent.end_time else None
-                        new_start = datetime.combine(new_date, start_t)
-                        kwargs: dict = {
-                            "start_time": new_start,
-                            "duration_seconds": ent.duration_seconds or 0.0,
-                        }
-                        if end_t is not None:
-                            new_end = datetime.combine(new_date, end_t)
-                            kwargs["end_time"] = new_end
-                        try:
-                            self.db.update_time_entry(ent.id, **kwargs)
-                            page.snack_bar = ft.SnackBar(ft.Text("Date updated."), open=True)
-                        except ValueError as err:
-                            page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
-                        if time_entries_dialog_ref.current:
-                            time_entries_dialog_ref.current.open = False
-                        refresh_time_entries_list()
-                        page.update()
+                start_t = ent.start_time.time()
+                end_t = ent.end_time.time() if ent.end_time else None
+                new_start = datetime.combine(new_date, start_t)
+                kwargs: dict = {
+                    "start_time": new_start,
+                    "duration_seconds": ent.duration_seconds or 0.0,
+                }
+                if end_t is not None:
+                    new_end = datetime.combine(new_date, end_t)
+                    kwargs["end_time"] = new_end
+                try:
+                    self.db.update_time_entry(ent.id, **kwargs)
+                    page.snack_bar = ft.SnackBar(ft.Text("Date updated."), open=True)
+                except ValueError as err:
+                    page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
+                if time_entries_dialog_ref.current:
+                    time_entries_dialog_ref.current.open = False
+                refresh_time_entries_list(update=False)
+                page.update()
 
-                    def on_cancel(_):
-                        if time_entries_dialog_ref.current:
-                            time_entries_dialog_ref.current.open = False
-                        page.update()
+            def on_cancel(_):
+                if time_entries_dialog_ref.current:
+                    time_entries_dialog_ref.current.open = False
+                page.update()
 
-                    dialog = ft.AlertDialog(
-                        title=ft.Text("Change entry date"),
-                        content=ft.Column(
-                            [
-                                ft.Text(
-                                    "Change the calendar day of this entry. Start and end times stay the same.",
-                                    size=12,
-                                    width=360,
-                                ),
-                                date_field,
-                            ],
-                            tight=True,
+            dialog = ft.AlertDialog(
+                title=ft.Text("Change entry date"),
+                content=ft.Column(
+                    [
+                        ft.Text(
+                            "Change the calendar day of this entry. Start and end times stay the same.",
+                            size=12,
+                            width=360,
                         ),
-                        actions=[
-                            ft.TextButton("Save", on_click=on_save),
-                            ft.TextButton("Cancel", on_click=on_cancel),
-                        ],
-                        actions_alignment=ft.MainAxisAlignment.END,
-                    )
-                    page.overlay.append(dialog)
-                    dialog.open = True
-                    page.update()
+                        date_field,
+                    ],
+                    tight=True,
+                ),
+                actions=[
+                    ft.TextButton("Save", on_click=on_save),
+                    ft.TextButton("Cancel", on_click=on_cancel),
+                ],
+                actions_alignment=ft.MainAxisAlignment.END,
+            )
+            page.overlay.append(dialog)
+            dialog.open = True
+            page.update()
+
+        def _on_edit_entry_click(e):
+            open_edit_entry_dialog(e.control.data)
+
+        def _build_time_entries_list_controls(offset: int = 0, limit: int = TIME_ENTRIES_PAGE_SIZE):
+            """Rows for one page of the matter's entries, plus a "Show more" button if more remain."""
+            mid = time_entries_matter_id[0]
+            if mid is None:
+                return []
+            entries = self.db.get_time_entries_by_matter(mid, limit=limit + 1, offset=offset)
+            has_more = len(entries) > limit
+            del entries[limit:]
+            time_entries_shown[0] = offset + len(entries)
+            rates_by_key = self.db.get_resolved_hourly_rates_batch(entries)
+            controls = []
+            for entry in entries:
+                desc = entry.description or ""
+                if len(desc) > 40:
+                    desc = desc[:40] + "…"
+                end_time = entry.end_time
+                end_str = format_datetime(end_time) if end_time else "Running"
+                dur_sec = entry.duration_seconds or 0.0
+                dur_str = format_elapsed(dur_sec) if dur_sec else "—"
+                rate, rate_source = rates_by_key[(entry.matter_id, entry.owner_id)]
+                amount_eur = self.db.amount_eur_from_seconds(dur_sec, rate)
+                amount_color = _rate_source_color(rate_source)
 
                 controls.append(
                     ft.Container(
@@ -2557,20 +2868,23 @@ class SentinelApp:
                                             [
                                                 ft.OutlinedButton(
                                                     content=ft.Text("Continue", size=9, no_wrap=True),
-                                                    on_click=lambda e, ent=entry: _on_continue_from_dialog(ent),
+                                                    data=entry,
+                                                    on_click=_on_continue_from_dialog,
                                                 ),
-                                                ft.IconButton(icon=ft.Icons.EDIT, on_click=lambda e, ent=entry: open_edit_entry_dialog(ent)),
+                                                ft.IconButton(icon=ft.Icons.EDIT, data=entry, on_click=_on_edit_entry_click),
                                                 ft.IconButton(
                                                     icon=ft.Icons.EVENT,
                                                     tooltip="Change date",
                                                     icon_size=18,
-                                                    on_click=lambda e, ent=entry: _on_change_date_entry(ent),
+                                                    data=entry,
+                                                    on_click=_on_change_date_entry,
                                                 ),
                                                 ft.IconButton(
                                                     icon=ft.Icons.DELETE_OUTLINE,
                                                     tooltip="Delete this entry",
                                                     icon_size=18,
-                                                    on_click=lambda e, ent=entry: _on_delete_entry(ent),
+                                                    data=entry,
+                                                    on_click=_on_delete_entry,
                                                 ),
                                             ],
                                             spacing=4,
@@ -2580,30 +2894,52 @@ class SentinelApp:
                                 ft.Row(
                                     [
                                         ft.Text(f"{format_datetime(entry.start_time)} → {end_str}  ·  {dur_str}", size=12),
-                                        ft.Text("  ", size=12),
                                         ft.Text(format_eur(amount_eur), size=12, color=amount_color),
                                     ],
+                                    spacing=24,  # Replaces a blank spacer Text between time and amount.
                                 ),
                             ],
                         ),
                     ),
                 )
+            if has_more:
+                controls.append(ft.TextButton("Show more", icon=ft.Icons.EXPAND_MORE, on_click=_on_show_more_time_entries))
             return controls
+
+        def _on_show_more_time_entries(_):
+            lv = time_entries_list_ref.current
+            if lv is None:
+                return
+            lv.controls.pop()  # The "Show more" button itself.
+            lv.controls.extend(_build_time_entries_list_controls(offset=time_entries_shown[0]))
+            lv.update()
     
-        def refresh_time_entries_list():
+        def refresh_time_entries_list(update: bool = True):
             if time_entries_list_ref.current:
-                time_entries_list_ref.current.controls = _build_time_entries_list_controls()
-                page.update()
+                # Keep as many rows loaded as before the edit.
+                time_entries_list_ref.current.controls = _build_time_entries_list_controls(
+                    limit=max(time_entries_shown[0], TIME_ENTRIES_PAGE_SIZE)
+                )
+                if update:
+                    page.update()
     
+        async def _load_time_entries(mid: int):
+            controls = await asyncio.to_thread(_build_time_entries_list_controls)
+            # Drop the result if the dialog was reopened for another matter meanwhile.
+            if time_entries_matter_id[0] == mid and time_entries_list_ref.current:
+                time_entries_list_ref.current.controls = controls
+                page.update()
+
         def open_time_entries_dialog(mid: int, path: str):
             time_entries_matter_id[0] = mid
             time_entries_path[0] = path
             if time_entries_dialog_ref.current:
                 time_entries_dialog_ref.current.title = ft.Text(f"Time entries: {path}")
-                time_entries_dialog_ref.current.open = True
+                _open_dialog(time_entries_dialog)
             if time_entries_list_ref.current:
-                time_entries_list_ref.current.controls = _build_time_entries_list_controls()
+                time_entries_list_ref.current.controls = [_loading_placeholder()]
             page.update()
+            page.run_task(_load_time_entries, mid)
     
         def on_time_entries_add(_):
             open_add_entry_dialog()
@@ -2619,7 +2955,7 @@ class SentinelApp:
             if edit_duration_ref.current:
                 edit_duration_ref.current.value = str(round((entry.duration_seconds or 0) / 3600, 2)) if entry.duration_seconds else ""
             if edit_entry_dialog_ref.current:
-                edit_entry_dialog_ref.current.open = True
+                _open_dialog(edit_entry_dialog)
             page.update()
     
         def on_edit_entry_save(_):
@@ -2643,7 +2979,7 @@ class SentinelApp:
                 return
             if edit_entry_dialog_ref.current:
                 edit_entry_dialog_ref.current.open = False
-            refresh_time_entries_list()
+            refresh_time_entries_list(update=False)
             page.snack_bar = ft.SnackBar(ft.Text("Entry updated."), open=True)
             page.update()
     
@@ -2662,17 +2998,21 @@ class SentinelApp:
             if add_duration_ref.current:
                 add_duration_ref.current.value = ""
             if add_entry_dialog_ref.current:
-                add_entry_dialog_ref.current.open = True
+                _open_dialog(add_entry_dialog)
             page.update()
     
         def on_add_entry_save(_):
             mid = time_entries_matter_id[0]
             if mid is None:
                 return
-            desc = (add_desc_ref.current.value or "").strip() if add_desc_ref.current else ""
-            start_s = add_start_ref.current.value if add_start_ref.current else ""
-            end_s = add_end_ref.current.value if add_end_ref.current else ""
-            dur_s = add_duration_ref.current.value if add_duration_ref.current else ""
+            desc_ctl = add_desc_ref.current
+            start_ctl = add_start_ref.current
+            end_ctl = add_end_ref.current
+            dur_ctl = add_duration_ref.current
+            desc = (desc_ctl.value or "").strip() if desc_ctl else ""
+            start_s = start_ctl.value if start_ctl else ""
+            end_s = end_ctl.value if end_ctl else ""
+            dur_s = dur_ctl.value if dur_ctl else ""
             start_t, end_t, dur = _compute_third_time_static(start_s, end_s, dur_s)
             if start_t is None or end_t is None or dur is None:
                 page.snack_bar = ft.SnackBar(ft.Text("Fill exactly two of Start, End, Duration."), open=True)
@@ -2684,9 +3024,10 @@ class SentinelApp:
                 page.snack_bar = ft.SnackBar(ft.Text(str(err)), open=True)
                 page.update()
                 return
-            if add_entry_dialog_ref.current:
-                add_entry_dialog_ref.current.open = False
-            refresh_time_entries_list()
+            dialog = add_entry_dialog_ref.current
+            if dialog:
+                dialog.open = False
+            refresh_time_entries_list(update=False)
             page.snack_bar = ft.SnackBar(ft.Text("Entry added."), open=True)
             page.update()
     
@@ -2710,98 +3051,107 @@ class SentinelApp:
         edit_matter_dialog_ref = ft.Ref[ft.AlertDialog]()
     
         def open_edit_matter_dialog(mid: int, path: str):
-            matters = self.db.get_all_matters()
-            matter = next((m for m in matters if m.id == mid), None)
+            matter = self.db.get_matter(mid)
             if not matter:
                 return
             edit_matter_id_holder.clear()
             edit_matter_id_holder.append(mid)
             cur = self.db.current_user_id
             is_owner = cur is not None and matter.owner_id == cur
-            if edit_matter_rate_ref.current:
+            rate_ctl = edit_matter_rate_ref.current
+            my_rate_ctl = edit_matter_my_rate_ref.current
+            my_rate_box = edit_matter_my_rate_container_ref.current
+            budget_ctl = edit_matter_budget_ref.current
+            thresh_ctl = edit_matter_threshold_ref.current
+            budget_box = edit_matter_budget_container_ref.current
+            dialog = edit_matter_dialog_ref.current
+            if rate_ctl:
                 is_root = matter.parent_id is None
-                edit_matter_rate_ref.current.label = "Client hourly rate (€)" if is_root else "Matter hourly rate (€)"
-                edit_matter_rate_ref.current.visible = is_owner
+                rate_ctl.label = "Client hourly rate (€)" if is_root else "Matter hourly rate (€)"
+                rate_ctl.visible = is_owner
                 rate_val = getattr(matter, "hourly_rate_euro", None)
-                edit_matter_rate_ref.current.value = str(rate_val) if rate_val is not None else ""
-                edit_matter_rate_ref.current.error_text = None
-            if edit_matter_my_rate_container_ref.current:
-                edit_matter_my_rate_container_ref.current.visible = not is_owner
-            if edit_matter_my_rate_ref.current and not is_owner:
+                rate_ctl.value = str(rate_val) if rate_val is not None else ""
+                rate_ctl.error_text = None
+            if my_rate_box:
+                my_rate_box.visible = not is_owner
+            if my_rate_ctl and not is_owner:
                 try:
-                    users_rates = self.db.get_matter_access_users_with_rates(mid)
-                    my_rate = next((r for uid, _, r in users_rates if uid == cur), None)
-                    edit_matter_my_rate_ref.current.value = str(my_rate) if my_rate is not None else ""
-                    edit_matter_my_rate_ref.current.error_text = None
+                    my_rate = self.db.get_user_matter_rate(cur, mid)
+                    my_rate_ctl.value = str(my_rate) if my_rate is not None else ""
+                    my_rate_ctl.error_text = None
                 except ValueError:
-                    edit_matter_my_rate_ref.current.value = ""
-            if edit_matter_budget_container_ref.current:
-                edit_matter_budget_container_ref.current.visible = is_owner
-            if edit_matter_budget_ref.current and edit_matter_threshold_ref.current and is_owner:
+                    my_rate_ctl.value = ""
+            if budget_box:
+                budget_box.visible = is_owner
+            if budget_ctl and thresh_ctl and is_owner:
                 budget_val = getattr(matter, "budget_eur", None)
-                edit_matter_budget_ref.current.value = str(budget_val) if budget_val is not None else ""
-                edit_matter_budget_ref.current.error_text = None
+                budget_ctl.value = str(budget_val) if budget_val is not None else ""
+                budget_ctl.error_text = None
                 thresh_val = getattr(matter, "budget_threshold", None)
-                edit_matter_threshold_ref.current.value = str(int(thresh_val * 100)) if thresh_val is not None else "80"
-                edit_matter_threshold_ref.current.error_text = None
-            if edit_matter_dialog_ref.current:
-                edit_matter_dialog_ref.current.title = ft.Text(f"Edit: {path}")
-                edit_matter_dialog_ref.current.open = True
+                thresh_ctl.value = str(int(thresh_val * 100)) if thresh_val is not None else "80"
+                thresh_ctl.error_text = None
+            if dialog:
+                dialog.title = ft.Text(f"Edit: {path}")
+                _open_dialog(edit_matter_dialog)
             page.update()
     
         def on_edit_matter_save(_):
-            if not edit_matter_id_holder or not edit_matter_rate_ref.current:
+            rate_ctl = edit_matter_rate_ref.current
+            if not edit_matter_id_holder or not rate_ctl:
                 return
+            my_rate_ctl = edit_matter_my_rate_ref.current
+            budget_ctl = edit_matter_budget_ref.current
+            thresh_ctl = edit_matter_threshold_ref.current
+            dialog = edit_matter_dialog_ref.current
             mid = edit_matter_id_holder[0]
             cur = self.db.current_user_id
-            matters = self.db.get_all_matters()
-            matter = next((m for m in matters if m.id == mid), None)
+            matter = self.db.get_matter(mid)
             is_owner = matter is not None and cur is not None and matter.owner_id == cur
             if is_owner:
-                rate_str = (edit_matter_rate_ref.current.value or "").strip()
+                rate_str = (rate_ctl.value or "").strip()
                 rate_val = None
                 if rate_str:
                     try:
-                        rate_val = float(rate_str)
+                        rate_val = parse_amount(rate_str)
                         if rate_val < 0:
-                            edit_matter_rate_ref.current.error_text = "Rate must be ≥ 0."
+                            rate_ctl.error_text = "Rate must be ≥ 0."
                             page.update()
                             return
                     except ValueError:
-                        edit_matter_rate_ref.current.error_text = "Enter a number or leave empty to clear."
+                        rate_ctl.error_text = "Enter a number or leave empty to clear."
                         page.update()
                         return
                 budget_val = None
-                if edit_matter_budget_ref.current:
-                    budget_str = (edit_matter_budget_ref.current.value or "").strip()
+                if budget_ctl:
+                    budget_str = (budget_ctl.value or "").strip()
                     if budget_str:
                         try:
-                            budget_val = float(budget_str)
+                            budget_val = parse_amount(budget_str)
                             if budget_val < 0:
-                                edit_matter_budget_ref.current.error_text = "Budget must be ≥ 0."
+                                budget_ctl.error_text = "Budget must be ≥ 0."
                                 page.update()
                                 return
                         except ValueError:
-                            edit_matter_budget_ref.current.error_text = "Enter a number or leave empty to clear."
+                            budget_ctl.error_text = "Enter a number or leave empty to clear."
                             page.update()
                             return
-                    edit_matter_budget_ref.current.error_text = None
+                    budget_ctl.error_text = None
                 thresh_val = None
-                if edit_matter_threshold_ref.current:
-                    thresh_str = (edit_matter_threshold_ref.current.value or "").strip()
+                if thresh_ctl:
+                    thresh_str = (thresh_ctl.value or "").strip()
                     if thresh_str:
                         try:
-                            pct = float(thresh_str)
+                            pct = parse_amount(thresh_str)
                             if not (1 <= pct <= 100):
-                                edit_matter_threshold_ref.current.error_text = "Threshold must be between 1 and 100."
+                                thresh_ctl.error_text = "Threshold must be between 1 and 100."
                                 page.update()
                                 return
                             thresh_val = pct / 100.0
                         except ValueError:
-                            edit_matter_threshold_ref.current.error_text = "Enter a number or leave empty to use default."
+                            thresh_ctl.error_text = "Enter a number or leave empty to use default."
                             page.update()
                             return
-                    edit_matter_threshold_ref.current.error_text = None
+                    thresh_ctl.error_text = None
                 try:
                     self.db.update_matter(
                         mid,
@@ -2809,37 +3159,37 @@ class SentinelApp:
                         budget_eur=budget_val,
                         budget_threshold=thresh_val,
                     )
-                    if edit_matter_dialog_ref.current:
-                        edit_matter_dialog_ref.current.open = False
-                    refresh_list()
+                    if dialog:
+                        dialog.open = False
+                    refresh_list(update=False)
                     if on_matters_changed:
                         on_matters_changed()
                     page.snack_bar = ft.SnackBar(ft.Text("Matter updated."), open=True)
                 except ValueError as err:
-                    edit_matter_rate_ref.current.error_text = str(err)
+                    rate_ctl.error_text = str(err)
             else:
-                my_rate_str = (edit_matter_my_rate_ref.current.value or "").strip() if edit_matter_my_rate_ref.current else ""
+                my_rate_str = (my_rate_ctl.value or "").strip() if my_rate_ctl else ""
                 my_rate_val = None
                 if my_rate_str:
                     try:
-                        my_rate_val = float(my_rate_str)
+                        my_rate_val = parse_amount(my_rate_str)
                         if my_rate_val < 0:
-                            edit_matter_my_rate_ref.current.error_text = "Rate must be ≥ 0."
+                            my_rate_ctl.error_text = "Rate must be ≥ 0."
                             page.update()
                             return
                     except ValueError:
-                        edit_matter_my_rate_ref.current.error_text = "Enter a number or leave empty to clear."
+                        my_rate_ctl.error_text = "Enter a number or leave empty to clear."
                         page.update()
                         return
                 try:
                     self.db.set_user_matter_rate(cur, mid, my_rate_val)
-                    if edit_matter_dialog_ref.current:
-                        edit_matter_dialog_ref.current.open = False
-                    refresh_list()
+                    if dialog:
+                        dialog.open = False
+                    refresh_list(update=False)
                     page.snack_bar = ft.SnackBar(ft.Text("Your rate for this matter updated."), open=True)
                 except ValueError as err:
-                    if edit_matter_my_rate_ref.current:
-                        edit_matter_my_rate_ref.current.error_text = str(err)
+                    if my_rate_ctl:
+                        my_rate_ctl.error_text = str(err)
             page.update()
     
         def on_edit_matter_cancel(_):
@@ -2881,11 +3231,16 @@ class SentinelApp:
             ),
         )
     
-        def refresh_list():
+        def refresh_list(update: bool = True):
+            """Rebuild the matters list; pass ``update=False`` when the caller sends one ``page.update()`` afterwards."""
+            search_index[0] = None  # Matters may have changed: rebuild the search index on next keystroke.
+            move_merge_targets_cache[0] = None
+            self.db.invalidate_caches()
             by_client = _by_client()
             if list_ref.current:
                 list_ref.current.controls = _build_list_controls(by_client)
-                page.update()
+                if update:
+                    page.update()
     
         def on_add(_):
             if not name_field.current:
@@ -2912,7 +3267,7 @@ class SentinelApp:
             rate_val = None
             if add_rate_field.current and (add_rate_field.current.value or "").strip():
                 try:
-                    rate_val = float((add_rate_field.current.value or "").strip())
+                    rate_val = parse_amount((add_rate_field.current.value or "").strip())
                     if rate_val < 0:
                         page.snack_bar = ft.SnackBar(ft.Text("Hourly rate must be ≥ 0."), open=True)
                         page.update()
@@ -2937,8 +3292,8 @@ class SentinelApp:
                 parent_selection_text_ref.current.update()
             if add_rate_field.current:
                 add_rate_field.current.value = ""
-            refresh_list()
-            refresh_parent_list()
+            refresh_list(update=False)
+            refresh_parent_list(update=False)
             if on_matters_changed:
                 on_matters_changed()
             page.update()
@@ -2981,13 +3336,13 @@ class SentinelApp:
                             ],
                         ),
                         visible=is_exp,
-                        padding=ft.Padding.only(left=20),
+                        padding=PAD_LEFT_20,
                     ),
                 )
             return controls
 
         def _on_toggle_parent_expanded(client_name: str):
-            parent_expanded.symmetric_difference_update([client_name])
+            _toggle_member(parent_expanded, client_name)
             if parent_list_ref.current:
                 parent_list_ref.current.controls = _build_parent_list_controls(
                     parent_search_ref.current.value if parent_search_ref.current else ""
@@ -3010,7 +3365,7 @@ class SentinelApp:
                 parent_list_ref.current.controls = _build_parent_list_controls(e.control.value or "")
                 parent_list_ref.current.update()
 
-        def refresh_parent_list():
+        def refresh_parent_list(update: bool = True):
             """Reload parent list options from DB so new clients/matters appear immediately."""
             path_options = self.db.get_matters_with_full_paths()
             parent_options_data.clear()
@@ -3019,39 +3374,45 @@ class SentinelApp:
                 parent_list_ref.current.controls = _build_parent_list_controls(
                     parent_search_ref.current.value if parent_search_ref.current else ""
                 )
-                parent_list_ref.current.update()
+                if update:
+                    parent_list_ref.current.update()
 
         def on_type_change(e):
             if parent_section_ref.current and add_type_ref.current:
                 is_matter = add_type_ref.current.selected and add_type_ref.current.selected[0] == "matter"
                 parent_section_ref.current.visible = is_matter
                 if is_matter:
-                    refresh_parent_list()
+                    refresh_parent_list(update=False)
                 if add_rate_field.current:
                     add_rate_field.current.label = "Matter hourly rate (€)" if is_matter else "Client hourly rate (€)"
                 page.update()
     
+        def _search_entries() -> list[tuple[str, str, str, int, str, str]]:
+            if search_index[0] is None:
+                search_index[0] = [
+                    (c_lower, path.lower(), c, mid, path, code)
+                    for c, items in _by_client().items()
+                    for c_lower in (c.lower(),)
+                    for (mid, path, code, _, _) in items
+                ]
+            return search_index[0]
+
         def on_search(e):
             if not search_results_ref.current:
                 return
-            by_client = _by_client()
-            all_entries = [
-                (c, path, code, mid)
-                for c, items in by_client.items()
-                for (mid, path, code, _, _) in items
-            ]
-            all_entries.extend((c, c, "", None) for c in by_client.keys())  # clients as entries too
             q = (e.control.value or "").strip().lower()
             if not q:
                 search_results_ref.current.controls = []
                 search_results_ref.current.visible = False
             else:
-                matching = [x for x in all_entries if q in x[0].lower() or q in x[1].lower()][:6]
-                # Group matching matters by client
-                matched_by_client: dict[str, list[tuple[int, str, str]]] = defaultdict(list)
-                for client, path, code, mid in matching:
-                    if mid is not None:  # Only group actual matters, not clients
-                        matched_by_client[client].append((mid, path, code))
+                # Group the first six matching matters by client in one pass over the index.
+                matched_by_client: dict[str, list[tuple[int, str, str]]] = {}
+                matching = (x for x in _search_entries() if q in x[0] or q in x[1])
+                for _, _, client, mid, path, code in islice(matching, 6):
+                    matched = matched_by_client.get(client)
+                    if matched is None:
+                        matched = matched_by_client[client] = []
+                    matched.append((mid, path, code))
                 # Build controls showing clients with their matching matters expanded
                 controls = []
                 for client in sorted(matched_by_client.keys()):
@@ -3075,7 +3436,7 @@ class SentinelApp:
                                 ],
                             ),
                             visible=True,
-                            padding=ft.Padding.only(left=24),
+                            padding=PAD_LEFT_24,
                         ),
                     )
                 search_results_ref.current.controls = controls
@@ -3131,7 +3492,7 @@ class SentinelApp:
         search_field = ft.TextField(
             label="Search clients and matters",
             expand=True,
-            on_change=on_search,
+            on_change=self._debounced(on_search),
         )
         search_results_column = ft.Column(
             ref=search_results_ref,
@@ -3142,11 +3503,7 @@ class SentinelApp:
             label="Sort clients by",
             width=200,
             value=(page.data or {}).get("matters_sort") or "most_uninvoiced",
-            options=[
-                ft.DropdownOption(key="most_uninvoiced", text="Most not invoiced time"),
-                ft.DropdownOption(key="most_accrued", text="Most accrued (total) time"),
-                ft.DropdownOption(key="most_used_budget", text="Most used up budget"),
-            ],
+            options=_client_sort_options(),
             on_select=on_matters_sort_change,
         )
     
@@ -3167,10 +3524,10 @@ class SentinelApp:
                         ref=move_search_ref,
                         label="Search by name or path",
                         width=400,
-                        on_change=on_move_search,
+                        on_change=self._debounced(on_move_search),
                     ),
                     ft.Container(
-                        content=ft.Column(ref=move_list_ref, scroll=ft.ScrollMode.AUTO),
+                        content=ft.ListView(ref=move_list_ref),
                         height=220,
                         border=ft.border.all(1, ft.Colors.OUTLINE),
                         border_radius=4,
@@ -3197,10 +3554,10 @@ class SentinelApp:
                         ref=merge_search_ref,
                         label="Search by name or path",
                         width=400,
-                        on_change=on_merge_search,
+                        on_change=self._debounced(on_merge_search),
                     ),
                     ft.Container(
-                        content=ft.Column(ref=merge_list_ref, scroll=ft.ScrollMode.AUTO),
+                        content=ft.ListView(ref=merge_list_ref),
                         height=220,
                         border=ft.border.all(1, ft.Colors.OUTLINE),
                         border_radius=4,
@@ -3225,7 +3582,7 @@ class SentinelApp:
             content=ft.Column(
                 [
                     ft.Container(
-                        content=ft.Column(ref=share_list_ref, scroll=ft.ScrollMode.AUTO),
+                        content=ft.ListView(ref=share_list_ref),
                         height=180,
                         border=ft.border.all(1, ft.Colors.OUTLINE),
                         border_radius=4,
@@ -3335,14 +3692,6 @@ class SentinelApp:
                 tight=True,
             ),
         )
-        page.overlay.append(move_dialog)
-        page.overlay.append(merge_dialog)
-        page.overlay.append(share_dialog)
-        page.overlay.append(conflict_dialog)
-        page.overlay.append(edit_matter_dialog)
-        page.overlay.append(time_entries_dialog)
-        page.overlay.append(edit_entry_dialog)
-        page.overlay.append(add_entry_dialog)
     
         add_form_card = ft.Card(
             content=ft.Container(
@@ -3446,16 +3795,27 @@ class SentinelApp:
         path_list = self.db.get_matters_with_full_paths()
         matter_id_by_path = {path: mid for mid, path in path_list}
         budget_status_by_id = self.db.get_matter_budget_status_batch(list(matter_id_by_path.values()))
-        by_client: dict[str, list[tuple[str, float, float, float, float, str]]] = defaultdict(list)
+        by_client: dict[str, list[tuple[str, float, float, float, float, str]]] = {}
+        # Per client: [total_sec, not_invoiced_sec, total_eur, not_invoiced_eur], summed once.
+        client_totals: dict[str, list[float]] = {}
         for row in rows_data:
             client_name, matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_inv_amount_eur, rate_source = row
-            by_client[client_name].append((matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_inv_amount_eur, rate_source))
+            matter_rows = by_client.get(client_name)
+            if matter_rows is None:
+                matter_rows = by_client[client_name] = []
+                client_totals[client_name] = [0.0, 0.0, 0.0, 0.0]
+            matter_rows.append((matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_inv_amount_eur, rate_source))
+            t = client_totals[client_name]
+            t[0] += total_seconds
+            t[1] += not_invoiced_seconds
+            t[2] += total_amount_eur
+            t[3] += not_inv_amount_eur
 
         def on_sort_change(e):
             val = getattr(e.control, "value", None) or getattr(e, "data", None)
             if page.data is not None and val:
                 page.data["reporting_sort"] = val
-                refresh = (page.data or {}).get("refresh_reporting")
+                refresh = self._refresh_reporting
                 if refresh:
                     refresh()
 
@@ -3463,23 +3823,19 @@ class SentinelApp:
             label="Sort clients by",
             width=280,
             value=sort_value,
-            options=[
-                ft.DropdownOption(key="most_uninvoiced", text="Most not invoiced time"),
-                ft.DropdownOption(key="most_accrued", text="Most accrued (total) time"),
-                ft.DropdownOption(key="most_used_budget", text="Most used up budget"),
-            ],
+            options=_client_sort_options(),
             on_select=on_sort_change,
         )
 
         def _client_sort_key(c: str) -> float:
             if sort_value == "most_uninvoiced":
-                return sum(r[2] for r in by_client[c])  # not_invoiced_seconds
+                return client_totals[c][1]
             if sort_value == "most_used_budget":
                 return max(
                     (budget_status_by_id.get(matter_id_by_path.get(r[0]), {}) or {}).get("ratio") or 0
                     for r in by_client[c]
                 )
-            return sum(r[1] for r in by_client[c])  # total_seconds
+            return client_totals[c][0]
 
         client_order = sorted(
             by_client.keys(),
@@ -3507,12 +3863,13 @@ class SentinelApp:
                         budget_parts.append(ft.Text(budget_str, size=12, color=ft.Colors.ORANGE))
                     else:
                         budget_parts.append(ft.Text(budget_str, size=12, color=ft.Colors.GREY_400))
+            amount_color = _rate_source_color(rate_source)
             subtitle_parts = [
                 ft.Text(f"Total {format_elapsed(total_seconds)} · Not inv. {format_elapsed(not_invoiced_seconds)} · ", size=12),
                 ft.Text("Chargeable ", size=12),
-                ft.Text(format_eur(total_amount_eur), size=12, color=_rate_source_color(rate_source)),
+                ft.Text(format_eur(total_amount_eur), size=12, color=amount_color),
                 ft.Text(f" (not inv. ", size=12),
-                ft.Text(format_eur(not_inv_amount_eur), size=12, color=_rate_source_color(rate_source)),
+                ft.Text(format_eur(not_inv_amount_eur), size=12, color=amount_color),
                 ft.Text(")", size=12),
             ] + budget_parts
             return ft.ListTile(
@@ -3520,52 +3877,77 @@ class SentinelApp:
                 subtitle=ft.Row(subtitle_parts, wrap=True),
             )
 
-        # Build initial client blocks (empty search shows all)
-        initial_client_blocks = []
-        for client_name in client_order:
-            filtered_matter_rows = by_client[client_name][:]
-            if not filtered_matter_rows:
-                continue
-                
-            matter_rows = filtered_matter_rows
-            client_total = sum(r[1] for r in matter_rows)
-            client_not_invoiced = sum(r[2] for r in matter_rows)
-            client_total_eur = sum(r[3] for r in matter_rows)
-            client_not_inv_eur = sum(r[4] for r in matter_rows)
-            is_expanded = client_name in expanded_clients
-            initial_client_blocks.append(
-                ft.Column(
-                    [
-                        ft.ListTile(
-                            title=ft.Text(client_name, weight=ft.FontWeight.W_500),
-                            subtitle=ft.Text(
-                                f"Total {format_elapsed(client_total)} · Not inv. {format_elapsed(client_not_invoiced)} · Chargeable {format_eur(client_total_eur)} (not inv. {format_eur(client_not_inv_eur)})",
-                                size=12,
-                            ),
-                            trailing=ft.Icon(
-                                ft.Icons.EXPAND_LESS if is_expanded else ft.Icons.EXPAND_MORE,
-                            ),
-                            on_click=lambda e, c=client_name: on_toggle_client(c),
-                        ),
-                        ft.Container(
-                            content=ft.Column(
-                                [
-                                    _reporting_matter_row(matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_inv_amount_eur, rate_source, matter_id_by_path, budget_status_by_id)
-                                    for (matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_inv_amount_eur, rate_source) in sorted(
-                                        matter_rows, key=lambda r: r[0]
-                                    )
-                                ],
-                            ),
-                            visible=is_expanded,
-                            padding=ft.Padding.only(left=24),
-                        ),
-                    ],
+        # Chevron and matters container per client block on screen, so expand/collapse only flips them.
+        client_block_parts: dict[str, tuple[ft.Icon, ft.Container, list]] = {}
+        # Formatted once per tab build (i.e. per data change) and reused by every filter keystroke.
+        matter_row_by_path: dict[str, ft.ListTile] = {}
+        client_subtitle_cache: dict[tuple, str] = {}
+
+        def _matter_row(r) -> ft.ListTile:
+            tile = matter_row_by_path.get(r[0])
+            if tile is None:
+                tile = matter_row_by_path[r[0]] = _reporting_matter_row(*r, matter_id_by_path, budget_status_by_id)
+            return tile
+
+        def _client_subtitle(client_name: str, totals) -> str:
+            key = (client_name, *totals)
+            text = client_subtitle_cache.get(key)
+            if text is None:
+                client_total, client_not_invoiced, client_total_eur, client_not_inv_eur = totals
+                text = client_subtitle_cache[key] = (
+                    f"Total {format_elapsed(client_total)} · Not inv. {format_elapsed(client_not_invoiced)} · "
+                    f"Chargeable {format_eur(client_total_eur)} (not inv. {format_eur(client_not_inv_eur)})"
                 )
+            return text
+
+        def _on_client_click(client_name: str):
+            on_toggle_client(client_name)
+            parts = client_block_parts.get(client_name)
+            if parts is None:
+                return
+            chevron, matters_box, matter_rows = parts
+            is_expanded = client_name in expanded_clients
+            chevron.icon = ft.Icons.EXPAND_LESS if is_expanded else ft.Icons.EXPAND_MORE
+            if is_expanded and not matters_box.content.controls:
+                matters_box.content.controls = _matter_rows(matter_rows)
+            matters_box.visible = is_expanded
+            page.update()
+
+        def _matter_rows(matter_rows) -> list[ft.ListTile]:
+            return [_matter_row(r) for r in sorted(matter_rows, key=itemgetter(0))]
+
+        def _client_block(client_name, matter_rows, totals):
+            is_expanded = client_name in expanded_clients
+            chevron = ft.Icon(ft.Icons.EXPAND_LESS if is_expanded else ft.Icons.EXPAND_MORE)
+            # Collapsed clients get their matter rows on first expand.
+            matters_box = ft.Container(
+                content=ft.Column(_matter_rows(matter_rows) if is_expanded else []),
+                visible=is_expanded,
+                padding=PAD_LEFT_24,
+            )
+            client_block_parts[client_name] = (chevron, matters_box, matter_rows)
+            return ft.Column(
+                [
+                    ft.ListTile(
+                        title=ft.Text(client_name, weight=ft.FontWeight.W_500),
+                        subtitle=ft.Text(_client_subtitle(client_name, totals), size=12),
+                        trailing=chevron,
+                        on_click=lambda e, c=client_name: _on_client_click(c),
+                    ),
+                    matters_box,
+                ],
             )
 
+        # Build initial client blocks (empty search shows all)
+        initial_client_blocks = [
+            _client_block(client_name, by_client[client_name], client_totals[client_name])
+            for client_name in client_order
+        ]
+
         # Create the container that will hold the (potentially filtered) client blocks
         client_blocks_container = ft.Container(
-            content=ft.Column(initial_client_blocks, scroll=ft.ScrollMode.AUTO),
+            # ListView builds only the client blocks in view.
+            content=ft.ListView(initial_client_blocks, expand=True),
             expand=True,
         )
 
@@ -3574,18 +3956,24 @@ class SentinelApp:
             width=400,
         )
 
+        # Lowercased once per build for the filter below.
+        client_lc = {c: c.lower() for c in by_client}
+        matter_path_lc = {r[0]: r[0].lower() for rows in by_client.values() for r in rows}
+
         def on_search(e):
             # Rebuild client blocks with the current search query
             search_query = (search_field.value or "").strip().lower()
             filtered_client_blocks = []
+            client_block_parts.clear()
             for client_name in client_order:
                 # If search query is empty, show all matters; otherwise filter
                 if not search_query:
-                    filtered_matter_rows = by_client[client_name][:]
+                    filtered_matter_rows = by_client[client_name]
+                elif search_query in client_lc[client_name]:
+                    filtered_matter_rows = by_client[client_name]
                 else:
                     filtered_matter_rows = [
-                        r for r in by_client[client_name]
-                        if search_query in client_name.lower() or search_query in r[0].lower()
+                        r for r in by_client[client_name] if search_query in matter_path_lc[r[0]]
                     ]
                 
                 # Skip client if no matters match the filter
@@ -3593,46 +3981,22 @@ class SentinelApp:
                     continue
                     
                 matter_rows = filtered_matter_rows
-                client_total = sum(r[1] for r in matter_rows)
-                client_not_invoiced = sum(r[2] for r in matter_rows)
-                client_total_eur = sum(r[3] for r in matter_rows)
-                client_not_inv_eur = sum(r[4] for r in matter_rows)
-                is_expanded = client_name in expanded_clients
-                filtered_client_blocks.append(
-                    ft.Column(
-                        [
-                            ft.ListTile(
-                                title=ft.Text(client_name, weight=ft.FontWeight.W_500),
-                                subtitle=ft.Text(
-                                    f"Total {format_elapsed(client_total)} · Not inv. {format_elapsed(client_not_invoiced)} · Chargeable {format_eur(client_total_eur)} (not inv. {format_eur(client_not_inv_eur)})",
-                                    size=12,
-                                ),
-                                trailing=ft.Icon(
-                                    ft.Icons.EXPAND_LESS if is_expanded else ft.Icons.EXPAND_MORE,
-                                ),
-                                on_click=lambda e, c=client_name: on_toggle_client(c),
-                            ),
-                            ft.Container(
-                                content=ft.Column(
-                                    [
-                                        _reporting_matter_row(matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_inv_amount_eur, rate_source, matter_id_by_path, budget_status_by_id)
-                                        for (matter_path, total_seconds, not_invoiced_seconds, total_amount_eur, not_inv_amount_eur, rate_source) in sorted(
-                                            matter_rows, key=lambda r: r[0]
-                                        )
-                                    ],
-                                ),
-                                visible=is_expanded,
-                                padding=ft.Padding.only(left=24),
-                            ),
-                        ],
+                if len(matter_rows) == len(by_client[client_name]):
+                    totals = client_totals[client_name]
+                else:
+                    totals = (
+                        sum(r[1] for r in matter_rows),
+                        sum(r[2] for r in matter_rows),
+                        sum(r[3] for r in matter_rows),
+                        sum(r[4] for r in matter_rows),
                     )
-                )
+                filtered_client_blocks.append(_client_block(client_name, matter_rows, totals))
             
             # Update the client blocks in the UI
             client_blocks_container.content.controls = filtered_client_blocks
             page.update()
 
-        search_field.on_change = on_search
+        search_field.on_change = self._debounced(on_search)
 
         return ft.Column(
             [
@@ -3657,8 +4021,8 @@ class SentinelApp:
         timesheet_selected_ids: set[int] = set()
         timesheet_expanded: set[str] = set()
         timesheet_search_ref = ft.Ref[ft.TextField]()
-        timesheet_list_ref = ft.Ref[ft.Column]()
-        timesheet_preview_ref = ft.Ref[ft.Column]()
+        timesheet_list_ref = ft.Ref[ft.ListView]()
+        timesheet_preview_ref = ft.Ref[ft.ListView]()
         only_not_invoiced_ref = ft.Ref[ft.Checkbox]()
         export_all_users_ref = ft.Ref[ft.Checkbox]()
         current_user_is_admin = self.db.current_user_is_admin()
@@ -3684,14 +4048,25 @@ class SentinelApp:
                 preview_controls = [ft.Text("No entries to show.", size=14)]
             else:
                 # Group by logical activity (same matter, description, activity_group_id) and aggregate duration and amount
-                groups: dict[tuple[str, str, int | None], list[dict]] = {}
+                # key -> [total_duration, total_amount, rate_source of the first entry], summed in one pass
+                groups: dict[tuple[str, str, int | None], list] = {}
+                # Equal descriptions arrive as separate strings; interned, repeat keys compare by identity.
+                intern = sys.intern
                 for e in entries:
+                    group_id = e.get("activity_group_id")
                     key = (
                         e.get("matter_path") or "",
-                        e.get("description") or "",
-                        e.get("activity_group_id") if e.get("activity_group_id") is not None else e.get("id"),
+                        intern(e.get("description") or ""),
+                        group_id if group_id is not None else e.get("id"),
                     )
-                    groups.setdefault(key, []).append(e)
+                    dur = e.get("duration_seconds") or 0
+                    amount = e.get("amount_eur") or 0.0
+                    slot = groups.get(key)
+                    if slot is None:
+                        groups[key] = [dur, amount, e.get("rate_source", "user")]
+                    else:
+                        slot[0] += dur
+                        slot[1] += amount
                 preview_controls = [
                     ft.Row(
                         [
@@ -3709,10 +4084,9 @@ class SentinelApp:
                         spacing=8,
                     ),
                 ]
-                for (matter_path, description, _), group_entries in sorted(groups.items(), key=lambda x: (x[0][0], x[0][1])):
-                    total_dur = sum(ent.get("duration_seconds", 0) or 0 for ent in group_entries)
-                    total_amount = sum(ent.get("amount_eur", 0.0) or 0 for ent in group_entries)
-                    rate_source = group_entries[0].get("rate_source", "user")
+                for (matter_path, description, _), (total_dur, total_amount, rate_source) in sorted(
+                    groups.items(), key=lambda x: x[0][:2]
+                ):
                     color = _rate_source_color(rate_source)
                     preview_controls.append(
                         ft.Row(
@@ -3730,59 +4104,88 @@ class SentinelApp:
             page.update()
 
         def _options_by_client_timesheet(opts: list[tuple[int, str]]) -> dict:
-            by_client = defaultdict(list)
+            by_client: dict[str, list[tuple[int, str]]] = {}
             for mid, path in opts:
-                client = path.split(" > ")[0] if " > " in path else path
-                by_client[client].append((mid, path))
-            for client in by_client:
-                by_client[client].sort(key=lambda x: x[1])
+                client = path.partition(" > ")[0]
+                items = by_client.get(client)
+                if items is None:
+                    items = by_client[client] = []
+                items.append((mid, path))
+            for items in by_client.values():
+                items.sort(key=lambda x: x[1])
             return by_client
 
-        def _build_timesheet_list_controls(query: str):
-            path_list = self.db.get_matters_with_full_paths(
-                include_all_users=current_user_is_admin
-            )
-            all_mids = [mid for mid, _ in path_list]
-            budget_status_by_id = self.db.get_matter_budget_status_batch(all_mids)
-            q = (query or "").strip().lower()
-            def _timesheet_budget_trailing(mid: int):
-                status = budget_status_by_id.get(mid, {})
-                if status.get("budget_eur") is None or status["budget_eur"] <= 0:
-                    return None
-                total = status["total_eur"]
-                budget = status["budget_eur"]
-                pct = int((status.get("ratio") or 0) * 100)
-                budget_in = status.get("budget_in")
-                budget_in_suffix = f" Budget in {budget_in}." if budget_in else ""
-                if status.get("over_budget"):
-                    return ft.Icon(
-                        ft.Icons.WARNING,
-                        color=ft.Colors.RED,
-                        size=18,
-                        tooltip=f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – over budget.{budget_in_suffix}",
-                    )
-                if status.get("near_budget"):
-                    return ft.Icon(
-                        ft.Icons.WARNING_AMBER,
-                        color=ft.Colors.ORANGE,
-                        size=18,
-                        tooltip=f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – near budget.{budget_in_suffix}",
-                    )
+        # (path_list, budget_status_by_id, [(mid, path, path_lc)]), loaded once per refresh_timesheet_list.
+        timesheet_matter_data: list = [None]
+        # {parent_id: [child ids]}, loaded on the first check after each refresh.
+        timesheet_children: list = [None]
+        # Matter tiles and their checkboxes, built once per data load and reused by every
+        # list rebuild (search, sort); selection changes only touch the checkbox values.
+        timesheet_matter_tiles: dict[int, ft.ListTile] = {}
+        timesheet_matter_checks: dict[int, ft.Checkbox] = {}
+        timesheet_client_rows: dict[str, tuple[frozenset[int], ft.Checkbox, ft.Icon, ft.Container]] = {}
+
+        def _timesheet_matter_data():
+            if timesheet_matter_data[0] is None:
+                path_list = self.db.get_matters_with_full_paths(
+                    include_all_users=current_user_is_admin
+                )
+                budget_status_by_id = self.db.get_matter_budget_status_batch([mid for mid, _ in path_list])
+                path_lc_list = [(mid, path, path.lower()) for mid, path in path_list if path]
+                timesheet_matter_data[0] = (path_list, budget_status_by_id, path_lc_list)
+                timesheet_matter_tiles.clear()
+                timesheet_matter_checks.clear()
+            return timesheet_matter_data[0]
+
+        def _timesheet_budget_trailing(mid: int, budget_status_by_id: dict):
+            status = budget_status_by_id.get(mid, {})
+            if status.get("budget_eur") is None or status["budget_eur"] <= 0:
                 return None
+            total = status["total_eur"]
+            budget = status["budget_eur"]
+            pct = int((status.get("ratio") or 0) * 100)
+            budget_in = status.get("budget_in")
+            budget_in_suffix = f" Budget in {budget_in}." if budget_in else ""
+            if status.get("over_budget"):
+                return ft.Icon(
+                    ft.Icons.WARNING,
+                    color=ft.Colors.RED,
+                    size=18,
+                    tooltip=f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – over budget.{budget_in_suffix}",
+                )
+            if status.get("near_budget"):
+                return ft.Icon(
+                    ft.Icons.WARNING_AMBER,
+                    color=ft.Colors.ORANGE,
+                    size=18,
+                    tooltip=f"Budget: {format_eur(budget)}, used: {format_eur(total)} ({pct}%) – near budget.{budget_in_suffix}",
+                )
+            return None
+
+        def _timesheet_matter_tile(mid: int, path: str, budget_status_by_id: dict) -> ft.ListTile:
+            tile = timesheet_matter_tiles.get(mid)
+            if tile is None:
+                cb = ft.Checkbox(
+                    value=mid in timesheet_selected_ids,
+                    on_change=lambda e, mid=mid: _on_timesheet_check(mid, e.control.value),
+                )
+                timesheet_matter_checks[mid] = cb
+                tile = timesheet_matter_tiles[mid] = ft.ListTile(
+                    title=ft.Text(path, size=14),
+                    leading=cb,
+                    trailing=_timesheet_budget_trailing(mid, budget_status_by_id),
+                )
+            else:
+                timesheet_matter_checks[mid].value = mid in timesheet_selected_ids
+            return tile
 
+        def _build_timesheet_list_controls(query: str):
+            path_list, budget_status_by_id, path_lc_list = _timesheet_matter_data()
+            timesheet_client_rows.clear()
+            q = (query or "").strip().lower()
             if q:
-                flat = [(mid, path) for mid, path in path_list if path and q in path.lower()][:30]
-                return [
-                    ft.ListTile(
-                        title=ft.Text(path, size=14),
-                        leading=ft.Checkbox(
-                            value=mid in timesheet_selected_ids,
-                            on_change=lambda e, mid=mid: _on_timesheet_check(mid, e.control.value),
-                        ),
-                        trailing=_timesheet_budget_trailing(mid),
-                    )
-                    for mid, path in flat
-                ]
+                flat = islice(((mid, path) for mid, path, lc in path_lc_list if q in lc), 30)
+                return [_timesheet_matter_tile(mid, path, budget_status_by_id) for mid, path in flat]
             controls = []
             by_client = _options_by_client_timesheet(path_list)
             # Reuse reporting sort preference
@@ -3796,14 +4199,10 @@ class SentinelApp:
                     for c, items in by_client.items()
                 }
             else:
-                rows_data = self.db.get_time_by_client_and_matter_detailed()
-                client_sort_key = defaultdict(float)
-                for row in rows_data:
-                    client_name, _, total_sec, not_inv_sec, *_ = row
-                    if sort_value == "most_uninvoiced":
-                        client_sort_key[client_name] += not_inv_sec
-                    else:
-                        client_sort_key[client_name] += total_sec
+                client_sort_key = {}
+                idx = 3 if sort_value == "most_uninvoiced" else 2
+                for row in self.db.get_time_by_client_and_matter_detailed():
+                    client_sort_key[row[0]] = client_sort_key.get(row[0], 0.0) + row[idx]
             client_order = sorted(
                 by_client.keys(),
                 key=lambda c: client_sort_key.get(c, 0.0),
@@ -3811,94 +4210,100 @@ class SentinelApp:
             )
             for client_name in client_order:
                 items = by_client[client_name]
-                mids = [mid for mid, _ in items]
+                mids = frozenset(mid for mid, _ in items)
                 is_exp = client_name in timesheet_expanded
-                client_all_checked = all(mid in timesheet_selected_ids for mid in mids)
+                client_check = ft.Checkbox(
+                    value=mids.issubset(timesheet_selected_ids),
+                    on_change=lambda e, m=mids: _on_timesheet_client_check(m, e.control.value),
+                )
+                expand_icon = ft.Icon(ft.Icons.EXPAND_LESS if is_exp else ft.Icons.EXPAND_MORE, size=20)
+                matters_box = ft.Container(
+                    content=ft.Column(
+                        [_timesheet_matter_tile(mid, path, budget_status_by_id) for mid, path in items],
+                    ),
+                    visible=is_exp,
+                    padding=PAD_LEFT_20,
+                    key=f"matters:{client_name}",
+                )
+                timesheet_client_rows[client_name] = (mids, client_check, expand_icon, matters_box)
                 controls.append(
                     ft.ListTile(
-                        leading=ft.Checkbox(
-                            value=client_all_checked,
-                            on_change=lambda e, m=mids: _on_timesheet_client_check(m, e.control.value),
-                        ),
+                        leading=client_check,
                         title=ft.Text(client_name, weight=ft.FontWeight.W_500, size=14),
                         subtitle=ft.Text(f"{len(items)} matter(s)", size=12),
-                        trailing=ft.Icon(ft.Icons.EXPAND_LESS if is_exp else ft.Icons.EXPAND_MORE, size=20),
+                        trailing=expand_icon,
                         on_click=lambda e, c=client_name: _on_toggle_timesheet_expanded(c),
+                        key=f"client:{client_name}",
                     ),
                 )
-                controls.append(
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                ft.ListTile(
-                                    title=ft.Text(path, size=14),
-                                    leading=ft.Checkbox(
-                                        value=mid in timesheet_selected_ids,
-                                        on_change=lambda e, mid=mid: _on_timesheet_check(mid, e.control.value),
-                                    ),
-                                    trailing=_timesheet_budget_trailing(mid),
-                                )
-                                for mid, path in items
-                            ],
-                        ),
-                        visible=is_exp,
-                        padding=ft.Padding.only(left=20),
-                    ),
-                )
+                controls.append(matters_box)
             return controls
 
+        def _sync_timesheet_checks():
+            """Set the built checkboxes from timesheet_selected_ids without rebuilding the list."""
+            for mid, cb in timesheet_matter_checks.items():
+                cb.value = mid in timesheet_selected_ids
+            for mids, client_check, _, _ in timesheet_client_rows.values():
+                client_check.value = mids.issubset(timesheet_selected_ids)
+
+        def _update_timesheet_list():
+            """Send only the matter list's changes (handlers below touch nothing else)."""
+            lst = timesheet_list_ref.current
+            if lst is not None:
+                lst.update()
+
         def refresh_timesheet_list():
+            self.db.invalidate_caches()
+            timesheet_matter_data[0] = None
+            timesheet_children[0] = None
             if timesheet_list_ref.current:
                 search_val = timesheet_search_ref.current.value if timesheet_search_ref.current else ""
                 timesheet_list_ref.current.controls = _build_timesheet_list_controls(search_val)
                 page.update()
 
-        if page.data is None:
-            page.data = {}
-        page.data["refresh_timesheet_matters"] = refresh_timesheet_list
+        self._refresh_timesheet_matters = refresh_timesheet_list
 
         def _on_toggle_timesheet_expanded(client_name: str):
-            timesheet_expanded.symmetric_difference_update([client_name])
-            if timesheet_list_ref.current:
-                timesheet_list_ref.current.controls = _build_timesheet_list_controls(
-                    timesheet_search_ref.current.value if timesheet_search_ref.current else ""
-                )
-                page.update()
+            _toggle_member(timesheet_expanded, client_name)
+            row = timesheet_client_rows.get(client_name)
+            if row is not None:
+                is_exp = client_name in timesheet_expanded
+                row[2].icon = ft.Icons.EXPAND_LESS if is_exp else ft.Icons.EXPAND_MORE
+                row[3].visible = is_exp
+                _update_timesheet_list()
 
         def _on_timesheet_check(matter_id: int, checked: bool):
             nonlocal timesheet_selected_ids
             if checked:
                 timesheet_selected_ids.add(matter_id)
-                timesheet_selected_ids |= self.db.get_descendant_matter_ids(
-                    matter_id, include_all_users=current_user_is_admin
+                if timesheet_children[0] is None:
+                    timesheet_children[0] = self.db.get_matter_children_map(
+                        include_all_users=current_user_is_admin
+                    )
+                timesheet_selected_ids |= self.db.descendant_ids_from_children(
+                    timesheet_children[0], matter_id
                 )
             else:
                 timesheet_selected_ids.discard(matter_id)
-            if timesheet_list_ref.current:
-                timesheet_list_ref.current.controls = _build_timesheet_list_controls(
-                    timesheet_search_ref.current.value if timesheet_search_ref.current else ""
-                )
-                page.update()
+            _sync_timesheet_checks()
+            _update_timesheet_list()
 
-        def _on_timesheet_client_check(matter_ids: list[int], checked: bool):
+        def _on_timesheet_client_check(matter_ids: frozenset[int], checked: bool):
             """Check/uncheck client checkbox: select or clear all matters for that client."""
             nonlocal timesheet_selected_ids
             if checked:
-                timesheet_selected_ids |= set(matter_ids)
+                timesheet_selected_ids |= matter_ids
             else:
-                timesheet_selected_ids -= set(matter_ids)
-            if timesheet_list_ref.current:
-                timesheet_list_ref.current.controls = _build_timesheet_list_controls(
-                    timesheet_search_ref.current.value if timesheet_search_ref.current else ""
-                )
-                page.update()
+                timesheet_selected_ids -= matter_ids
+            _sync_timesheet_checks()
+            _update_timesheet_list()
 
         def _on_search_change(_):
             if timesheet_list_ref.current and timesheet_search_ref.current:
                 timesheet_list_ref.current.controls = _build_timesheet_list_controls(
                     timesheet_search_ref.current.value
                 )
-                page.update()
+                _update_timesheet_list()
 
         def _on_timesheet_sort_change(e):
             val = getattr(e.control, "value", None) or getattr(e, "data", None)
@@ -3910,11 +4315,8 @@ class SentinelApp:
             """Clear all selected matters in the timesheet tab."""
             nonlocal timesheet_selected_ids
             timesheet_selected_ids.clear()
-            if timesheet_list_ref.current:
-                timesheet_list_ref.current.controls = _build_timesheet_list_controls(
-                    timesheet_search_ref.current.value if timesheet_search_ref.current else ""
-                )
-            page.update()
+            _sync_timesheet_checks()
+            _update_timesheet_list()
 
         def _show_mark_invoiced_dialog(out_path: Path, entry_ids: list):
             def _on_mark_yes(_):
@@ -3945,7 +4347,8 @@ class SentinelApp:
         def _write_and_confirm_export(out_path: Path, payload: dict, entry_ids: list) -> bool:
             """Write payload to out_path and show mark-as-invoiced dialog. Returns True if written."""
             try:
-                out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+                with out_path.open("w", encoding="utf-8") as f:
+                    json.dump(payload, f, indent=2)
             except OSError as err:
                 page.snack_bar = ft.SnackBar(content=ft.Text(f"Could not save file: {err}"))
                 page.snack_bar.open = True
@@ -3954,14 +4357,6 @@ class SentinelApp:
             _show_mark_invoiced_dialog(out_path, entry_ids)
             return True
 
-        def _default_export_dir() -> Path:
-            downloads = Path.home() / "Downloads"
-            if downloads.is_dir():
-                return downloads
-            exports_dir = Path(__file__).resolve().parent / "exports"
-            exports_dir.mkdir(exist_ok=True)
-            return exports_dir
-
         # No FilePicker (causes "Unknown control" on some Flet clients). Use a folder path field instead.
         export_dir_ref = ft.Ref[ft.TextField]()
 
@@ -3993,14 +4388,15 @@ class SentinelApp:
                 page.snack_bar.open = True
                 page.update()
                 return
-            export_time = datetime.now().isoformat()
+            # One clock read so exported_at matches the file name.
+            now = datetime.now()
             payload = {
-                "exported_at": export_time,
+                "exported_at": now.isoformat(),
                 "only_not_invoiced": only_not_invoiced,
                 "entries": entries,
             }
             entry_ids = [e["id"] for e in entries]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             default_name = f"timesheet_{timestamp}.json"
             dir_str = (export_dir_ref.current.value or "").strip() if export_dir_ref.current else ""
             export_dir = Path(dir_str).expanduser() if dir_str else _default_export_dir()
@@ -4023,7 +4419,7 @@ class SentinelApp:
             label="Search matters by name or path",
             expand=True,
             ref=timesheet_search_ref,
-            on_change=_on_search_change,
+            on_change=self._debounced(_on_search_change),
         )
         export_dir_field = ft.TextField(
             label="Save to folder",
@@ -4044,10 +4440,11 @@ class SentinelApp:
             ref=export_all_users_ref,
             visible=current_user_is_admin,
         )
-        list_column = ft.Column(
+        # Lazy list: only client rows scrolled into view are built on the Flutter side.
+        list_column = ft.ListView(
             ref=timesheet_list_ref,
             controls=_build_timesheet_list_controls(""),
-            scroll=ft.ScrollMode.AUTO,
+            expand=True,
         )
         # Two-column layout: left = matter list, right = export + preview
         left_column = ft.Column(
@@ -4059,11 +4456,7 @@ class SentinelApp:
                             label="Sort clients by",
                             width=200,
                             value=(page.data or {}).get("reporting_sort") or "most_uninvoiced",
-                            options=[
-                                ft.DropdownOption(key="most_uninvoiced", text="Most not invoiced time"),
-                                ft.DropdownOption(key="most_accrued", text="Most accrued (total) time"),
-                                ft.DropdownOption(key="most_used_budget", text="Most used up budget"),
-                            ],
+                            options=_client_sort_options(),
                             on_select=_on_timesheet_sort_change,
                         ),
                         ft.TextButton(
@@ -4114,7 +4507,7 @@ class SentinelApp:
                 preview_header,
                 ft.Container(height=4),
                 ft.Container(
-                    content=ft.Column(ref=timesheet_preview_ref, scroll=ft.ScrollMode.AUTO),
+                    content=ft.ListView(ref=timesheet_preview_ref, expand=True),
                     expand=True,
                 ),
             ],
@@ -4145,47 +4538,62 @@ class SentinelApp:
         page = self.page
         db = self.db
         current_uid = db.current_user_id
+        # Admin flag of the logged-in user; it cannot change while this tab exists (no self-demotion).
+        current_user = db.get_user(current_uid)
+        is_self_admin = bool(current_user and current_user.is_admin)
         users_list_ref: ft.Ref[ft.Column] = ft.Ref()
 
+        # user id -> ((username, is_admin), row); rows are reused while both are unchanged.
+        user_rows: dict[int, tuple[tuple[str, bool], ft.Row]] = {}
+
+        def _on_edit_user_click(e):
+            open_edit_dialog(e.control.data)
+
+        def _on_delete_user_click(e):
+            open_delete_dialog(e.control.data)
+
         def build_user_rows():
             users = db.list_users()
             rows: list[ft.Control] = []
+            for stale_id in user_rows.keys() - {u.id for u in users}:
+                del user_rows[stale_id]
             for u in users:
+                sig = (u.username, bool(u.is_admin))
+                cached = user_rows.get(u.id)
+                if cached is not None and cached[0] == sig:
+                    rows.append(cached[1])
+                    continue
                 admin_badge = ft.Chip(label="Admin", height=28) if u.is_admin else ft.Container(width=50, height=28)
                 is_self = u.id == current_uid
-                edit_btn = ft.OutlinedButton(
-                    "Edit",
-                    on_click=lambda e, uid=u.id: open_edit_dialog(uid),
-                )
+                edit_btn = ft.OutlinedButton("Edit", data=u.id, on_click=_on_edit_user_click)
                 if is_self:
                     delete_btn = ft.Text("(you)", size=12)
                 else:
-                    delete_btn = ft.OutlinedButton(
-                        "Delete",
-                        on_click=lambda e, uid=u.id: open_delete_dialog(uid),
-                    )
-                rows.append(
-                    ft.Row(
-                        [
-                            ft.Text(u.username, size=14, width=180),
-                            admin_badge,
-                            edit_btn,
-                            delete_btn,
-                        ],
-                        spacing=12,
-                        alignment=ft.MainAxisAlignment.START,
-                    )
+                    delete_btn = ft.OutlinedButton("Delete", data=u.id, on_click=_on_delete_user_click)
+                row = ft.Row(
+                    [
+                        ft.Text(u.username, size=14, width=180),
+                        admin_badge,
+                        edit_btn,
+                        delete_btn,
+                    ],
+                    spacing=12,
+                    alignment=ft.MainAxisAlignment.START,
+                    key=f"user:{u.id}",
                 )
+                user_rows[u.id] = (sig, row)
+                rows.append(row)
             return rows
 
-        def refresh_list():
+        def refresh_list(update: bool = True):
             if users_list_ref.current:
                 users_list_ref.current.controls = build_user_rows()
-                page.update()
+                if update:
+                    page.update()
 
         add_dialog_ref: list = []  # hold dialog so on_add_confirm can close it
 
-        def on_add_confirm(_):
+        async def on_add_confirm(_):
             if not add_dialog_ref:
                 return
             add_dialog = add_dialog_ref[0]
@@ -4199,16 +4607,20 @@ class SentinelApp:
                 return
             if len(password) < 4:
                 return
+            add_user_btn.disabled = True
+            page.update()
             try:
-                pw_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+                pw_hash = await asyncio.to_thread(_hash_password, password)
                 db.create_user(username, pw_hash, is_admin=admin_cb.value)
                 username_tf.value = ""
                 password_tf.value = ""
                 admin_cb.value = False
-                close_dialog(add_dialog)
-                refresh_list()
+                add_dialog.open = False
+                refresh_list(update=False)
             except Exception as ex:
                 username_tf.error_text = str(ex)
+            finally:
+                add_user_btn.disabled = False
                 page.update()
 
         add_user_btn = ft.ElevatedButton("Add")
@@ -4235,7 +4647,7 @@ class SentinelApp:
         edit_dialog_user_id: list[int] = []
         edit_dialog_ref: list = []
 
-        def on_edit_confirm(_):
+        async def on_edit_confirm(_):
             if not edit_dialog_ref:
                 return
             edit_dialog = edit_dialog_ref[0]
@@ -4253,7 +4665,7 @@ class SentinelApp:
             default_rate: float | None = None
             if rate_str:
                 try:
-                    default_rate = float(rate_str)
+                    default_rate = parse_amount(rate_str)
                     if default_rate < 0:
                         username_tf.error_text = "Default hourly rate must be ≥ 0."
                         page.update()
@@ -4262,22 +4674,23 @@ class SentinelApp:
                     username_tf.error_text = "Default hourly rate must be a number."
                     page.update()
                     return
-            cur = db.get_user(current_uid)
-            can_set_admin = cur and cur.is_admin and uid != current_uid
+            can_set_admin = is_self_admin and uid != current_uid
+            edit_save_btn.disabled = True
+            page.update()
             try:
                 kwargs: dict = {"username": username}
                 if new_password:
-                    kwargs["password_hash"] = bcrypt.hashpw(
-                        new_password.encode("utf-8"), bcrypt.gensalt()
-                    ).decode("utf-8")
+                    kwargs["password_hash"] = await asyncio.to_thread(_hash_password, new_password)
                 if can_set_admin:
                     kwargs["is_admin"] = admin_cb.value
                 kwargs["default_hourly_rate_euro"] = default_rate
                 db.update_user(uid, **kwargs)
-                close_dialog(edit_dialog)
-                refresh_list()
+                edit_dialog.open = False
+                refresh_list(update=False)
             except Exception as ex:
                 username_tf.error_text = str(ex)
+            finally:
+                edit_save_btn.disabled = False
                 page.update()
 
         edit_save_btn = ft.ElevatedButton("Save")
@@ -4312,7 +4725,7 @@ class SentinelApp:
             content.controls[0].value = user.username
             content.controls[1].value = ""
             content.controls[2].value = user.is_admin
-            content.controls[2].visible = current_uid != uid and (db.get_user(current_uid) and db.get_user(current_uid).is_admin)
+            content.controls[2].visible = current_uid != uid and is_self_admin
             rate_val = getattr(user, "default_hourly_rate_euro", None)
             content.controls[3].value = str(rate_val) if rate_val is not None else ""
             content.controls[0].error_text = None
@@ -4330,11 +4743,11 @@ class SentinelApp:
             try:
                 uid = delete_user_id_holder[0]
                 db.delete_user(uid)
-                close_dialog(delete_confirm_dialog)
-                refresh_list()
+                delete_confirm_dialog.open = False
+                refresh_list(update=False)
             except Exception as ex:
                 delete_confirm_text_ref.current.value = str(ex)
-                page.update()
+            page.update()
 
         delete_confirm_btn = ft.ElevatedButton("Delete")
         delete_cancel_btn = ft.OutlinedButton("Cancel")
@@ -4383,25 +4796,22 @@ class SentinelApp:
         page.overlay.append(delete_confirm_dialog)
 
         # Database backup (admin only - this is the Users tab)
-        def _default_backup_dir() -> Path:
-            downloads = Path.home() / "Downloads"
-            if downloads.is_dir():
-                return downloads
-            exports_dir = Path(__file__).resolve().parent / "exports"
-            exports_dir.mkdir(exist_ok=True)
-            return exports_dir
-
         backup_export_dir_ref = ft.Ref[ft.TextField]()
         backup_import_path_ref = ft.Ref[ft.TextField]()
 
-        def _do_backup_export(_):
+        def _write_backup_file(out_path: Path, data: dict) -> None:
+            """Stream the backup dict to out_path through a large write buffer."""
+            with out_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        async def _do_backup_export(_):
             if not db.current_user_is_admin():
                 page.snack_bar = ft.SnackBar(content=ft.Text("Only admin can export the full database."))
                 page.snack_bar.open = True
                 page.update()
                 return
             try:
-                data = db.export_full_database()
+                data = await asyncio.to_thread(db.export_full_database)
             except ValueError as e:
                 page.snack_bar = ft.SnackBar(content=ft.Text(str(e)))
                 page.snack_bar.open = True
@@ -4410,7 +4820,7 @@ class SentinelApp:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             default_name = f"sentinel_backup_{timestamp}.json"
             dir_str = (backup_export_dir_ref.current.value or "").strip() if backup_export_dir_ref.current else ""
-            export_dir = Path(dir_str).expanduser() if dir_str else _default_backup_dir()
+            export_dir = Path(dir_str).expanduser() if dir_str else _default_export_dir()
             try:
                 export_dir.mkdir(parents=True, exist_ok=True)
             except OSError as err:
@@ -4420,7 +4830,7 @@ class SentinelApp:
                 return
             out_path = export_dir / default_name
             try:
-                out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                await asyncio.to_thread(_write_backup_file, out_path, data)
             except OSError as err:
                 page.snack_bar = ft.SnackBar(content=ft.Text(f"Cannot save file: {err}"))
                 page.snack_bar.open = True
@@ -4432,7 +4842,12 @@ class SentinelApp:
 
         import_confirm_dialog_ref: list = []
 
-        def _do_import_confirm(_):
+        def _read_backup_file(path: Path) -> dict:
+            """Parse the backup straight from the file handle (no intermediate str)."""
+            with path.open("rb") as f:
+                return json.load(f)
+
+        async def _do_import_confirm(_):
             if not import_confirm_dialog_ref:
                 return
             path_str = (backup_import_path_ref.current.value or "").strip() if backup_import_path_ref.current else ""
@@ -4448,15 +4863,14 @@ class SentinelApp:
                 page.update()
                 return
             try:
-                raw = path.read_text(encoding="utf-8")
-                data = json.loads(raw)
-            except (OSError, json.JSONDecodeError) as e:
+                data = await asyncio.to_thread(_read_backup_file, path)
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
                 page.snack_bar = ft.SnackBar(content=ft.Text(f"Invalid backup file: {e}"))
                 page.snack_bar.open = True
                 page.update()
                 return
             try:
-                db.import_full_database(data)
+                await asyncio.to_thread(db.import_full_database, data)
             except ValueError as e:
                 page.snack_bar = ft.SnackBar(content=ft.Text(str(e)))
                 page.snack_bar.open = True
@@ -4467,7 +4881,7 @@ class SentinelApp:
                 page.snack_bar.open = True
                 page.update()
                 return
-            close_dialog(import_confirm_dialog_ref[0])
+            import_confirm_dialog_ref[0].open = False
             page.snack_bar = ft.SnackBar(content=ft.Text("Database restored. Please log in again."))
             page.snack_bar.open = True
             page.update()
@@ -4475,7 +4889,7 @@ class SentinelApp:
             async def _clear_and_logout():
                 await page.shared_preferences.set(STORAGE_USER_ID, "")
                 await page.shared_preferences.set(STORAGE_USERNAME, "")
-                cb = (page.data or {}).get("logout_callback")
+                cb = self._logout
                 if cb:
                     cb()
 
@@ -4509,11 +4923,12 @@ class SentinelApp:
         import_confirm_dialog_ref.append(import_confirm_dialog)
         page.overlay.append(import_confirm_dialog)
 
-        list_col = ft.Column(ref=users_list_ref, controls=build_user_rows(), scroll=ft.ScrollMode.AUTO)
+        # No scroll of its own: the tab's outer Column is the single scrolling viewport.
+        list_col = ft.Column(ref=users_list_ref, controls=build_user_rows())
 
         backup_export_dir_field = ft.TextField(
             label="Save to folder",
-            value=str(_default_backup_dir()),
+            value=str(_default_export_dir()),
             width=500,
             ref=backup_export_dir_ref,
             hint_text="Folder for backup file",
@@ -4574,7 +4989,7 @@ def _build_create_first_admin_view(
     error_text = ft.Text("", color=ft.Colors.RED, visible=False)
     loading = ft.ProgressRing(visible=False)
 
-    def _do_create(_):
+    async def _do_create(_):
         username = (username_field.value or "").strip()
         password = (password_field.value or "").strip()
         if not username or not password:
@@ -4593,9 +5008,7 @@ def _build_create_first_admin_view(
         loading.visible = True
         page.update()
         try:
-            pw_hash = bcrypt.hashpw(
-                password.encode("utf-8"), bcrypt.gensalt()
-            ).decode("utf-8")
+            pw_hash = await asyncio.to_thread(_hash_password, password)
             user_id = login_db.create_first_admin(username, pw_hash)
         except Exception as e:
             error_text.value = str(e) or "Failed to create admin."
@@ -4666,7 +5079,7 @@ def _build_login_view(
     error_text = ft.Text("", color=ft.Colors.RED, visible=False)
     loading = ft.ProgressRing(visible=False)
 
-    def _do_login(_):
+    async def _do_login(_):
         username = (username_field.value or "").strip()
         password = (password_field.value or "").strip()
         if not username or not password:
@@ -4680,15 +5093,19 @@ def _build_login_view(
         page.update()
         try:
             creds = login_db.get_login_credentials(username)
-            if creds and bcrypt.checkpw(
-                password.encode("utf-8"),
-                creds[1].encode("utf-8") if isinstance(creds[1], str) else creds[1],
-            ):
+            if creds and await asyncio.to_thread(_check_password, password, creds[1]):
                 user_id = creds[0]
             else:
                 user_id = None
         except Exception:
             user_id = None
+        if user_id is not None and _bcrypt_cost(str(creds[1])) < BCRYPT_COST:
+            # Rehash on login so raising BCRYPT_COST upgrades existing users without a migration.
+            try:
+                new_hash = await asyncio.to_thread(_hash_password, password)
+                login_db.upgrade_login_password_hash(user_id, new_hash)
+            except Exception:
+                logger.warning("Password rehash failed for user %s", user_id, exc_info=True)
         if user_id is None:
             error_text.value = "Invalid username or password."
             error_text.visible = True
@@ -4779,6 +5196,8 @@ async def main(page: ft.Page) -> None:
 
     def show_login() -> None:
         page.controls.clear()
+        # Drop the previous session's dialogs and pickers so re-logins do not pile them up in the overlay.
+        page.overlay.clear()
         if page.data is not None:
             page.data.pop("app", None)
         # If no users exist, show "Create first admin" instead of login
@@ -1,5 +1,5 @@
-from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, DateTime, Float, UniqueConstraint
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, DateTime, Float, Index, UniqueConstraint, bindparam, text
+from sqlalchemy.orm import backref, relationship, declarative_base
 from datetime import datetime
 
 Base = declarative_base()
@@ -34,7 +34,13 @@ class Matter(Base):
     amounts.
     """
     __tablename__ = "matters"
-    __table_args__ = (UniqueConstraint("owner_id", "matter_code", name="uq_matter_owner_code"),)
+    # Same-path conflict checks look up an owner's matters by leaf name;
+    # the Postgres path CTE walks an owner's tree by parent_id.
+    __table_args__ = (
+        UniqueConstraint("owner_id", "matter_code", name="uq_matter_owner_code"),
+        Index("ix_matters_owner_name", "owner_id", "name"),
+        Index("ix_matters_owner_parent", "owner_id", "parent_id"),
+    )
     id = Column(Integer, primary_key=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     matter_code = Column(String, nullable=False)
@@ -45,7 +51,7 @@ class Matter(Base):
     budget_threshold = Column(Float, nullable=True)
 
     owner = relationship("User", back_populates="matters")
-    sub_matters = relationship("Matter", backref="parent", remote_side=[id])
+    sub_matters = relationship("Matter", backref=backref("parent", lazy="raise_on_sql"), remote_side=[id], lazy="raise_on_sql")
     time_entries = relationship("TimeEntry", back_populates="matter")
     shares = relationship("MatterShare", back_populates="matter", cascade="all, delete-orphan")
     user_rates = relationship("UserMatterRate", back_populates="matter", cascade="all, delete-orphan")
@@ -60,8 +66,43 @@ class Matter(Base):
         """
         if self.parent_id is None:
             return self.name
-        parent = session.query(Matter).get(self.parent_id)
-        return f"{parent.get_full_path(session)} > {self.name}" if parent else self.name
+        return Matter.full_paths_for(session, [self.id]).get(self.id, self.name)
+
+    @classmethod
+    def full_paths_for(cls, session, matter_ids) -> dict[int, str]:
+        """Return ``{matter_id: full path}`` for the given ids in one recursive CTE query.
+
+        Walks each id up its parent chain; if an ancestor is not visible the path
+        starts at the highest ancestor that is (same as the old per-level walk).
+        """
+        ids = list(matter_ids)
+        if not ids:
+            return {}
+        rows = session.execute(
+            _FULL_PATHS_FOR_SQL.bindparams(bindparam("ids", expanding=True)),
+            {"ids": ids},
+        ).fetchall()
+        paths: dict[int, str] = {}
+        depths: dict[int, int] = {}
+        for start_id, depth, path in rows:
+            if depth >= depths.get(start_id, -1):
+                depths[start_id] = depth
+                paths[start_id] = path
+        return paths
+
+
+# Ancestor walk for Matter.full_paths_for (SQLite and PostgreSQL).
+_FULL_PATHS_FOR_SQL = text(
+    """
+    WITH RECURSIVE anc(start_id, parent_id, depth, path) AS (
+        SELECT id, parent_id, 0, name FROM matters WHERE id IN :ids
+        UNION ALL
+        SELECT a.start_id, m.parent_id, a.depth + 1, m.name || ' > ' || a.path
+        FROM matters m JOIN anc a ON m.id = a.parent_id
+    )
+    SELECT start_id, depth, path FROM anc
+    """
+)
 
 
 class MatterShare(Base):
@@ -106,6 +147,12 @@ class TimeEntry(Base):
     treat them as one task.
     """
     __tablename__ = "time_entries"
+    # Day views filter by owner and a start_time range; budgets, timesheets and
+    # reporting filter by matter (and invoiced).
+    __table_args__ = (
+        Index("ix_time_entries_owner_start", "owner_id", "start_time"),
+        Index("ix_time_entries_matter_invoiced", "matter_id", "invoiced"),
+    )
     id = Column(Integer, primary_key=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     matter_id = Column(Integer, ForeignKey("matters.id"), nullable=False)
@@ -7,6 +7,7 @@ Optimized with session-scoped caching for faster test execution.
 """
 import json
 import shutil
+import sqlite3
 from pathlib import Path
 
 import bcrypt
@@ -26,14 +27,25 @@ def db_template_path(tmp_path_factory: pytest.TempPathFactory):
     if not path.exists():
         dm = DatabaseManager(db_path=str(path))
         dm.init_db()
-        pw_hash = bcrypt.hashpw(b"admin", bcrypt.gensalt()).decode("utf-8")
+        # Minimum bcrypt cost: fixture hashes are never checked, only stored.
+        pw_hash = bcrypt.hashpw(b"admin", bcrypt.gensalt(rounds=4)).decode("utf-8")
         user1_id = dm.create_first_admin("admin", pw_hash)
         assert user1_id is not None
         
         # Create second user on the template
         db_admin = DatabaseManager(db_path=str(path), current_user_id=user1_id)
-        pw2 = bcrypt.hashpw(b"user2", bcrypt.gensalt()).decode("utf-8")
+        pw2 = bcrypt.hashpw(b"user2", bcrypt.gensalt(rounds=4)).decode("utf-8")
         user2 = db_admin.create_user("user2", pw2, is_admin=False)
+        dm._engine.dispose()
+        db_admin._engine.dispose()
+        # DatabaseManager opens SQLite in WAL mode; fold the WAL back into base.db so the
+        # per-test shutil.copy below gets the schema and users (copies re-enter WAL on connect).
+        conn = sqlite3.connect(str(path))
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            conn.close()
         
         # Store both user IDs in a sidecar file for retrieval
         with open(template_dir / "user_ids.json", "w") as f:
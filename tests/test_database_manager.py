@@ -92,6 +92,19 @@ class TestGetFullPath:
         assert path_by_id[project.id] == "Client > Project"
         assert path_by_id[sub.id] == "Client > Project > Sub"
 
+    def test_full_paths_for_matches_get_full_path(self, db_user1: DatabaseManager):
+        """Matter.full_paths_for resolves several ids in one query, same as get_full_path."""
+        from models import Matter
+
+        client = db_user1.add_matter("Client", "client", parent_id=None)
+        project = db_user1.add_matter("Project", "project", parent_id=client.id)
+        sub = db_user1.add_matter("Sub", "sub", parent_id=project.id)
+        with db_user1._session() as session:
+            paths = Matter.full_paths_for(session, [client.id, sub.id])
+            sub_path = session.get(Matter, sub.id).get_full_path(session)
+        assert paths == {client.id: "Client", sub.id: "Client > Project > Sub"}
+        assert sub_path == "Client > Project > Sub"
+
     def test_for_timer_excludes_roots(self, db_user1: DatabaseManager):
         """get_matters_with_full_paths(for_timer=True) excludes root matters."""
         client = db_user1.add_matter("Client", "client", parent_id=None)
@@ -102,6 +115,31 @@ class TestGetFullPath:
         assert len(timer_paths) == 1
         assert timer_paths[0][1] == "Client > Project"
 
+    def test_cached_paths_follow_rename_move_and_share(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
+        """get_matters_with_full_paths reflects renames, moves and shares made through the manager."""
+        client = db_user1.add_matter("Client", "client", parent_id=None)
+        other = db_user1.add_matter("Other", "other", parent_id=None)
+        project = db_user1.add_matter("Project", "project", parent_id=client.id)
+        assert dict(db_user1.get_matters_with_full_paths())[project.id] == "Client > Project"
+        db_user1.update_matter(project.id, name="Renamed")
+        assert dict(db_user1.get_matters_with_full_paths())[project.id] == "Client > Renamed"
+        db_user1.move_matter(project.id, other.id)
+        assert dict(db_user1.get_matters_with_full_paths(for_timer=True)) == {project.id: "Other > Renamed"}
+        db_user2.get_matters_with_full_paths()  # warm user2's cache before the share
+        db_user1.add_matter_share(other.id, db_user2.current_user_id)
+        db_user2.invalidate_caches()  # what the UI does on refresh
+        assert other.id in dict(db_user2.get_matters_with_full_paths())
+
+    def test_detailed_paths_include_code_owner_and_rate(self, db_user1: DatabaseManager):
+        """get_matters_with_full_paths_detailed returns path, code, owner and rate in one call."""
+        client = db_user1.add_matter("Client", "client", parent_id=None)
+        project = db_user1.add_matter("Project", "project", parent_id=client.id)
+        db_user1.update_matter(project.id, hourly_rate_euro=120.0)
+        rows = {r[0]: r for r in db_user1.get_matters_with_full_paths_detailed()}
+        uid = db_user1.current_user_id
+        assert rows[client.id] == (client.id, "Client", "client", uid, None)
+        assert rows[project.id] == (project.id, "Client > Project", "project", uid, 120.0)
+
 
 # --- suggest_unique_code (per-owner) ---
 
@@ -122,6 +160,19 @@ class TestSuggestUniqueCode:
         db_user1.add_matter("Acme 2", "acme-2", parent_id=None)
         assert db_user1.suggest_unique_code("acme") == "acme-3"
 
+    def test_suffix_follows_highest_numeric_code(self, db_user1: DatabaseManager):
+        """Next suffix is one past the highest numeric suffix; non-numeric look-alikes are ignored."""
+        db_user1.add_matter("Acme", "acme", parent_id=None)
+        db_user1.add_matter("Acme 7", "acme-7", parent_id=None)
+        db_user1.add_matter("Acme Labs", "acme-labs", parent_id=None)
+        assert db_user1.suggest_unique_code("acme") == "acme-8"
+
+    def test_shared_matter_code_does_not_force_suffix(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
+        """A matter shared by another owner does not count against the caller's codes."""
+        m = db_user1.add_matter("Acme", "acme", parent_id=None)
+        db_user1.add_matter_share(m.id, db_user2.current_user_id)
+        assert db_user2.suggest_unique_code("Acme") == "acme"
+
     def test_different_owners_can_have_same_matter_code(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
         """User1 and User2 can both have a matter with code 'acme' (unique per owner)."""
         db_user1.add_matter("Acme", "acme", parent_id=None)
@@ -155,6 +206,12 @@ class TestOwnerFiltering:
         assert codes1 == {"client-a", "client-b"}
         assert codes2 == {"solo"}
 
+    def test_get_matter_respects_owner(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
+        """get_matter returns the owner's matter and None for another user's."""
+        m = db_user1.add_matter("Client A", "client-a", parent_id=None)
+        assert db_user1.get_matter(m.id).matter_code == "client-a"
+        assert db_user2.get_matter(m.id) is None
+
     def test_get_matters_with_full_paths_respects_owner(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
         """Full paths list is owner-scoped."""
         db_user1.add_matter("A", "a", parent_id=None)
@@ -172,6 +229,18 @@ class TestOwnerFiltering:
         with pytest.raises(ValueError, match="Matter not found"):
             db_user2.start_timer(project.id)
 
+    def test_start_timer_returns_complete_entry(self, db_user1: DatabaseManager):
+        """start_timer returns the entry with id and defaults set; clients are rejected."""
+        client = db_user1.add_matter("Client", "client", parent_id=None)
+        project = db_user1.add_matter("Project", "project", parent_id=client.id)
+        with pytest.raises(ValueError, match="client"):
+            db_user1.start_timer(client.id)
+        entry = db_user1.start_timer(project.id, "Work")
+        assert entry.id is not None
+        assert entry.start_time is not None and entry.end_time is None
+        assert entry.invoiced is False and entry.duration_seconds == 0.0
+        assert db_user1.get_time_entry(entry.id).start_time == entry.start_time
+
     def test_time_entries_are_owner_scoped(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
         """Each user only sees their own time entries."""
         client = db_user1.add_matter("C", "c", parent_id=None)
@@ -226,6 +295,18 @@ class TestOwnerFiltering:
         assert descendants_of_client == {project.id, sub.id}
         assert descendants_of_project == {sub.id}
 
+    def test_children_map_walk_matches_descendant_ids(self, db_user1: DatabaseManager):
+        """get_matter_children_map lists children per parent; walking it gives the same descendants."""
+        client = db_user1.add_matter("C", "c", parent_id=None)
+        project = db_user1.add_matter("P", "p", parent_id=client.id)
+        sub = db_user1.add_matter("S", "s", parent_id=project.id)
+        other = db_user1.add_matter("O", "o", parent_id=client.id)
+        children = db_user1.get_matter_children_map()
+        assert sorted(children[client.id]) == sorted([project.id, other.id])
+        assert children[project.id] == [sub.id]
+        walked = DatabaseManager.descendant_ids_from_children(children, client.id)
+        assert walked == db_user1.get_descendant_matter_ids(client.id) == {project.id, sub.id, other.id}
+
     def test_admin_sees_all_matters_with_include_all_users(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
         """Admin (user1) with include_all_users=True sees both users' matters; default remains owner-scoped."""
         db_user1.add_matter("Admin Client", "admin-c", parent_id=None)
@@ -325,6 +406,34 @@ class TestReportingAggregation:
             assert total_after == total_before
             assert not_inv_after < total_after
 
+    def test_cached_detailed_rows_follow_new_entries_and_rates(self, db_user1: DatabaseManager):
+        """The cached summary is recomputed after entries or rates change through the manager."""
+        client = db_user1.add_matter("Client", "client", parent_id=None)
+        project = db_user1.add_matter("Project", "project", parent_id=client.id)
+        start = datetime(2026, 1, 5, 9, 0)
+        db_user1.add_manual_time_entry(project.id, "A", start_time=start, end_time=start + timedelta(hours=1), duration_seconds=3600)
+        assert db_user1.get_time_by_client_and_matter_detailed()[0][2] == 3600
+        db_user1.add_manual_time_entry(project.id, "B", start_time=start, end_time=start + timedelta(hours=1), duration_seconds=3600)
+        db_user1.update_matter(project.id, hourly_rate_euro=100.0)
+        row = db_user1.get_time_by_client_and_matter_detailed()[0]
+        assert row[2] == 7200
+        assert row[4] == pytest.approx(200.0)
+        assert row[6] == "matter"
+
+    def test_invalidate_caches_shows_time_logged_by_another_user(
+        self, db_user1: DatabaseManager, db_user2: DatabaseManager
+    ):
+        """Time another manager logs on a shared matter appears once the UI invalidates the cache."""
+        client = db_user1.add_matter("Client", "client", parent_id=None)
+        project = db_user1.add_matter("Project", "project", parent_id=client.id)
+        db_user1.add_matter_share(project.id, db_user2.current_user_id)
+        start = datetime(2026, 1, 5, 9, 0)
+        db_user1.add_manual_time_entry(project.id, "A", start_time=start, end_time=start + timedelta(hours=1), duration_seconds=3600)
+        assert db_user1.get_time_by_client_and_matter_detailed()[0][2] == 3600
+        db_user2.add_manual_time_entry(project.id, "B", start_time=start, end_time=start + timedelta(hours=1), duration_seconds=3600)
+        db_user1.invalidate_caches()
+        assert db_user1.get_time_by_client_and_matter_detailed()[0][2] == 7200
+
     def test_get_time_by_client_and_matter_matches_detailed_totals(self, db_user1: DatabaseManager):
         """Original get_time_by_client_and_matter total equals detailed total."""
         client = db_user1.add_matter("C", "c", parent_id=None)
@@ -384,6 +493,23 @@ class TestHourlyRates:
         assert rate == 0.0
         assert source == "user"
 
+    def test_resolved_rates_batch_matches_single_lookup(self, db_user1: DatabaseManager):
+        """get_resolved_hourly_rates_batch returns the same (rate, source) as get_resolved_hourly_rate per key."""
+        db_user1.update_user(db_user1.current_user_id, default_hourly_rate_euro=10.0)
+        client = db_user1.add_matter("C", "c", parent_id=None)
+        db_user1.update_matter(client.id, hourly_rate_euro=25.0)
+        project = db_user1.add_matter("P", "p", parent_id=client.id)
+        other = db_user1.add_matter("O", "o", parent_id=client.id)
+        db_user1.update_matter(other.id, hourly_rate_euro=40.0)
+        start = datetime(2025, 3, 1, 9, 0)
+        for mid in (project.id, project.id, other.id):
+            db_user1.add_manual_time_entry(mid, "", start_time=start, duration_seconds=1800)
+        entries = db_user1.get_time_entries_by_matter(project.id) + db_user1.get_time_entries_by_matter(other.id)
+        batch = db_user1.get_resolved_hourly_rates_batch(entries)
+        assert set(batch) == {(project.id, db_user1.current_user_id), (other.id, db_user1.current_user_id)}
+        for e in entries:
+            assert batch[(e.matter_id, e.owner_id)] == db_user1.get_resolved_hourly_rate(e.matter_id, e.owner_id)
+
     def test_amount_eur_from_seconds(self):
         """amount_eur_from_seconds computes (duration_sec / 3600) * rate, rounded to 2 decimals."""
         assert DatabaseManager.amount_eur_from_seconds(3600, 100.0) == 100.0
@@ -426,6 +552,51 @@ class TestHourlyRates:
         assert getattr(s, "hourly_rate_euro", None) is None
 
 
+# --- get_time_entries_for_day ---
+
+
+@pytest.mark.integration
+class TestTimeEntriesForDay:
+    """get_time_entries_for_day uses a half-open day range backed by an index."""
+
+    def test_day_range_excludes_next_midnight(self, db_user1: DatabaseManager):
+        """Entries starting at 23:59 are included; entries at next day's 00:00 are not."""
+        client = db_user1.add_matter("C", "c", parent_id=None)
+        project = db_user1.add_matter("P", "p", parent_id=client.id)
+        day = date(2025, 3, 10)
+        late = db_user1.add_manual_time_entry(
+            project.id, "late", start_time=datetime(2025, 3, 10, 23, 59), duration_seconds=60
+        )
+        db_user1.add_manual_time_entry(
+            project.id, "next", start_time=datetime(2025, 3, 11, 0, 0), duration_seconds=60
+        )
+        assert [e.id for e in db_user1.get_time_entries_for_day(day)] == [late.id]
+
+    def test_owner_start_index_exists(self, db_user1: DatabaseManager):
+        """init_db creates the time_entries and matters lookup indexes."""
+        from sqlalchemy import inspect
+
+        names = [ix["name"] for ix in inspect(db_user1._engine).get_indexes("time_entries")]
+        assert "ix_time_entries_owner_start" in names
+        assert "ix_time_entries_matter_invoiced" in names
+        matter_names = [ix["name"] for ix in inspect(db_user1._engine).get_indexes("matters")]
+        assert "ix_matters_owner_parent" in matter_names
+
+    def test_entries_by_matter_pages_newest_first(self, db_user1: DatabaseManager):
+        """get_time_entries_by_matter with limit/offset returns consecutive newest-first pages."""
+        client = db_user1.add_matter("C", "c", parent_id=None)
+        project = db_user1.add_matter("P", "p", parent_id=client.id)
+        for h in range(5):
+            db_user1.add_manual_time_entry(
+                project.id, f"e{h}", start_time=datetime(2025, 3, 10, 9 + h, 0), duration_seconds=60
+            )
+        first = db_user1.get_time_entries_by_matter(project.id, limit=2)
+        rest = db_user1.get_time_entries_by_matter(project.id, limit=10, offset=2)
+        assert [e.description for e in first] == ["e4", "e3"]
+        assert [e.description for e in rest] == ["e2", "e1", "e0"]
+        assert len(db_user1.get_time_entries_by_matter(project.id)) == 5
+
+
 # --- continue task (activity_group_id) ---
 
 
@@ -703,7 +874,7 @@ class TestRequireUser:
         dm.init_db()
         # Create at least one user so we can have a db with no user
         import bcrypt
-        pw = bcrypt.hashpw(b"x", bcrypt.gensalt()).decode("utf-8")
+        pw = bcrypt.hashpw(b"x", bcrypt.gensalt(rounds=4)).decode("utf-8")
         dm.create_first_admin("u", pw)
         dm_no_user = DatabaseManager(db_path=db_path, current_user_id=None)
         with pytest.raises(ValueError, match="Current user is not set"):
@@ -717,6 +888,20 @@ class TestRequireUser:
             dm.get_all_matters()
 
 
+@pytest.mark.integration
+class TestLoginCredentials:
+    """get_login_credentials and upgrade_login_password_hash work without current_user_id."""
+
+    def test_upgrade_login_password_hash_replaces_hash(self, db_user1: DatabaseManager):
+        """The new hash is returned by the next get_login_credentials lookup."""
+        login_db = DatabaseManager(db_path=db_user1._engine.url.database)
+        user_id, _ = login_db.get_login_credentials("user2")
+        login_db.upgrade_login_password_hash(user_id, "new-hash")
+        assert login_db.get_login_credentials("user2") == (user_id, "new-hash")
+        with pytest.raises(ValueError, match="User not found"):
+            login_db.upgrade_login_password_hash(999999, "x")
+
+
 # --- Matter sharing and per-user rates ---
 
 
@@ -789,6 +974,15 @@ class TestUserMatterRate:
         assert rate == 40.0
         assert source == "matter"
 
+    def test_get_user_matter_rate(self, db_user1: DatabaseManager):
+        """get_user_matter_rate returns the user's own rate for the matter, or None when unset."""
+        client = db_user1.add_matter("C", "c", parent_id=None)
+        project = db_user1.add_matter("P", "p", parent_id=client.id)
+        uid = db_user1.current_user_id
+        assert db_user1.get_user_matter_rate(uid, project.id) is None
+        db_user1.set_user_matter_rate(uid, project.id, 60.0)
+        assert db_user1.get_user_matter_rate(uid, project.id) == 60.0
+
 
 @pytest.mark.integration
 class TestSameNameConflict:
@@ -809,3 +1003,42 @@ class TestSameNameConflict:
         db_user2.add_matter("Other", "other", parent_id=None)
         result = db_user1.find_owned_matter_with_same_path(db_user2.current_user_id, "Client > Project")
         assert result is None
+
+    def test_find_owned_matter_with_same_path_checks_ancestors_and_separator_names(
+        self, db_user1: DatabaseManager, db_user2: DatabaseManager
+    ):
+        """A matching leaf under another client does not match; names containing ' > ' still do."""
+        other = db_user2.add_matter("Other", "other", parent_id=None)
+        db_user2.add_matter("Project", "project", parent_id=other.id)
+        assert db_user1.find_owned_matter_with_same_path(db_user2.current_user_id, "Client > Project") is None
+        odd = db_user2.add_matter("A > B", "odd", parent_id=None)
+        result = db_user1.find_owned_matter_with_same_path(db_user2.current_user_id, "A > B")
+        assert result == (odd.id, "A > B")
+
+    def test_try_share_matter_reports_conflict_without_sharing(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
+        """try_share_matter returns (their_matter_id, username) on a same-path conflict and only shares otherwise."""
+        client1 = db_user1.add_matter("Client", "client", parent_id=None)
+        project1 = db_user1.add_matter("Project", "project", parent_id=client1.id)
+        client2 = db_user2.add_matter("Client", "client", parent_id=None)
+        project2 = db_user2.add_matter("Project", "project", parent_id=client2.id)
+        other_id = db_user2.current_user_id
+        conflict = db_user1.try_share_matter(project1.id, other_id)
+        assert conflict == (project2.id, db_user2.get_user(other_id).username)
+        assert db_user1.list_matter_shares(project1.id) == []
+        solo = db_user1.add_matter("Solo", "solo", parent_id=None)
+        assert db_user1.try_share_matter(solo.id, other_id) is None
+        assert [u.id for u in db_user1.list_matter_shares(solo.id)] == [other_id]
+
+    def test_merge_and_share_matter_is_atomic(self, db_user1: DatabaseManager, db_user2: DatabaseManager):
+        """merge_and_share_matter merges and shares together; a failed merge shares nothing."""
+        client1 = db_user1.add_matter("Client", "client", parent_id=None)
+        project1 = db_user1.add_matter("Project", "project", parent_id=client1.id)
+        client2 = db_user2.add_matter("Client", "client", parent_id=None)
+        project2 = db_user2.add_matter("Project", "project", parent_id=client2.id)
+        other_id = db_user2.current_user_id
+        with pytest.raises(ValueError):
+            db_user1.merge_and_share_matter(project1.id, project1.id, other_id)
+        assert db_user1.list_matter_shares(project1.id) == []
+        db_user1.merge_and_share_matter(project2.id, project1.id, other_id)
+        assert [u.id for u in db_user1.list_matter_shares(project1.id)] == [other_id]
+        assert db_user2.get_matter(project2.id) is None
@@ -0,0 +1,37 @@
+"""
+Tests for parsing user-entered euro amounts and hourly rates.
+"""
+import pytest
+
+from utils import parse_amount
+
+
+class TestParseAmount:
+    """parse_amount accepts plain decimals (point or comma) and rejects everything float() would also take."""
+
+    def test_integer_and_decimal_point(self):
+        assert parse_amount("120") == 120.0
+        assert parse_amount("12.5") == 12.5
+        assert parse_amount(".5") == 0.5
+
+    def test_decimal_comma(self):
+        assert parse_amount("12,50") == 12.5
+
+    def test_negative_is_parsed_for_range_check_by_caller(self):
+        assert parse_amount("-3") == -3.0
+
+    @pytest.mark.parametrize("text", ["", "inf", "nan", "1e3", "12.5.1", "12 50", "abc"])
+    def test_rejects_non_plain_numbers(self, text):
+        with pytest.raises(ValueError):
+            parse_amount(text)
+
+    def test_rejects_overflow_to_infinity(self):
+        with pytest.raises(ValueError):
+            parse_amount("9" * 400)
+
+    def test_budget_and_threshold_values(self):
+        """Budget (euro) and threshold (percent) fields use the same parser."""
+        assert parse_amount("1500,00") == 1500.0
+        assert parse_amount("80") == 80.0
+        with pytest.raises(ValueError):
+            parse_amount("1e999")
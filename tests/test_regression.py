@@ -27,7 +27,7 @@ class TestUserAndMatterCreation:
         import shutil
         dm = DatabaseManager(db_path=str(db_path))
         dm.init_db()
-        pw_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt()).decode("utf-8")
+        pw_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode("utf-8")
         user_id = dm.create_first_admin("alice", pw_hash)
         assert user_id is not None
         db_alice = DatabaseManager(db_path=str(db_path), current_user_id=user_id)
@@ -1,8 +1,13 @@
 """
 Utility functions for Sentinel Solo.
 """
+import math
+import re
 from datetime import date, datetime
 
+# Plain decimal amounts ("12", "12.5", "12,50", ".5"); unlike float() this rejects "inf", "nan", "1e3".
+_AMOUNT_RE = re.compile(r"-?(?:\d+(?:[.,]\d*)?|[.,]\d+)")
+
 
 def picker_value_to_local_date(val: date | datetime | None) -> date | None:
     """
@@ -19,3 +24,16 @@ def picker_value_to_local_date(val: date | datetime | None) -> date | None:
             return val.astimezone().date()
         return val.date()
     return None
+
+
+def parse_amount(text: str) -> float:
+    """
+    Parse a user-entered euro amount or hourly rate (decimal point or comma).
+    Raises ValueError for anything else, including "inf", "nan" and exponents.
+    """
+    if not _AMOUNT_RE.fullmatch(text):
+        raise ValueError(f"Not a plain number: {text!r}")
+    value = float(text.replace(",", "."))
+    if not math.isfinite(value):  # e.g. a 400-digit string overflows to inf
+        raise ValueError(f"Number out of range: {text!r}")
+    return value